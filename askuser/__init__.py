@@ -1,71 +1,240 @@
 """
 AskUser - Smart input prompt and validation helpers for Python CLI apps.
+
+Public names are resolved lazily (PEP 562): `import askuser` only loads this
+file, and the submodule behind a name (and its prompt_toolkit / tabulate /
+colorfulPyPrint imports) is imported the first time that name is accessed.
 """
 
-# core.py (main public API)
-from .core import (
-    validate_input,
-    pretty_menu,
-    validate_user_option,
-    validate_user_option_value,
-    validate_user_option_enumerated,
-    validate_user_option_multi,
-    validate_user_option_value_multi,
-    choose_from_db,
-    choose_dict_from_list_of_dicts,
-    yes,
-)
+from importlib import import_module
 
-# logic.py (backwards compatibility exports)
-from .logic import (
-    is_valid_custom,
-    is_not_in,
-    is_yes_no,
-    none_if_blank,
-    optional,
-    is_not_blank,
-    is_valid_int,
-    is_valid_float,
-    is_valid_decimal,
-    is_valid_alpha,
-    is_valid_alphanum,
-    is_valid_regex,
-    is_valid_char,
-    get_language_ISO_639_1,
-    is_valid_language,
-    is_valid_date,
-    is_valid_date_future,
-    is_valid_time,
-    is_url,
-    is_valid_email,
-    is_valid_phone,
-    is_valid_slug,
-)
+# Not `from typing import TYPE_CHECKING`: importing typing alone costs more than the rest of this file.
+TYPE_CHECKING = False
+if TYPE_CHECKING:  # pragma: no cover - static analysers see the eager imports
+    from .core import (
+        validate_input,
+        validate_many,
+        ValidationResult,
+        pretty_menu,
+        validate_user_option,
+        validate_user_option_value,
+        validate_user_option_enumerated,
+        validate_user_option_multi,
+        validate_user_option_value_multi,
+        validate_user_option_ranges,
+        choose_from_db,
+        choose_dict_from_list_of_dicts,
+        yes,
+    )
+    from .answers import AnswerSource, answers_from, load_answers, set_answer_source
+    from .dates import validate_dates
+    from .emails import validate_emails
+    from .exceptions import ValidationError, MaxAttemptsExceeded, AnswerError
+    from .urls import normalize_urls
+    from .membership import ChoiceSet, CasefoldSet, BloomFilter
+    from .metrics import MetricsAggregator, collect_metrics, set_metrics_collector
+    from .menu import Menu, MenuRenderer, set_menu_renderer
+    from .logic import (
+        quiet,
+        is_valid_custom,
+        is_not_in,
+        is_yes_no,
+        none_if_blank,
+        optional,
+        is_not_blank,
+        is_valid_int,
+        is_valid_float,
+        is_valid_decimal,
+        is_valid_alpha,
+        is_valid_alphanum,
+        is_valid_regex,
+        is_valid_char,
+        get_language_ISO_639_1,
+        is_valid_language,
+        is_valid_date,
+        is_valid_date_future,
+        is_valid_time,
+        is_url,
+        is_valid_email,
+        is_valid_phone,
+        is_valid_slug,
+    )
+    from .autocomplete import user_prompt, SubstringCompleter, SourceCompleter, clear_completer_cache
+    from .aio import (
+        validate_input_async,
+        validate_user_option_async,
+        validate_user_option_value_async,
+        validate_user_option_enumerated_async,
+        validate_user_option_multi_async,
+        validate_user_option_value_multi_async,
+        validate_user_option_ranges_async,
+        yes_async,
+        user_prompt_async,
+    )
+    from .custom_validators import (
+        get_validators,
+        register_validator,
+        register_validators,
+        unregister_validator,
+    )
 
-# autocomplete.py
-from .autocomplete import user_prompt, SubstringCompleter
+# public name -> submodule that defines it
+_LAZY_EXPORTS = {
+    # core.py (main public API)
+    "validate_input": "core",
+    "validate_many": "core",
+    "ValidationResult": "core",
+    "pretty_menu": "core",
+    "validate_user_option": "core",
+    "validate_user_option_value": "core",
+    "validate_user_option_enumerated": "core",
+    "validate_user_option_multi": "core",
+    "validate_user_option_value_multi": "core",
+    "validate_user_option_ranges": "core",
+    "choose_from_db": "core",
+    "choose_dict_from_list_of_dicts": "core",
+    "yes": "core",
+    # answers.py
+    "AnswerSource": "answers",
+    "answers_from": "answers",
+    "load_answers": "answers",
+    "set_answer_source": "answers",
+    # dates.py
+    "validate_dates": "dates",
+    # emails.py
+    "validate_emails": "emails",
+    # exceptions.py
+    "ValidationError": "exceptions",
+    "MaxAttemptsExceeded": "exceptions",
+    "AnswerError": "exceptions",
+    # urls.py
+    "normalize_urls": "urls",
+    # membership.py
+    "ChoiceSet": "membership",
+    "CasefoldSet": "membership",
+    "BloomFilter": "membership",
+    # metrics.py
+    "MetricsAggregator": "metrics",
+    "collect_metrics": "metrics",
+    "set_metrics_collector": "metrics",
+    # menu.py
+    "Menu": "menu",
+    "MenuRenderer": "menu",
+    "set_menu_renderer": "menu",
+    # logic.py (backwards compatibility exports)
+    "quiet": "logic",
+    "is_valid_custom": "logic",
+    "is_not_in": "logic",
+    "is_yes_no": "logic",
+    "none_if_blank": "logic",
+    "optional": "logic",
+    "is_not_blank": "logic",
+    "is_valid_int": "logic",
+    "is_valid_float": "logic",
+    "is_valid_decimal": "logic",
+    "is_valid_alpha": "logic",
+    "is_valid_alphanum": "logic",
+    "is_valid_regex": "logic",
+    "is_valid_char": "logic",
+    "get_language_ISO_639_1": "logic",
+    "is_valid_language": "logic",
+    "is_valid_date": "logic",
+    "is_valid_date_future": "logic",
+    "is_valid_time": "logic",
+    "is_url": "logic",
+    "is_valid_email": "logic",
+    "is_valid_phone": "logic",
+    "is_valid_slug": "logic",
+    # autocomplete.py
+    "user_prompt": "autocomplete",
+    "SubstringCompleter": "autocomplete",
+    "SourceCompleter": "autocomplete",
+    "clear_completer_cache": "autocomplete",
+    # aio.py (asyncio variants)
+    "validate_input_async": "aio",
+    "validate_user_option_async": "aio",
+    "validate_user_option_value_async": "aio",
+    "validate_user_option_enumerated_async": "aio",
+    "validate_user_option_multi_async": "aio",
+    "validate_user_option_value_multi_async": "aio",
+    "validate_user_option_ranges_async": "aio",
+    "yes_async": "aio",
+    "user_prompt_async": "aio",
+    # Optional extension API
+    "get_validators": "custom_validators",
+    "register_validator": "custom_validators",
+    "register_validators": "custom_validators",
+    "unregister_validator": "custom_validators",
+}
 
-# Optional extension API
-from .custom_validators import (
-    get_validators,
-    register_validator,
-    register_validators,
-    unregister_validator,
+# Submodules reachable as attributes after a bare `import askuser` (e.g. askuser.logic), imported on access
+_SUBMODULES = (
+    "aio", "answers", "autocomplete", "core", "custom_validators", "dates", "emails", "exceptions",
+    "languages", "logic", "membership", "menu", "metrics", "registry", "steps", "table", "urls",
 )
 
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        # import_module also binds the submodule as a package attribute
+        return import_module(f".{name}", __name__)
+    try:
+        module_name = _LAZY_EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(import_module(f".{module_name}", __name__), name)
+    globals()[name] = value  # cache: later lookups don't go through __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS) | set(_SUBMODULES))
+
+
 __all__ = [
     # core
     "validate_input",
+    "validate_many",
+    "ValidationResult",
     "pretty_menu",
     "validate_user_option",
     "validate_user_option_value",
     "validate_user_option_enumerated",
     "validate_user_option_multi",
     "validate_user_option_value_multi",
+    "validate_user_option_ranges",
     "choose_from_db",
     "choose_dict_from_list_of_dicts",
     "yes",
+    # answers
+    "AnswerSource",
+    "answers_from",
+    "load_answers",
+    "set_answer_source",
+    # dates
+    "validate_dates",
+    # emails
+    "validate_emails",
+    # exceptions
+    "ValidationError",
+    "MaxAttemptsExceeded",
+    "AnswerError",
+    # urls
+    "normalize_urls",
+    # membership
+    "ChoiceSet",
+    "CasefoldSet",
+    "BloomFilter",
+    # metrics
+    "MetricsAggregator",
+    "collect_metrics",
+    "set_metrics_collector",
+    # menu
+    "Menu",
+    "MenuRenderer",
+    "set_menu_renderer",
     # logic (legacy / public validators)
+    "quiet",
     "is_valid_custom",
     "is_not_in",
     "is_yes_no",
@@ -91,6 +260,18 @@ __all__ = [
     # autocomplete
     "user_prompt",
     "SubstringCompleter",
+    "SourceCompleter",
+    "clear_completer_cache",
+    # aio
+    "validate_input_async",
+    "validate_user_option_async",
+    "validate_user_option_value_async",
+    "validate_user_option_enumerated_async",
+    "validate_user_option_multi_async",
+    "validate_user_option_value_multi_async",
+    "validate_user_option_ranges_async",
+    "yes_async",
+    "user_prompt_async",
     # extension hooks
     "get_validators",
     "register_validator",
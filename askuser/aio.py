@@ -0,0 +1,171 @@
+"""
+askuser.aio
+
+Async variants of the prompts, for asyncio applications that must keep running (uploads,
+websockets, progress bars) while the user answers:
+
+    ok = await yes_async("Deploy to production?")
+    env = await validate_user_option_async("Environment:", "staging", "production")
+
+Input is read with prompt_toolkit's `prompt_async`, so waiting on the user never blocks the event
+loop. Validators that may block (BLOCKING_VALIDATORS, e.g. the DNS lookup of 'email', and every
+registered validator, which may query a database) run in the loop's default executor; others
+run inline. A registered validator may also be an `async def`, which is awaited.
+
+Menus, retries, defaults, max_attempts and metrics behave as in the blocking functions: both
+share the same prompt loops (see askuser.steps).
+"""
+import asyncio
+import inspect
+from contextvars import copy_context
+from typing import Any, Callable, Hashable, Union, get_args
+
+from prompt_toolkit import PromptSession
+
+from . import core
+from .answers import get_answer_source
+from .autocomplete import _prompt_completer, _scripted_answer
+from .menu import LARGE_MENU, Menu, menu_options
+from .steps import READ, run_steps_async
+
+# Built-in validation types whose validator may block (network); always run in an executor.
+BLOCKING_VALIDATORS = frozenset({'email', 'language'})
+
+_BUILTIN_TYPES = frozenset(get_args(core.BuiltinValidationType))
+
+
+async def input_async(msg: str) -> str:
+    """The async counterpart of input_custom: show `msg` and await the user's line."""
+    return await PromptSession().prompt_async(f"{msg.strip()} ")
+
+
+async def _read(request):
+    """Answer a READ request: the scripted answer when an answer source is set (see askuser.answers)."""
+    source = get_answer_source()
+    if source is not None:
+        return source.answer(*request[1:])
+    return await input_async(request[1])
+
+
+async def validate_input_async(input_msg: str,
+                               validation_type: Union[str, core.BuiltinValidationType],
+                               expected_inputs: list = None,
+                               not_in: list = None,
+                               maximum=None, minimum=None,
+                               allowed_chars: str = None, allowed_regex: str = None,
+                               default=None,
+                               max_attempts: int = None,
+                               on_invalid: Callable[[str, Exception, int], Any] = None,
+                               offload: bool = None):
+    """
+    validate_input for asyncio code; takes the same parameters.
+
+    :param offload: Run the validator in the default executor. Default: for BLOCKING_VALIDATORS
+                    and registered (non built-in) validators
+    """
+    vt, validator, steps = core._prepare_input(input_msg, validation_type, expected_inputs, not_in, maximum,
+                                               minimum, allowed_chars, allowed_regex, default, max_attempts,
+                                               on_invalid)
+    if offload is None:
+        offload = vt in BLOCKING_VALIDATORS or vt not in _BUILTIN_TYPES
+    loop = asyncio.get_running_loop()
+
+    async def handle(request):
+        action, text = request[:2]
+        if action == READ:
+            return await _read(request)
+        if offload:  # copy_context: validators see the caller's quiet() setting
+            result = await loop.run_in_executor(None, copy_context().run, validator, text)
+        else:
+            result = validator(text)
+        if inspect.isawaitable(result):
+            result = await result
+        return result
+
+    return await run_steps_async(steps, handle)
+
+
+async def _ask(menu: Menu, input_msg: str) -> str:
+    """Menu.ask for asyncio code."""
+    if len(menu) > LARGE_MENU:
+        return await run_steps_async(menu._large_steps(input_msg), _read)
+    menu.show()
+    validator, steps = core._menu_input(menu, input_msg)
+
+    async def handle(request):
+        return await _read(request) if request[0] == READ else validator(request[1])
+
+    return await run_steps_async(steps, handle)
+
+
+async def validate_user_option_async(input_msg: str = 'Option:', *args: Any, **kwargs: Any) -> Hashable:
+    """validate_user_option for asyncio code."""
+    menu = core._option_menu(args, kwargs)
+    return menu.key(await _ask(menu, input_msg))
+
+
+async def validate_user_option_value_async(input_msg: str = 'Option:', *args: Any, **kwargs: Any) -> Any:
+    """validate_user_option_value for asyncio code."""
+    menu = core._value_menu(args, kwargs)
+    return menu.value(await _ask(menu, input_msg))
+
+
+async def validate_user_option_enumerated_async(a_dict: dict, msg: str = 'Option:', start: int = 0):
+    """validate_user_option_enumerated for asyncio code."""
+    menu = core._enumerated_menu(a_dict, start)
+    return menu.value(await _ask(menu, msg))
+
+
+async def validate_user_option_multi_async(input_msg='Option:', *args, **kwargs) -> list:
+    """validate_user_option_multi for asyncio code."""
+    async def handle(request):
+        return await validate_user_option_async(input_msg, q=False, **request[1])
+
+    return await run_steps_async(core._multi_steps(args, kwargs), handle)
+
+
+async def validate_user_option_value_multi_async(input_msg='Option:', *args, **kwargs) -> list:
+    """validate_user_option_value_multi for asyncio code."""
+    options = menu_options(args, kwargs)
+    keys = await validate_user_option_multi_async(input_msg, **options)
+    return [options[k] for k in keys]
+
+
+async def validate_user_option_ranges_async(input_msg: str = 'Select (e.g. 1,3,5-40,!7; blank line when done):',
+                                            *args: Any, **kwargs: Any) -> list:
+    """validate_user_option_ranges for asyncio code."""
+    return await run_steps_async(Menu(menu_options(args, kwargs))._select_steps(input_msg), _read)
+
+
+async def yes_async(input_msg, default=None) -> bool:
+    """yes for asyncio code."""
+    return await validate_input_async(input_msg, "yes_no", default=default) == 'y'
+
+
+async def user_prompt_async(input_msg, items, return_value=False, max_results=None, complete_in_thread=False):
+    """user_prompt for asyncio code: the completion prompt is awaited with prompt_async."""
+    source = get_answer_source()
+    if source is not None:
+        return _scripted_answer(source, input_msg, items, return_value)
+    completer, return_value = _prompt_completer(items, return_value, max_results)
+    session = PromptSession()
+    if complete_in_thread:
+        user_input = await session.prompt_async(input_msg, completer=completer, complete_in_thread=True)
+    else:
+        user_input = await session.prompt_async(input_msg, completer=completer)
+    return items[user_input] if return_value else user_input
+
+
+__all__ = [
+    "BLOCKING_VALIDATORS",
+    "input_async",
+    "validate_input_async",
+    "validate_user_option_async",
+    "validate_user_option_value_async",
+    "validate_user_option_enumerated_async",
+    "validate_user_option_multi_async",
+    "validate_user_option_value_multi_async",
+    "validate_user_option_ranges_async",
+    "yes_async",
+    "user_prompt_async",
+]
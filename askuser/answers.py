@@ -0,0 +1,192 @@
+"""
+askuser.answers
+
+Scripted answers, for running interactive CLIs unattended (CI, provisioning, piped stdin):
+
+    with answers_from("provision.json"):
+        main()
+
+With an answer source set, every prompt (validate_input, yes, the menus, choose_from_db,
+user_prompt and their async variants) takes its answer from the source instead of the terminal.
+Nothing is drawn (no menus, tables or pages), and an answer that is rejected raises AnswerError
+at once instead of asking again, so a wrong script fails fast rather than hanging.
+
+Answers are either
+    keyed:     {"Environment": "staging", "Deploy?": "y", "Option": ["1", "3", "d"]}
+               matched to the prompt's message (ignoring case, surrounding spaces and a trailing
+               ':' or '?'); a list answers the same prompt several times, in order, a single
+               value every time it is asked
+    sequence:  ["staging", "y", "1", "3", "d"]
+               given to the prompts in the order they are asked
+
+load_answers reads them from a .json or .yaml / .yml file (a mapping or a list; YAML needs
+PyYAML) or, for any other file, one answer per line. Setting the ASKUSER_ANSWERS environment
+variable to such a file makes it the answer source of the process.
+"""
+import os
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Iterable, List, Mapping, Optional, Union
+
+from .exceptions import AnswerError
+
+ANSWERS_ENV = "ASKUSER_ANSWERS"
+
+
+def prompt_key(message: str) -> str:
+    """The key matching `message` in keyed answers: 'Deploy? ' and 'deploy' are the same prompt."""
+    return " ".join(message.split()).rstrip(":?").rstrip().casefold()
+
+
+def _text(value: Any) -> str:
+    """An answer as typed: YAML / JSON booleans are y / n, null is a blank line (the default)."""
+    if value is None:
+        return ''
+    if isinstance(value, bool):
+        return 'y' if value else 'n'
+    return str(value)
+
+
+class AnswerSource:
+    """
+    Answers for the prompts, keyed by prompt message (a Mapping) or in sequence (any other
+    iterable). See the module docstring.
+
+    :param render: Still draw menus and tables (default: nothing is drawn)
+    """
+
+    def __init__(self, answers: Union[Mapping[str, Any], Iterable[Any]], render: bool = False):
+        self.render = render
+        self.asked = 0
+        if isinstance(answers, Mapping):
+            self._keyed = {}
+            for key, value in answers.items():
+                value = deque(map(_text, value)) if isinstance(value, (list, tuple)) else _text(value)
+                self._keyed[prompt_key(str(key))] = value
+            self._sequence = None
+            self._unasked = set(self._keyed)
+        else:
+            self._keyed = None
+            self._sequence = deque(map(_text, answers))
+
+    def answer(self, prompt: str, prompt_id: str = None) -> str:
+        """The answer to `prompt` (keyed answers are looked up by `prompt_id`, default: `prompt`)."""
+        if self._sequence is not None:
+            if not self._sequence:
+                raise AnswerError(prompt, detail=f"all {self.asked} answers were used")
+            self.asked += 1
+            return self._sequence.popleft()
+
+        key = prompt_key(prompt if prompt_id is None else prompt_id)
+        if key not in self._keyed and prompt_id is not None:
+            key = prompt_key(prompt)
+        value = self._keyed.get(key)
+        if value is None:
+            raise AnswerError(prompt)
+        if not isinstance(value, str):
+            if not value:
+                raise AnswerError(prompt, detail="all its answers were used")
+            value = value.popleft()
+        self._unasked.discard(key)
+        self.asked += 1
+        return value
+
+    def reject(self, prompt: str, answer: str, error: Exception):
+        """Raise AnswerError for `answer`, rejected by the prompt with `error`."""
+        raise AnswerError(prompt, answer, error) from error
+
+    def unused(self) -> List[str]:
+        """Answers never given: the rest of a sequence, or the keys of prompts never asked."""
+        if self._sequence is not None:
+            return list(self._sequence)
+        return [key for key, value in self._keyed.items()
+                if key in self._unasked or (not isinstance(value, str) and value)]
+
+
+def load_answers(path: Union[str, os.PathLike], render: bool = False) -> AnswerSource:
+    """
+    Read an AnswerSource from `path`: JSON or YAML (.json, .yaml, .yml), holding a mapping (keyed
+    answers) or a list (a sequence), or else a text file with one answer per line (a sequence).
+    """
+    extension = os.path.splitext(os.fspath(path))[1].lower()
+    with open(path, encoding="utf-8") as f:
+        if extension == ".json":
+            import json
+            answers = json.load(f)
+        elif extension in (".yaml", ".yml"):
+            try:
+                import yaml
+            except ImportError as e:
+                raise ImportError("Reading answers from YAML needs PyYAML: pip install askuser[yaml]") from e
+            answers = yaml.safe_load(f)
+        else:
+            answers = f.read().splitlines()
+    if answers is None:
+        answers = []
+    elif not isinstance(answers, (Mapping, list)):
+        raise ValueError(f"{os.fspath(path)}: expected a mapping or a list of answers, got {type(answers).__name__}")
+    return AnswerSource(answers, render=render)
+
+
+_UNSET = object()
+_source: Any = _UNSET  # ASKUSER_ANSWERS is only read when a prompt first asks for the source
+
+
+def get_answer_source() -> Optional[AnswerSource]:
+    """The answer source prompts read from, or None (the terminal)."""
+    global _source
+    if _source is _UNSET:
+        path = os.environ.get(ANSWERS_ENV)
+        _source = load_answers(path) if path else None
+    return _source
+
+
+def set_answer_source(source: Optional[AnswerSource]) -> Optional[AnswerSource]:
+    """Make prompts read from `source` (None: the terminal again); returns the previous one."""
+    global _source
+    previous, _source = get_answer_source(), source
+    return previous
+
+
+def rendering() -> bool:
+    """Whether prompts draw their menus and tables (not when answers are scripted, unless asked to)."""
+    source = get_answer_source()
+    return source is None or source.render
+
+
+def reject_answer(prompt: str, answer: str, error: Exception):
+    """Called by the prompt loops for every rejected entry: fail fast when answers are scripted."""
+    source = get_answer_source()
+    if source is not None:
+        source.reject(prompt, answer, error)
+
+
+@contextmanager
+def answers_from(answers: Union[str, os.PathLike, Mapping[str, Any], Iterable[Any], AnswerSource],
+                 render: bool = False):
+    """
+    Answer the prompts of the block from `answers` (a file path, keyed or sequence answers, or an
+    AnswerSource), which is yielded as an AnswerSource; the previous source is restored afterwards.
+    """
+    if isinstance(answers, (str, os.PathLike)):
+        source = load_answers(answers, render=render)
+    elif isinstance(answers, AnswerSource):
+        source = answers
+    else:
+        source = AnswerSource(answers, render=render)
+    previous = set_answer_source(source)
+    try:
+        yield source
+    finally:
+        set_answer_source(previous)
+
+
+__all__ = [
+    "ANSWERS_ENV",
+    "AnswerSource",
+    "prompt_key",
+    "load_answers",
+    "get_answer_source",
+    "set_answer_source",
+    "answers_from",
+]
@@ -1,49 +1,347 @@
-from typing import Union
+import asyncio
+import inspect
+import threading
+from array import array
+from bisect import bisect_right
+from collections import OrderedDict
+from itertools import accumulate, islice
+from typing import Callable, Union
 
 from prompt_toolkit import PromptSession
+from prompt_toolkit.application.current import get_app_or_none
 from prompt_toolkit.completion import Completer, Completion
 
+from .answers import get_answer_source
+
+# Posting lists are kept for grams up to this length; longer queries are narrowed from them.
+GRAM_SIZE = 3
+# A needle found in at least 1/DENSE_RATIO of the items is treated as dense.
+DENSE_RATIO = 8
+# How many item tuples user_prompt keeps a ready-built completer for (see clear_completer_cache).
+COMPLETER_CACHE_SIZE = 8
+
 
 class SubstringCompleter(Completer):
-    def __init__(self, items_list, min_chars):
+    """
+    Case-insensitive substring completer for large item lists.
+
+    The casefolded items are joined once, at construction, into a single newline-separated
+    text so a cold search is a C-level `str.find` scan instead of a Python loop calling
+    `item.lower()` per item. Each gram (query of up to GRAM_SIZE chars) that is searched gets
+    a posting list of matching item positions, cached for the life of the completer. Longer
+    queries only verify the items of their smallest known gram (sub-millisecond for selective
+    grams once warm) and fall back to a scan when every known gram is common.
+    The matches of the previous query are kept, so typing one more character only re-checks
+    those instead of searching again.
+
+    Completions are yielded in the original item order. With `max_results`, only the best
+    `max_results` matches are yielded, ranked: prefix matches, then matches at a word boundary,
+    then other substrings (original order within a rank), selected in one pass without sorting.
+    """
+
+    def __init__(self, items_list, min_chars, max_results=None):
         self.items_list = items_list
         self.min_chars = min_chars
+        self.max_results = max_results
+        self._items = list(items_list)
+        self._folded = [str(item).casefold() for item in self._items]
+        self._text = "\n".join(self._folded)
+        # _starts[i] is the offset of item i in _text
+        self._starts = array("q", accumulate((len(f) + 1 for f in self._folded[:-1]), initial=0))
+        self._postings = {}  # gram -> array of item positions containing it
+        self._last = ("", None)  # (casefolded query, its matches) for incremental narrowing
+
+    def _scan(self, needle):
+        """Positions of items containing `needle`, found in the joined text."""
+        text, folded = self._text, self._folded
+        occurrences = text.count(needle)
+        if not occurrences:
+            return array("I")
+        if occurrences * DENSE_RATIO >= len(folded):
+            # Most items match: one filtering pass beats a find() + bisect per hit.
+            return array("I", (i for i, f in enumerate(folded) if needle in f))
+
+        starts, last = self._starts, len(folded) - 1
+        hits = array("I")
+        pos = text.find(needle)
+        while pos != -1:
+            i = bisect_right(starts, pos) - 1
+            hits.append(i)
+            if i == last:
+                break
+            pos = text.find(needle, starts[i + 1])  # one hit per item is enough
+        return hits
+
+    def _gram_postings(self, gram):
+        postings = self._postings.get(gram)
+        if postings is None:
+            # Narrow from a cached shorter gram when we have one, otherwise scan.
+            shorter = self._postings.get(gram[:-1]) if len(gram) > 1 else None
+            if shorter is not None:
+                folded = self._folded
+                postings = array("I", (i for i in shorter if gram in folded[i]))
+            else:
+                postings = self._scan(gram)
+            self._postings[gram] = postings
+        return postings
+
+    def search(self, query):
+        """Return the positions (in items_list order) of the items containing `query`, ignoring case."""
+        query = query.casefold()
+        if not query:
+            return range(len(self._items))
+
+        last_query, last_matches = self._last
+        if last_matches is not None and last_query in query:
+            # The user kept typing: every match must already be a match of the previous query.
+            candidates = last_matches
+        elif len(query) <= GRAM_SIZE:
+            matches = self._gram_postings(query)
+            self._last = (query, matches)
+            return matches
+        else:
+            grams = {query[i:i + GRAM_SIZE] for i in range(len(query) - GRAM_SIZE + 1)}
+            known = [self._postings[g] for g in grams if g in self._postings]
+            candidates = min(known, key=len) if known else self._gram_postings(query[:GRAM_SIZE])
+
+        folded = self._folded
+        if candidates is not last_matches and len(candidates) * DENSE_RATIO >= len(folded):
+            # Even the rarest known gram is common (e.g. a shared 'SKU-' prefix); scan for the whole query.
+            matches = self._scan(query)
+        elif query == last_query:
+            matches = candidates
+        else:
+            matches = array("I", (i for i in candidates if query in folded[i]))
+        self._last = (query, matches)
+        return matches
+
+    def match_rank(self, position, query):
+        """
+        Rank of item `position` for a casefolded `query` it contains:
+        0 = prefix match, 1 = match at a word boundary, 2 = other substring.
+        """
+        folded = self._folded[position]
+        if folded.startswith(query):
+            return 0
+        pos = folded.find(query)
+        while pos > 0:
+            if not folded[pos - 1].isalnum():
+                return 1
+            pos = folded.find(query, pos + 1)
+        return 2
+
+    def top(self, query, k):
+        """Return the positions of the `k` best matches for `query`, best first (see class docstring)."""
+        folded_query = query.casefold()
+        rank = self.match_rank
+        # Only three ranks and matches arrive in item order, so k bounded buckets select the top k
+        # in one pass (no heap or sort), and k prefix matches end the pass early.
+        buckets = ([], [], [])
+        for i in self.search(query):
+            bucket = buckets[rank(i, folded_query)]
+            if len(bucket) < k:
+                bucket.append(i)
+                if bucket is buckets[0] and len(bucket) == k:
+                    break
+        return (buckets[0] + buckets[1] + buckets[2])[:k]
 
     def get_completions(self, document, complete_event):
         text_before_cursor = document.text_before_cursor
         words = text_before_cursor.split()
         if not words:
             return
-        if len(words[-1]) >= self.min_chars:
-            last_word = words[-1].lower()
-            for item in self.items_list:
-                if last_word in item.lower():
-                    yield Completion(item, start_position=-len(last_word))
+        last_word = words[-1]
+        if len(last_word) >= self.min_chars:
+            items = self._items
+            if self.max_results is None:
+                matches = self.search(last_word)
+            else:
+                matches = self.top(last_word, self.max_results)
+            for i in matches:
+                yield Completion(items[i], start_position=-len(last_word))
+
+
+class SourceCompleter(Completer):
+    """
+    Completer that asks a callable for candidates: `source(word)` gets the word being typed and
+    returns the candidate strings for it (e.g. a database query on that prefix). The source may be
+    a plain function or an `async def`; candidates are yielded as returned, capped at `max_results`.
+
+    Inside a prompt, async sources are awaited on the event loop and plain ones run in the loop's
+    default executor, so a slow source never blocks keystroke echo. When the user types again
+    before the source answers, the stale query is cancelled (async) or its result dropped (sync)
+    and prompt_toolkit restarts completion for the current text.
+    """
+
+    def __init__(self, source: Callable, min_chars=2, max_results=None):
+        self.source = source
+        self.min_chars = min_chars
+        self.max_results = max_results
+
+    def _word(self, document):
+        words = document.text_before_cursor.split()
+        if words and len(words[-1]) >= self.min_chars:
+            return words[-1]
+        return None
+
+    def _completions(self, word, candidates):
+        for item in islice(candidates, self.max_results):
+            yield Completion(item, start_position=-len(word))
+
+    def get_completions(self, document, complete_event):
+        word = self._word(document)
+        if word is None:
+            return
+        candidates = self.source(word)
+        if inspect.isawaitable(candidates):  # async source used outside a running prompt
+            candidates = asyncio.run(_resolve(candidates))
+        yield from self._completions(word, candidates)
+
+    async def _query(self, word):
+        if _is_async(self.source):
+            candidates = self.source(word)
+        else:
+            candidates = await asyncio.get_running_loop().run_in_executor(None, self.source, word)
+        # Also covers async sources that don't look like one: a partial, a decorated function...
+        if inspect.isawaitable(candidates):
+            candidates = await candidates
+        return candidates
+
+    async def get_completions_async(self, document, complete_event):
+        word = self._word(document)
+        if word is None:
+            return
+        query = asyncio.ensure_future(self._query(word))
+
+        app = get_app_or_none()
+        buffer = app.current_buffer if app is not None else None
+        if buffer is None:
+            candidates = await query
+        else:
+            text_changed = asyncio.Event()
+
+            def on_text_changed(_):
+                text_changed.set()
 
+            buffer.on_text_changed += on_text_changed
+            waiter = asyncio.ensure_future(text_changed.wait())
+            try:
+                await asyncio.wait({query, waiter}, return_when=asyncio.FIRST_COMPLETED)
+            finally:
+                buffer.on_text_changed -= on_text_changed
+                waiter.cancel()
+            if not query.done():  # the user kept typing: this answer is stale
+                query.cancel()
+                return
+            candidates = query.result()
 
-def user_prompt(input_msg, items: Union[list, dict, tuple], return_value=False):
+        for completion in self._completions(word, candidates):
+            yield completion
+
+
+def _prompt_completer(items, return_value, max_results):
+    """(completer, return_value) for the items of user_prompt / user_prompt_async."""
+    if isinstance(items, SubstringCompleter):  # prebuilt by the caller
+        return items, False
+    if type(items) is dict:
+        items_list = items.keys()
+    elif type(items) is tuple:  # immutable: its completer is kept for the next prompt
+        return _cached_completer(items, min_chars=2, max_results=max_results), False
+    elif type(items) is list:
+        items_list = items
+        return_value = False
+    elif callable(items):
+        return SourceCompleter(items, min_chars=2, max_results=max_results), False
+    else:
+        raise ValueError(f"Items can only be list/tuple/dict/callable not {type(items)}")
+    # A list / dict may be edited between prompts: index it afresh (reuse: pass a SubstringCompleter)
+    return SubstringCompleter(items_list, min_chars=2, max_results=max_results), return_value
+
+
+def _scripted_answer(source, input_msg, items, return_value):
+    """user_prompt's answer while answers are scripted (see askuser.answers): no completion UI."""
+    answer = source.answer(input_msg)
+    if type(items) is not dict or not return_value:
+        return answer
+    try:
+        return items[answer]
+    except KeyError as e:
+        source.reject(input_msg, answer, e)
+
+
+def _is_async(source) -> bool:
+    """Whether calling `source` returns a coroutine (async def, or an object with an async __call__)."""
+    return inspect.iscoroutinefunction(source) or inspect.iscoroutinefunction(getattr(type(source), "__call__", None))
+
+
+async def _resolve(awaitable):
+    return await awaitable
+
+
+# (id(items), min_chars, max_results) -> (items, completer), least recently used first.
+# The tuple is kept referenced, so its id can't be reused by another object while cached.
+_completers: "OrderedDict[tuple, tuple]" = OrderedDict()
+_completers_lock = threading.Lock()
+
+
+def _cached_completer(items: tuple, min_chars: int, max_results=None) -> SubstringCompleter:
+    """
+    The completer of the tuple `items`, found by identity: the lookup doesn't copy or hash the
+    items, however many there are.
+    """
+    key = (id(items), min_chars, max_results)
+    with _completers_lock:
+        cached = _completers.get(key)
+        if cached is not None and cached[0] is items:
+            _completers.move_to_end(key)
+            return cached[1]
+    completer = SubstringCompleter(items, min_chars=min_chars, max_results=max_results)
+    with _completers_lock:
+        _completers[key] = (items, completer)
+        _completers.move_to_end(key)
+        while len(_completers) > COMPLETER_CACHE_SIZE:
+            _completers.popitem(last=False)
+    return completer
+
+
+def clear_completer_cache():
+    """Drop the completers user_prompt keeps for reuse (and the item tuples they reference)."""
+    with _completers_lock:
+        _completers.clear()
+
+
+def user_prompt(input_msg, items: Union[list, dict, tuple, Callable], return_value=False, max_results=None,
+                complete_in_thread=False):
     """
     It takes in an input message, and a list of items to be used as autocomplete options.
     For items that is a list it will always use key to autocomplete.
 
+    A list / dict is indexed on every call, as it may have changed since the last one. To reuse
+    the index of a large item set across prompts, pass a SubstringCompleter built once (used as
+    is, returning the typed text), or a tuple: the completers of the last COMPLETER_CACHE_SIZE
+    tuples are kept (clear_completer_cache() frees them).
+
+    items can also be a callable source (plain or async) returning the candidates for the word
+    being typed; see SourceCompleter. It is queried off the UI loop and stale queries are cancelled.
+
     Returns the user's input if return_value=False (default), or
     the value associated with that key if return_value=True (only when type(items)==dict)
 
     :param input_msg: Prompt the user for input
-    :param items: Specify that the items parameter can be a list, tuple or dict
+    :param items: Specify that the items parameter can be a list, tuple, dict, SubstringCompleter or a callable source
     :param return_value: (only if type(items)==dict). Return the value associated with the key selected by user
+    :param max_results: Show at most this many (ranked) suggestions. None (default) shows every match
+    :param complete_in_thread: Compute list/tuple/dict completions in a background thread
     :return: A string
     """
-    if type(items) is dict:
-        items_list = items.keys()
-    elif type(items) in [list, tuple]:
-        items_list = items
-        return_value = False
-    else:
-        raise ValueError(f"Items can only be list/tuple/dict not {type(items)}")
-
-    completer = SubstringCompleter(items_list, min_chars=2)
+    source = get_answer_source()
+    if source is not None:
+        return _scripted_answer(source, input_msg, items, return_value)
+    completer, return_value = _prompt_completer(items, return_value, max_results)
     session = PromptSession()
 
-    user_input = session.prompt(input_msg, completer=completer)
+    if complete_in_thread:  # only passed when asked, so PromptSession stand-ins without it keep working
+        user_input = session.prompt(input_msg, completer=completer, complete_in_thread=True)
+    else:
+        user_input = session.prompt(input_msg, completer=completer)
     return items[user_input] if return_value else user_input
@@ -1,10 +1,21 @@
-from typing import Any, Dict, Union, Hashable, Literal
-
-from colorfulPyPrint.py_color import print_blue, input_custom
-from string_list import str_enumerate
-from tabulate import tabulate
-
+import sys
+from time import perf_counter
+from typing import Any, Callable, Union, Hashable, Iterable, Iterator, Literal, NamedTuple, Optional
+
+from colorfulPyPrint.py_color import print_error, input_custom
+
+from .answers import get_answer_source, reject_answer, rendering
+from .exceptions import MaxAttemptsExceeded, ValidationError
+from .membership import as_casefold_set, as_choice_set
+from .metrics import PromptTimer, get_metrics_collector
+from .registry import ValidatorRegistry
+from .steps import CHOOSE, READ, VALIDATE, run_steps
+from .menu import Menu, get_menu_renderer, menu_options
+from .table import PAGE_SIZE, RowTable, page_count, row_table
 from .logic import (
+    _notices_enabled,
+    CharsValidator,
+    RegexValidator,
     is_valid_alpha,
     is_valid_alphanum,
     is_valid_char,
@@ -33,7 +44,7 @@ BuiltinValidationType = Literal[
     'date', 'future_date', 'time',
     'url', 'slug', 'email', 'phone', 'language']
 
-VALIDATOR_FUNC = {
+VALIDATOR_FUNC = ValidatorRegistry({
     'alpha': is_valid_alpha,
     'alphanum': is_valid_alphanum,
     'custom_chars': is_valid_char,
@@ -55,7 +66,7 @@ VALIDATOR_FUNC = {
     'time': is_valid_time,
     'url': is_url,
     'yes_no': is_yes_no,
-}
+})
 
 
 def validate_input(input_msg: str,
@@ -64,7 +75,9 @@ def validate_input(input_msg: str,
                    not_in: list = None,
                    maximum=None, minimum=None,
                    allowed_chars: str = None, allowed_regex: str = None,
-                   default=None):
+                   default=None,
+                   max_attempts: int = None,
+                   on_invalid: Callable[[str, Exception, int], Any] = None):
     """
     The validate_input function is used to validate user input.
     
@@ -97,23 +110,105 @@ def validate_input(input_msg: str,
     :param allowed_chars: str: Define the allowed characters for 'custom_chars' validation
     :param allowed_regex: str: Define the allowed regex for 'regex' validation
     :param default: Set a default value for the user_input (if user doesn't enter anything)
+    :param max_attempts: int: Give up with MaxAttemptsExceeded after this many invalid entries (default: retry forever)
+    :param on_invalid: Called as on_invalid(user_input, error, attempt) for every invalid entry
     :return: The user input if it is valid, or throw an appropriate error message and ask for user_input again
     """
-    hints = []
-    vt = validation_type.strip().lower()
-    if vt not in VALIDATOR_FUNC:
-        raise ValueError(f"Unknown validation_type: '{vt}'. Did you forget to register it?")
+    _, validator, steps = _prepare_input(input_msg, validation_type, expected_inputs, not_in, maximum, minimum,
+                                         allowed_chars, allowed_regex, default, max_attempts, on_invalid)
+    return run_steps(steps,
+                     lambda request: _read_input(*request[1:]) if request[0] == READ else validator(request[1]))
 
-    # Validators that require extra parameters
-    if vt == "custom" and expected_inputs is None:
-        raise ValueError("validation_type='custom' requires expected_inputs")
-    if vt == "not_in" and not_in is None:
-        raise ValueError("validation_type='not_in' requires not_in")
-    if vt == "custom_chars" and allowed_chars is None:
-        raise ValueError("validation_type='custom_chars' requires allowed_chars")
-    if vt == "regex" and allowed_regex is None:
-        raise ValueError("validation_type='regex' requires allowed_regex")
 
+def _read_input(prompt: str, prompt_id: str = None) -> str:
+    """
+    What the user typed at `prompt`, or its scripted answer when an answer source is set (see
+    askuser.answers; keyed answers are looked up by `prompt_id`, default: `prompt`). Every prompt
+    reads through here; input_custom is looked up at call time, so it can be patched.
+    """
+    source = get_answer_source()
+    if source is None:
+        return input_custom(prompt)
+    return source.answer(prompt, prompt_id)
+
+
+def _prepare_input(input_msg, validation_type, expected_inputs, not_in, maximum, minimum, allowed_chars,
+                   allowed_regex, default, max_attempts, on_invalid, report=None):
+    """(validation key, bound validator, step generator) of a validate_input / validate_input_async call."""
+    collector = get_metrics_collector()
+    started = perf_counter() if collector is not None else 0.0
+    vt = _validation_key(validation_type, expected_inputs, not_in, allowed_chars, allowed_regex)
+
+    # Everything that doesn't depend on what the user types is prepared once, not per retry.
+    prompt = f"{input_msg}{_prompt_suffix(input_msg, vt, maximum, minimum, default)}"
+    validator = _bind_validator(vt, expected_inputs, not_in, maximum, minimum, allowed_chars, allowed_regex)
+    # Timings are only taken when a collector is set (see askuser.metrics).
+    timer = None if collector is None else PromptTimer(collector, input_msg, vt, VALIDATOR_FUNC[vt], started)
+    return vt, validator, _input_steps(prompt, input_msg, default, max_attempts, on_invalid, timer, report)
+
+
+def _menu_input(menu: Menu, input_msg: str):
+    """
+    (validator, step generator) of a short menu's prompt: validate_input's loop over the menu keys,
+    with errors written by the menu renderer, to the stream the menu is drawn on.
+    """
+    _, validator, steps = _prepare_input(input_msg, "custom", menu._choices, None, None, None, None, None, None,
+                                         None, None, report=get_menu_renderer().error)
+    return validator, steps
+
+
+def _input_steps(prompt, input_msg, default, max_attempts, on_invalid, timer, report=None):
+    """
+    The retry loop of validate_input / validate_input_async, as a step generator (see askuser.steps).
+    Errors are printed, or passed to report(message) (which also separates them from the next prompt).
+    """
+    attempts = 0
+    outcome = 'error'
+    try:
+        while True:
+            if timer is not None:
+                timer.reading()
+            user_input = yield READ, prompt, input_msg
+            if timer is not None:
+                timer.read()
+
+            # If default is set and user_input is blank
+            if len(user_input) == 0 and default is not None:
+                outcome = 'default'
+                return default
+
+            # Otherwise try to validate
+            try:
+                value = yield VALIDATE, user_input
+            except (ValueError, TypeError) as e:
+                if timer is not None:
+                    timer.validated(False)
+                attempts += 1
+                reject_answer(input_msg, user_input, e)  # scripted answers fail fast
+                if isinstance(e, ValidationError) and report is not None:
+                    report(e.message)
+                elif isinstance(e, ValidationError):
+                    print_error(e.message)
+                if on_invalid is not None:
+                    on_invalid(user_input, e, attempts)
+                if max_attempts is not None and attempts >= max_attempts:
+                    outcome = 'max_attempts'
+                    raise MaxAttemptsExceeded(attempts, e) from e
+                if report is None:
+                    print()
+            else:
+                if timer is not None:
+                    timer.validated()
+                outcome = 'valid'
+                return value
+    finally:
+        if timer is not None:
+            timer.finish(outcome)
+
+
+def _prompt_suffix(input_msg, vt, maximum, minimum, default) -> str:
+    """The automatic hints appended to input_msg, e.g. ' (y/n): ' or ' (max: 10) (default: 5) '."""
+    hints = []
     if vt == 'yes_no' and '(y/n)' not in input_msg.lower():
         hints.append('(y/n):')
     elif vt in ('none_if_blank', 'optional') and '(optional)' not in input_msg.lower():
@@ -133,41 +228,116 @@ def validate_input(input_msg: str,
         # Only add a space if input_msg is non-empty and doesn't already end with one
         needs_space = bool(input_msg) and not input_msg.endswith(' ')
         suffix = (' ' if needs_space else '') + ' '.join(hints) + ' '
+    return suffix
 
-    user_input = input_custom(f"{input_msg}{suffix}")
 
-    # If default is set and user_input is blank
-    if len(user_input) == 0 and default is not None:
-        return default
+def _validation_key(validation_type, expected_inputs, not_in, allowed_chars, allowed_regex) -> str:
+    """Normalize validation_type and check the extra parameters its validator needs."""
+    vt = validation_type.strip().lower()
+    if vt not in VALIDATOR_FUNC:
+        raise ValueError(f"Unknown validation_type: '{vt}'. Did you forget to register it?")
 
-    # Otherwise try to validate
-    try:
-        if vt in ['custom'] and expected_inputs is not None:
-            return VALIDATOR_FUNC[vt](user_input, expected_inputs)
-        elif vt in ['int', 'float', 'decimal'] and (expected_inputs or maximum or minimum):
-            return VALIDATOR_FUNC[vt](user_input, expected_inputs, maximum, minimum)
-        elif vt in ['not_in'] and not_in is not None:
-            return VALIDATOR_FUNC['not_in'](user_input, not_in)
-        elif vt in ['custom_chars'] and allowed_chars is not None:
-            return VALIDATOR_FUNC[vt](user_input, allowed_chars)
-        elif vt in ['regex'] and allowed_regex is not None:
-            return VALIDATOR_FUNC[vt](user_input, allowed_regex)
+    # Validators that require extra parameters
+    if vt == "custom" and expected_inputs is None:
+        raise ValueError("validation_type='custom' requires expected_inputs")
+    if vt == "not_in" and not_in is None:
+        raise ValueError("validation_type='not_in' requires not_in")
+    if vt == "custom_chars" and allowed_chars is None:
+        raise ValueError("validation_type='custom_chars' requires allowed_chars")
+    if vt == "regex" and allowed_regex is None:
+        raise ValueError("validation_type='regex' requires allowed_regex")
+    return vt
+
+
+def _bind_validator(vt, expected_inputs, not_in, maximum, minimum, allowed_chars, allowed_regex):
+    """
+    Return a one-argument callable running the registered validator for vt with the parameters
+    it takes. Built once per prompt / stream; the built-in 'regex' and 'custom_chars' validators
+    are bound to reusable RegexValidator / CharsValidator objects (pattern compiled once), and
+    the built-in 'custom' / 'not_in' get their values as a hashed set, converted once.
+    """
+    func = VALIDATOR_FUNC[vt]
+    if vt in ['custom'] and expected_inputs is not None:
+        if func is is_valid_custom:
+            expected_inputs = as_choice_set(expected_inputs)
+        return lambda user_input: func(user_input, expected_inputs)
+    elif vt in ['int', 'float', 'decimal'] and (expected_inputs or maximum or minimum):
+        return lambda user_input: func(user_input, expected_inputs, maximum, minimum)
+    elif vt in ['not_in'] and not_in is not None:
+        if func is is_not_in:
+            not_in = as_casefold_set(not_in)
+        return lambda user_input: func(user_input, not_in)
+    elif vt in ['custom_chars'] and allowed_chars is not None:
+        if func is is_valid_char:
+            return CharsValidator(allowed_chars)
+        return lambda user_input: func(user_input, allowed_chars)
+    elif vt in ['regex'] and allowed_regex is not None:
+        if func is is_valid_regex:
+            return RegexValidator(allowed_regex)
+        return lambda user_input: func(user_input, allowed_regex)
+    else:
+        return lambda user_input: func(user_input.strip())
+
+
+class ValidationResult(NamedTuple):
+    """One item of validate_many: `value` on success, otherwise `error` holds the raised exception."""
+    index: int
+    input: Any
+    value: Any = None
+    error: Optional[Exception] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def validate_many(values: Iterable[str],
+                  validation_type: Union[str, BuiltinValidationType],
+                  expected_inputs: list = None,
+                  not_in: list = None,
+                  maximum=None, minimum=None,
+                  allowed_chars: str = None, allowed_regex: str = None,
+                  default=None) -> Iterator[ValidationResult]:
+    """
+    Validate a stream of values without prompting, using the same validators and parameters as
+    validate_input. It is a generator: one ValidationResult is yielded per value, in order, so
+    memory use stays constant however long the input is (CSV columns, stdin lines, ...).
+
+    Invalid values don't stop the stream; their result carries the exception in `error`
+    (a ValidationError with a `code` for the built-in validators). Nothing is printed.
+
+    For example:
+        for res in validate_many(csv_column, "int", minimum=0):
+            if not res.ok:
+                log.warning("row %s: %s", res.index, res.error)
+
+    :param values: Iterable of raw string values (strip newlines from file lines yourself)
+    :param validation_type: Any validation_type accepted by validate_input (including registered ones)
+    :param default: Value returned for blank inputs, like validate_input
+    :return: Generator of ValidationResult(index, input, value, error)
+    """
+    # Checked here, not in the generator, so a bad validation_type fails at the call site.
+    vt = _validation_key(validation_type, expected_inputs, not_in, allowed_chars, allowed_regex)
+    validator = _bind_validator(vt, expected_inputs, not_in, maximum, minimum, allowed_chars, allowed_regex)
+    return _validate_stream(values, validator, default)
+
+
+def _validate_stream(values, validator, default):
+    for index, user_input in enumerate(values):
+        if len(user_input) == 0 and default is not None:
+            yield ValidationResult(index, user_input, default)
+            continue
+        # Same as `with quiet():`, minus the context manager overhead per value.
+        token = _notices_enabled.set(False)
+        try:
+            value = validator(user_input)
+        except (ValueError, TypeError) as e:
+            result = ValidationResult(index, user_input, error=e)
         else:
-            user_input = user_input.strip()
-            return VALIDATOR_FUNC[vt](user_input)
-    except (ValueError, TypeError):
-        print()
-        return validate_input(
-            input_msg=input_msg,
-            validation_type=validation_type,
-            expected_inputs=expected_inputs,
-            not_in=not_in,
-            maximum=maximum,
-            minimum=minimum,
-            allowed_chars=allowed_chars,
-            allowed_regex=allowed_regex,
-            default=default,
-        )
+            result = ValidationResult(index, user_input, value)
+        finally:
+            _notices_enabled.reset(token)
+        yield result
 
 
 def pretty_menu(*args, **kwargs):
@@ -180,33 +350,7 @@ def pretty_menu(*args, **kwargs):
     :param args: a list of values (will be displayed as <num>: value)
     :param kwargs: a dict of key-value pairs (will be displayed key: value)
     """
-    ops_dict = {}
-
-    for i, op in enumerate(args):
-        ops_dict[str(i)] = op
-    for i, op in kwargs.items():
-        ops_dict[str(i)] = op
-
-    if not ops_dict:
-        print()
-        return
-
-    longest_option = max(len(str(k)) for k in ops_dict)
-    longest_desc = max(len(str(v)) for v in ops_dict.values())
-    count = 0
-    print()
-    for i, op in ops_dict.items():
-        if len(ops_dict) > 5:
-            print_blue(i.rjust(longest_option), end="")
-            print(f": {op}".ljust(longest_desc + 5), end="")
-            count += 1
-            if count % 3 == 0:
-                print()
-        else:
-            print_blue(i, end="")
-            print(f": {op}")
-    if count % 3 != 0:  # Add a line for the input_msg (else it will print in same line)
-        print()
+    Menu(menu_options(args, kwargs), per_row=3).show()
 
 
 def validate_user_option(input_msg: str = 'Option:', *args: Any, **kwargs: Any) -> Union[str, int, Hashable]:
@@ -228,57 +372,19 @@ def validate_user_option(input_msg: str = 'Option:', *args: Any, **kwargs: Any)
         :param kwargs: {key: operation_description}
         :return: user selection (key for **kwargs, number for *args)
     """
-    ops_dict: Dict[str, str] = {}
-    # Reverse map to preserve original key types when kwargs are used
-    orig_key_by_menu_key: Dict[str, Hashable] = {}
+    return _option_menu(args, kwargs).choose(input_msg)
 
-    # Positional args → "0","1",...  (unchanged)
-    for i, op in enumerate(args):
-        menu_key = str(i)
-        ops_dict[menu_key] = str(op)
 
-    # Keyword args → preserve original key type via reverse map
-    for k, v in kwargs.items():
-        # Keep menu key as string for display / validation, but remember the original key
-        menu_key = str(k)
-        ops_dict[menu_key] = str(v) if v is not False else False
-        orig_key_by_menu_key[menu_key] = k
+def _option_menu(args, kwargs) -> Menu:
+    """The menu of validate_user_option (and validate_user_option_async)."""
+    options = menu_options(args, kwargs)
 
     # Handle q option like before
-    if 'q' not in ops_dict:
-        ops_dict['q'] = 'quit'
-    elif ops_dict['q'] is False:  # q=False suppresses quit
-        ops_dict.pop('q')
-
-    # Pretty print (same layout logic as your existing function)
-    items_per_col = 3
-    longest_option = (max(len(str(k)) for k in ops_dict)) if ops_dict else 1
-    longest_desc = (max(len(str(v)) for v in ops_dict.values())) if ops_dict else 1
-    count = 0
-    print()
-    for i, op in ops_dict.items():
-        if len(ops_dict) > 5:
-            # Calculate items per column (max row length = 120 characters)
-            max_item_len = longest_desc + len(': ') + longest_option + 5
-            items_per_col = max(1, int(120 / max_item_len))
-            print_blue(i.rjust(longest_option), end="")
-            print(f": {op}".ljust(longest_desc + 5 - len(i) + 1), end="")
-            count += 1
-            if count % items_per_col == 0:
-                print()
-        else:
-            print_blue(i, end="")
-            print(f": {op}")
-    if count % items_per_col != 0:
-        print()
-
-    # Validate input against the displayed menu keys
-    choice: str = validate_input(input_msg, "custom", expected_inputs=list(ops_dict.keys()))
-
-    # Map back to original key type when possible (kwargs)
-    if choice in orig_key_by_menu_key:
-        return orig_key_by_menu_key[choice]
-    return choice  # covers *args case (string indices) and 'q'
+    if 'q' not in options:
+        options['q'] = 'quit'
+    elif options['q'] is False:  # q=False suppresses quit
+        options.pop('q')
+    return Menu(options)
 
 
 def validate_user_option_value(input_msg: str = 'Option:', *args: Any, **kwargs: Any) -> Any:
@@ -301,23 +407,19 @@ def validate_user_option_value(input_msg: str = 'Option:', *args: Any, **kwargs:
     :param kwargs: {key: operation_description}
     :return: value based on key selected by user
     """
-    # If list has been passed as arguments add them to kwargs
-    if args:
-        arg_dict = str_enumerate(list(args))  # keys are strings "0","1",...
-        if kwargs:
-            arg_dict.update(kwargs)
-        kwargs = arg_dict
-
-    # Add q=False if it is not in kwargs,
-    # if q=(something other than False), make xq=(something other than False) and q=False
-    if 'q' not in kwargs:
-        kwargs['q'] = False
-    else:
-        if kwargs['q']:
-            kwargs['xq'], kwargs['q'] = kwargs['q'], False
+    return _value_menu(args, kwargs).choose_value(input_msg)
 
-    key = validate_user_option(input_msg, **kwargs)
-    return kwargs[key]
+
+def _value_menu(args, kwargs) -> Menu:
+    """The menu of validate_user_option_value (and validate_user_option_value_async)."""
+    options = menu_options(args, kwargs)
+
+    # No q by default; if q=(something other than False), it is offered as xq instead
+    if options.get('q'):
+        options['xq'] = options.pop('q')
+    else:
+        options.pop('q', None)
+    return Menu(options)
 
 
 def validate_user_option_enumerated(a_dict: dict, msg: str = 'Option:', start: int = 0):
@@ -340,14 +442,15 @@ def validate_user_option_enumerated(a_dict: dict, msg: str = 'Option:', start: i
     :param start: starting value of count
     :return: {id: value} based on user selection or None if user enters 'q'
     """
-    d_enumerated = dict(enumerate(a_dict.items(), start=start))
-    d_index_dict = {str(index): boncon_title for index, (boncon_id, boncon_title) in d_enumerated.items()}
-    index = validate_user_option(msg, **d_index_dict, q="quit")
-    if index == 'q':
-        return 'q', None
-    else:
-        d_id, d_value = d_enumerated[int(index)]
-        return d_id, d_value
+    return _enumerated_menu(a_dict, start).choose_value(msg)
+
+
+def _enumerated_menu(a_dict: dict, start: int) -> Menu:
+    """The menu of validate_user_option_enumerated (and its async variant)."""
+    options = {str(index): item for index, item in enumerate(a_dict.items(), start=start)}
+    options['q'] = ('q', None)
+    labels = [*map(str, a_dict.values()), 'quit']
+    return Menu(options, labels)
 
 
 def validate_user_option_multi(input_msg='Option:', *args, **kwargs) -> list[Any]:
@@ -361,6 +464,12 @@ def validate_user_option_multi(input_msg='Option:', *args, **kwargs) -> list[Any
       * For *args menus: returns enumerated string keys "0","1",...
     - To disable exit entirely (force select-until-exhausted), pass d=False.
     """
+    return run_steps(_multi_steps(args, kwargs),
+                     lambda request: validate_user_option(input_msg, q=False, **request[1]))
+
+
+def _multi_steps(args, kwargs):
+    """The pick loop of validate_user_option_multi (and its async variant), as a step generator."""
     # Build menu display dict and reverse map for kwargs to preserve original key types
     menu = {}
     kw_reverse = {}  # menu_key(str) -> original key (could be int, str, etc.)
@@ -394,8 +503,8 @@ def validate_user_option_multi(input_msg='Option:', *args, **kwargs) -> list[Any
 
     selected = []
     while menu:
-        # Suppress 'q' in the underlying single-select to avoid showing/accepting it
-        choice = validate_user_option(input_msg, q=False, **menu)
+        # Asked with validate_user_option(..., q=False): 'q' is neither shown nor accepted
+        choice = yield CHOOSE, menu
 
         # Exit when user picks the done key
         if exit_key is not None and choice == exit_key:
@@ -419,6 +528,22 @@ def validate_user_option_multi(input_msg='Option:', *args, **kwargs) -> list[Any
     return selected
 
 
+def validate_user_option_ranges(input_msg: str = 'Select (e.g. 1,3,5-40,!7; blank line when done):',
+                               *args: Any, **kwargs: Any) -> list[Any]:
+    """
+    Multi-select in one line: shows the menu with a mark per option and reads lines such as
+    `1,3,5-40,!7` (keys, ranges of integer keys, `!` to deselect) until a blank line.
+    Unlike validate_user_option_multi, the menu isn't printed again after each pick: on a terminal
+    only the rows whose marks changed are redrawn. See Menu.select.
+
+    :param input_msg: Instructions for user
+    :param args: [option_descriptions] (keys "0","1",...)
+    :param kwargs: {key: option_description}
+    :return: list of selected keys, in menu order
+    """
+    return Menu(menu_options(args, kwargs)).select(input_msg)
+
+
 def validate_user_option_value_multi(input_msg='Option:', *args, **kwargs) -> list[Union[str, int, Hashable]]:
     """
     Multi-select version of validate_user_option_value.
@@ -433,76 +558,197 @@ def validate_user_option_value_multi(input_msg='Option:', *args, **kwargs) -> li
         list: Values corresponding to the selections, in the order picked.
     """
     # Build menu dict like validate_user_option_value (enumerate *args into "0","1",...)
-    if args:
-        arg_dict = str_enumerate(list(args))
-        if kwargs:
-            arg_dict.update(kwargs)
-        kwargs = arg_dict
+    options = menu_options(args, kwargs)
 
     # Delegate to the key-returning multi; it will handle 'd'/'xd' exit and key-type preservation
-    keys = validate_user_option_multi(input_msg, **kwargs)
-    return [kwargs[k] for k in keys]
+    keys = validate_user_option_multi(input_msg, **options)
+    return [options[k] for k in keys]
 
 
-def choose_from_db(db_result, input_msg=None, primary_key='id', table_desc=None, xq=False):
+def choose_from_db(db_result, input_msg=None, primary_key='id', table_desc=None, xq=False, page_size=None,
+                   prefetch=False, columns=None):
     """
     Displays a list of database results in a tabular format and allows the user to select an entry by ID.
 
+    db_result can also be tuple rows with their `columns` names, a dict of column arrays, a NumPy
+    structured array, or a DB-API cursor (after execute) / any iterator of dicts (or of tuples,
+    with `columns`): those are read in `fetchmany(page_size)` batches as the user pages, and kept
+    as tuples.
+
+    Results longer than one page are shown a page at a time (only the displayed rows are formatted).
+    At the prompt the user can then also type:
+        n / p       next / previous page
+        g <page>    go to page
+        /<text>     only show rows with a value containing text (ignoring case); '/' alone clears it
+
     Args:
-        db_result (list of dict): The result set from the database query, where each dict represents a row.
+        db_result (list of dict | list of tuple | dict of columns | cursor | iterator): The result set from the database query, where each dict represents a row.
         input_msg (str): Input message to be displayed for user (default - Choose appropriate id: )
         primary_key (str): Default: 'id'. Primary key of the table - becomes key to choose.
         table_desc (str): The description of the query
         xq (bool): Gives option of '(xq: quit)'. Defaults to False
+        page_size (int): Rows per page. Defaults to PAGE_SIZE (50): results of 51 rows or more are paged.
+            0 shows every row at once (no paging)
+        prefetch (bool): For a cursor / iterator, fetch the next page in a background thread.
+            The connection must allow use from another thread (sqlite3: check_same_thread=False)
+        columns (list of str): Column names of tuple rows
 
     Returns:
         tuple:
             - chosen_id (int): The ID of the selected entry.
             - chosen_row (dict): The full row data corresponding to the selected ID.
     """
-    # Map IDs to their respective rows for quick lookup
-    ids = {str(r[primary_key]): r for r in db_result}
+    page_size = PAGE_SIZE if page_size is None else page_size
+    table = row_table(db_result, primary_key, columns, batch_size=page_size or PAGE_SIZE, prefetch=prefetch)
+    try:
+        return _choose_from_table(table, input_msg, table_desc, xq, page_size)
+    finally:
+        table.close()
+
 
-    # Display the data in a tabular format for user review
-    if table_desc:
+def _choose_from_table(table: RowTable, input_msg, table_desc, xq, page_size):
+    # Display the data in a tabular format for user review (not for scripted answers)
+    if table_desc and rendering():
         print(' ' * 85 + table_desc.upper())
         print('-' * 188)
-    print(tabulate(db_result, headers="keys"))
 
-    # Prompt the user to select an ID
-    keys = list(ids.keys())
-    quit_msg = ''
-    if xq:
-        quit_msg = ' (xq: quit)'
-        keys += ['xq']
+    quit_msg = ' (xq: quit)' if xq else ''
     input_msg = f"{input_msg.replace(': ', '')}{quit_msg}: " if input_msg else f"Choose appropriate id{quit_msg}: "
 
+    if not page_size:
+        table.ensure(sys.maxsize)  # every row is shown
+    elif table.ensure(page_size + 1) > page_size:
+        return _choose_from_pages(table, input_msg, page_size, xq)
+
+    if rendering():
+        print(table.render(range(len(table))))
+
+    # Prompt the user to select an ID
+    keys = [str(value) for value in table.column(table.primary_key)]
+    if xq:
+        keys.append('xq')
     chosen_id = validate_input(input_msg, "custom", expected_inputs=keys)
 
     # Return the selected ID and its corresponding row
     if xq and chosen_id == 'xq':
         return 'xq', 'quit'
 
-    return int(chosen_id), ids[chosen_id]
+    return int(chosen_id), table.row(table.find(chosen_id))
+
+
+def _choose_from_pages(table: RowTable, input_msg: str, page_size: int, xq: bool):
+    """The paged prompt loop of choose_from_db."""
+    command = _page_command(table, xq)
+    return run_steps(_pages_steps(table, input_msg, page_size, command),
+                     lambda request: _read_input(*request[1:]) if request[0] == READ else command(request[1]))
+
+
+def _page_command(table: RowTable, xq: bool):
+    """The validator of the paged prompt: what the user typed as (command, argument)."""
+    def page_command(user_input):
+        answer = user_input.strip()
+        if xq and answer == 'xq':
+            return 'quit', None
+        # Commands come first: looking up an unknown id reads a cursor to the end.
+        if answer == 'n':
+            return 'move', 1
+        if answer == 'p':
+            return 'move', -1
+        if answer[:1] == 'g' and answer[1:].strip().isdigit():
+            return 'go', int(answer[1:]) - 1
+        if answer[:1] == '/':
+            return 'filter', answer[1:].strip() or None
+        offset = table.find(answer) if answer else None
+        if offset is None:
+            raise ValidationError("unknown_id",
+                                  "Error: {value!r} is not an id in the table (or n, p, g <page>, /<text>)",
+                                  value=answer)
+        return 'id', (int(answer), offset)
+    return page_command
+
+
+def _pages_steps(table: RowTable, input_msg: str, page_size: int, command):
+    """
+    The paged prompt loop as a step generator (see askuser.steps): each answer goes through the
+    retry loop of validate_input, so invalid ids are retried (or fail fast) and timed the same way.
+    """
+    view = None  # offsets of the rows matching the filter, None while unfiltered
+    term = None
+    page = 0
+    draw = rendering()
+    while True:
+        collector = get_metrics_collector()
+        timer = None if collector is None else PromptTimer(collector, input_msg, 'choose_from_db', command,
+                                                          perf_counter())
+        if view is None:
+            # Read one row past the page, so we know whether there is a next one.
+            table.ensure((page + 1) * page_size + 1)
+            total = len(table)
+            more = '' if table.exhausted else '+'
+        else:
+            total, more = len(view), ''
+        pages = page_count(total, page_size)
+        page = min(max(page, 0), pages - 1)
+        start = page * page_size
+        shown = range(start, min(start + page_size, total)) if view is None else view[start:start + page_size]
+        if draw:
+            print(table.render(shown))
+            matching = f" matching '{term}'" if term else ''
+            print(f"Page {page + 1}/{pages}{more} ({total}{more} rows{matching})"
+                  f"  n: next  p: prev  g <page>: go to  /<text>: filter  /: clear filter")
+
+        action, argument = yield from _input_steps(input_msg, input_msg, None, None, None, timer)
+        if action == 'quit':
+            return 'xq', 'quit'
+        if action == 'move':
+            page += argument
+        elif action == 'go':
+            page = argument
+        elif action == 'filter':
+            term = argument
+            view = table.search(term) if term else None
+            page = 0
+        else:
+            chosen_id, offset = argument
+            return chosen_id, table.row(offset)
 
 
-def choose_dict_from_list_of_dicts(list_of_dicts: list[dict], key_to_choose: str) -> dict:
+def choose_dict_from_list_of_dicts(list_of_dicts: list[dict], key_to_choose: str, columns: list = None) -> dict:
     """
     The choose_dict_from_list_of_dicts function takes a list of dictionaries and a key to choose from.
-    It then creates two dictionaries: one with the keys being the chosen key, and values being the dictionary;
-    and another with keys as chosen key, and values as lists of strings containing all other keys in each dictionary.
-    The user is prompted to select an option from these lists, which returns that selected dictionary.
+    It shows a menu with the values of the chosen key as options, and the other keys of each dictionary
+    as descriptions. The user is prompted to select an option, which returns that selected dictionary.
+
+    Like choose_from_db, it also accepts tuple rows with their `columns`, a dict of column arrays or a
+    NumPy structured array (a dict is then built for the selected row only). A row's description is
+    only formatted when the row is displayed: above LARGE_MENU rows, the menu is paged.
 
     :param list_of_dicts: List[dict]: Pass a list of dictionaries to the function
     :param key_to_choose: str: Specify which key in the dictionary to use for the menu
+    :param columns: List[str]: Column names, when list_of_dicts holds tuples
     :return: A dictionary from the list of dictionaries that is passed to it
     """
-    c_dict = {f"{k[key_to_choose]}": k for k in list_of_dicts}
-    keys = list(list_of_dicts[0].keys())
-    keys.sort(reverse=True)
-    choice = {f"{m[key_to_choose]}": [f"{k}: {m[k]}" for k in keys if k != key_to_choose] for m in list_of_dicts}
-    selected_dict = c_dict[validate_user_option("Choose movie ID: ", **choice)]
-    return selected_dict
+    table = row_table(list_of_dicts, key_to_choose, columns)
+    table.ensure(sys.maxsize)  # every row is on the menu
+    keys = sorted(table.columns, reverse=True)
+    keys.remove(key_to_choose)
+    choice = {str(value): _RowLabel(table, offset, keys) for offset, value in enumerate(table.column(key_to_choose))}
+    selected = validate_user_option("Choose movie ID: ", **choice)
+    return table.row(table.find(str(selected)))
+
+
+class _RowLabel:
+    """Menu description of one table row; Menu formats it (str) only when the row is displayed."""
+    __slots__ = ("table", "offset", "keys")
+
+    def __init__(self, table, offset, keys):
+        self.table = table
+        self.offset = offset
+        self.keys = keys
+
+    def __str__(self):
+        row = self.table.row(self.offset)
+        return str([f"{k}: {row[k]}" for k in self.keys])
 
 
 def yes(input_msg, default=None):
@@ -513,12 +759,15 @@ __all__ = [
     "BuiltinValidationType",
     "VALIDATOR_FUNC",
     "validate_input",
+    "validate_many",
+    "ValidationResult",
     "pretty_menu",
     "validate_user_option",
     "validate_user_option_value",
     "validate_user_option_enumerated",
     "validate_user_option_multi",
     "validate_user_option_value_multi",
+    "validate_user_option_ranges",
     "choose_from_db",
     "choose_dict_from_list_of_dicts",
     "yes",
@@ -10,6 +10,10 @@ Why this exists:
 - Instead of mutating internal globals directly, projects can register validators via
   these helpers.
 
+Validators can also be registered by import path ("pkg.module:function") or declared by
+installed packages under the `askuser.validators` entry-point group; either way they are only
+imported the first time they are used (see askuser.registry).
+
 Validator contract:
 - A validator is a callable where the first argument is `user_input: str`.
 - It must return the validated/normalized value on success.
@@ -18,9 +22,10 @@ Validator contract:
 
 from __future__ import annotations
 
-from typing import Callable, Mapping, Any
+from typing import Callable, Mapping, Any, Union
 
 from .core import VALIDATOR_FUNC
+from .registry import LazyValidator
 
 ValidatorFn = Callable[..., Any]
 
@@ -30,24 +35,28 @@ def get_validators() -> dict[str, ValidatorFn]:
     Return the live validator registry.
 
     Notes:
-    - This returns the underlying registry dict used by AskUser.
+    - This returns the underlying registry dict used by AskUser. Validators declared through
+      entry points are added to it (not imported) first; `registry[name]` imports a lazy entry.
     - Mutating this dict directly will affect behavior globally in-process.
       Prefer register_validator/register_validators for intentional changes.
     """
+    if not VALIDATOR_FUNC._discovered:
+        VALIDATOR_FUNC.discover()
     return VALIDATOR_FUNC
 
 
-def register_validator(name: str, func: ValidatorFn, *, overwrite: bool = False) -> None:
+def register_validator(name: str, func: Union[ValidatorFn, str], *, overwrite: bool = False) -> None:
     """
     Register a custom validator by name.
 
     Args:
         name: The validation_type string used by validate_input(...).
         func: The validator function. Must be callable and should raise ValueError on invalid input.
+              May also be its import path, "pkg.module:function": it is then imported on first use.
         overwrite: If False (default), raises KeyError if name is already registered.
 
     Raises:
-        ValueError: If name is blank or func is not callable.
+        ValueError: If name is blank, or func is neither callable nor an import path.
         KeyError: If name already exists and overwrite=False.
 
     Example:
@@ -59,15 +68,20 @@ def register_validator(name: str, func: ValidatorFn, *, overwrite: bool = False)
 
         register_validator("even_int", is_valid_even_int)
         x = validate_input("Enter even:", "even_int")
+
+        register_validator("movie_id", "myapp.validators:is_valid_movie_id")  # imported when first used
     """
     if not isinstance(name, str) or not name.strip():
         raise ValueError("Validator name must be a non-empty string")
-    if not callable(func):
+    if isinstance(func, str):
+        func = LazyValidator(func)
+    elif not callable(func):
         raise ValueError(f"Validator func for '{name}' must be callable")
 
     key = name.strip().lower()
 
-    if key in VALIDATOR_FUNC and not overwrite:
+    # Entry points are not looked up here: they never replace an explicitly registered name.
+    if VALIDATOR_FUNC.is_registered(key) and not overwrite:
         raise KeyError(
             f"Validator '{key}' already exists. "
             f"Pass overwrite=True to replace it intentionally."
@@ -76,7 +90,7 @@ def register_validator(name: str, func: ValidatorFn, *, overwrite: bool = False)
     VALIDATOR_FUNC[key] = func
 
 
-def register_validators(validators: Mapping[str, ValidatorFn], *, overwrite: bool = False) -> None:
+def register_validators(validators: Mapping[str, Union[ValidatorFn, str]], *, overwrite: bool = False) -> None:
     """
     Register many validators at once.
 
@@ -88,6 +102,7 @@ def register_validators(validators: Mapping[str, ValidatorFn], *, overwrite: boo
         register_validators({
             "movie_ids": is_valid_movie_ids,
             "bundle_ids": is_valid_bundle_ids,
+            "festival_ids": "myapp.validators:is_valid_festival_ids",
         })
     """
     for name, func in validators.items():
@@ -0,0 +1,215 @@
+"""
+askuser.dates
+
+Date and time parsing behind the 'date', 'future_date' and 'time' validators.
+
+Each supported format is compiled once into a regex (instead of `strptime`, which re-reads the
+format string on every call) and the parser remembers which format matched last, so a column
+of values in the same format is parsed in one regex match per value. Parsed values are real
+`datetime.date` / `datetime.datetime` / `datetime.time` objects; the validators still return the
+input string unless asked for the object (`as_object=True`).
+
+validate_dates() checks a whole column, parsing each distinct value once:
+
+    for result in validate_dates(csv_column, 'future_date', as_object=True):
+        ...
+"""
+import datetime
+import re
+from typing import Iterable, Iterator, Optional, Sequence, Union
+
+from .exceptions import ValidationError
+
+# Formats accepted by 'date' / 'future_date' (strptime notation; only %Y %m %d %H %M %S are supported)
+DATE_FORMATS = ("%Y-%m-%d %H:%M:%S", "%Y-%m-%d")
+
+# Distinct values validate_dates remembers the outcome of (the memo is reset beyond that)
+DATE_MEMO_SIZE = 65_536
+
+_DIRECTIVES = {
+    "Y": r"(?P<Y>\d{4})",
+    "m": r"(?P<m>\d{1,2})",
+    "d": r"(?P<d>\d{1,2})",
+    "H": r"(?P<H>\d{1,2})",
+    "M": r"(?P<M>\d{1,2})",
+    "S": r"(?P<S>\d{1,2})",
+}
+_DATE_FIELDS = ("Y", "m", "d")
+_TIME_FIELDS = ("H", "M", "S")
+
+# hh:mm:ss, mm:ss or ss; '.' may be used instead of ':'
+_HHMMSS = re.compile(r"(\d+)(?:[:.](\d+))?(?:[:.](\d+))?")
+
+DateValue = Union[datetime.date, datetime.datetime, datetime.time]
+
+
+def _compile(fmt: str):
+    """(compiled regex, fields) for a strptime-style format; the fields decide the type parsed."""
+    parts = re.split(r"%(.)", fmt)
+    pattern = []
+    for position, part in enumerate(parts):
+        if position % 2 == 0:
+            pattern.append(re.escape(part))
+        elif part in _DIRECTIVES:
+            pattern.append(_DIRECTIVES[part])
+        else:
+            raise ValueError(f"Unsupported directive %{part} in date format {fmt!r}")
+    regex = re.compile("".join(pattern))
+    fields = tuple(field for field in _DATE_FIELDS + _TIME_FIELDS if field in regex.groupindex)
+    if fields not in (_DATE_FIELDS, _TIME_FIELDS, _DATE_FIELDS + _TIME_FIELDS):
+        raise ValueError(f"Date format {fmt!r} needs %Y %m %d, %H %M %S, or all six")
+    return regex, fields
+
+
+class DateParser:
+    """
+    Parser for a fixed set of date / datetime / time formats.
+
+    The format that matched last is tried first, so a run of values in one format costs one
+    regex match each.
+
+    :param formats: strptime-style formats made of %Y %m %d %H %M %S and literal text
+    """
+
+    __slots__ = ("formats", "_patterns", "_last")
+
+    def __init__(self, formats: Sequence[str] = DATE_FORMATS):
+        self.formats = tuple(formats)
+        self._patterns = [_compile(fmt) for fmt in self.formats]
+        self._last = 0
+
+    def parse(self, text: str) -> Optional[DateValue]:
+        """The date, datetime or time `text` is in one of the formats, or None."""
+        patterns = self._patterns
+        value = self._parse(patterns[self._last], text)
+        if value is not None:
+            return value
+        for position, pattern in enumerate(patterns):
+            if position != self._last:
+                value = self._parse(pattern, text)
+                if value is not None:
+                    self._last = position
+                    return value
+        return None
+
+    @staticmethod
+    def _parse(pattern, text):
+        regex, fields = pattern
+        match = regex.fullmatch(text)
+        if match is None:
+            return None
+        numbers = [int(number) for number in match.group(*fields)]
+        try:
+            if fields == _DATE_FIELDS:
+                return datetime.date(*numbers)
+            if fields == _TIME_FIELDS:
+                return datetime.time(*numbers)
+            return datetime.datetime(*numbers)
+        except ValueError:  # e.g. 2024-02-30
+            return None
+
+
+date_parser = DateParser()
+
+
+def is_future(value: Union[datetime.date, datetime.datetime], now: datetime.datetime = None) -> bool:
+    """
+    Whether `value` (taken as UTC; a date is its midnight) is at or after `now`
+    (default: the current UTC time, as a naive datetime).
+    """
+    if now is None:
+        now = datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None)
+    if not isinstance(value, datetime.datetime):
+        value = datetime.datetime(value.year, value.month, value.day)
+    return value >= now
+
+
+def check_date(text: str, future: bool = False, now: datetime.datetime = None,
+               parser: DateParser = date_parser) -> Union[datetime.date, datetime.datetime]:
+    """
+    Return the date / datetime `text` represents, or raise ValidationError
+    ('invalid_date', or 'not_future_date' when `future` is set).
+    """
+    value = parser.parse(text)
+    if future:
+        if value is None or not is_future(value, now):
+            raise ValidationError("not_future_date", "Invalid Future Date: Date must be today or in the future. "
+                                  "(formats allowed: yyyy-mm-dd or yyyy-mm-dd hh:mm:ss)", value=text)
+    elif value is None:
+        raise ValidationError("invalid_date", "Invalid date: (formats allowed: yyyy-mm-dd or yyyy-mm-dd hh:mm:ss)",
+                              value=text)
+    return value
+
+
+def check_time(text: str, as_object: bool = False) -> Union[str, datetime.time]:
+    """
+    Return `text` (hh:mm:ss, mm:ss or ss) normalized to 'hh:mm:ss', or as a datetime.time with
+    `as_object`; raise ValidationError('invalid_time') otherwise. Overflowing fields carry over
+    ('90' is '00:01:30'); only a time object is limited to under 24 hours.
+    """
+    match = _HHMMSS.fullmatch(text)
+    if match is not None:
+        seconds = 0
+        for number in match.groups():
+            if number is not None:
+                seconds = seconds * 60 + int(number)
+        hours, seconds = divmod(seconds, 3600)
+        minutes, seconds = divmod(seconds, 60)
+        if not as_object:
+            return f"{hours:02}:{minutes:02}:{seconds:02}"
+        if hours < 24:
+            return datetime.time(hours, minutes, seconds)
+    raise ValidationError("invalid_time", "Invalid time: {value} (format allowed: hh:mm:ss)", value=text)
+
+
+def validate_dates(values: Iterable[str], validation_type: str = "date", as_object: bool = False) -> Iterator:
+    """
+    Validate a column of 'date', 'future_date' or 'time' values, yielding a
+    ValidationResult(index, input, value, error) per value, in order.
+
+    Each distinct value is parsed once, and 'future_date' compares against one `now` taken
+    when the column starts. Values are stripped, as validate_input does.
+
+    :param as_object: Return date / datetime / time objects instead of the input strings
+    """
+    from .core import ValidationResult
+    if validation_type not in ("date", "future_date", "time"):
+        raise ValueError(f"validate_dates() does not handle validation_type {validation_type!r}")
+    future = validation_type == "future_date"
+    now = datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None)
+    return _validate_column(values, validation_type, future, now, as_object, ValidationResult)
+
+
+def _validate_column(values, validation_type, future, now, as_object, result_type):
+    seen = {}  # stripped input -> (value, error)
+    for index, user_input in enumerate(values):
+        text = user_input.strip()
+        outcome = seen.get(text)
+        if outcome is None:
+            if len(seen) >= DATE_MEMO_SIZE:
+                seen.clear()
+            try:
+                if validation_type == "time":
+                    value = check_time(text, as_object)
+                else:
+                    value = check_date(text, future, now)
+                    if not as_object:
+                        value = text
+            except ValidationError as e:
+                outcome = (None, e)
+            else:
+                outcome = (value, None)
+            seen[text] = outcome
+        yield result_type(index, user_input, *outcome)
+
+
+__all__ = [
+    "DATE_FORMATS",
+    "DATE_MEMO_SIZE",
+    "DateParser",
+    "date_parser",
+    "is_future",
+    "check_date",
+    "check_time",
+    "validate_dates",
+]
@@ -0,0 +1,186 @@
+"""
+askuser.emails
+
+Email validation on top of email_validator, with the DNS part made cheap to skip, cache and
+run concurrently.
+
+- Syntax is checked without any network access (`check_deliverability=False` stops there).
+- Deliverability is a per-domain question, answered by a resolver and kept in a TTL cache,
+  so the thousand addresses of one domain cost one lookup.
+- validate_emails() checks a whole import: syntax first, then every distinct uncached domain
+  concurrently in a thread pool, yielding one ValidationResult per address in input order.
+
+A resolver is any callable `resolver(domain) -> Optional[str]` returning None when the domain
+can receive mail, or the reason it can't. The default, dns_resolver, asks DNS through
+email_validator; tests and offline jobs can pass a stub:
+
+    known = {'example.com'}
+    results = validate_emails(addresses, resolver=lambda d: None if d in known else 'unknown domain')
+"""
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Callable, Dict, Iterable, Iterator, Optional, Tuple
+
+from email_validator import EmailNotValidError, EmailUndeliverableError, validate_email
+from email_validator.deliverability import validate_email_deliverability
+
+from .exceptions import ValidationError
+
+# Seconds a domain's deliverability answer is reused.
+EMAIL_CACHE_TTL = 3600
+# Threads validate_emails resolves domains with.
+EMAIL_WORKERS = 16
+# Addresses validate_emails holds at a time (domains are resolved a chunk at a time).
+EMAIL_CHUNK_SIZE = 10_000
+
+Resolver = Callable[[str], Optional[str]]
+
+_MISSING = object()
+
+
+def dns_resolver(domain: str) -> Optional[str]:
+    """Default resolver: None when DNS says `domain` accepts mail (MX, A or AAAA records), else the reason."""
+    try:
+        validate_email_deliverability(domain, domain)
+    except EmailUndeliverableError as e:
+        return str(e)
+    return None
+
+
+class DomainCache:
+    """
+    Deliverability answers per domain, each kept for `ttl` seconds.
+
+    :param ttl: Seconds an answer is valid
+    :param maxsize: Entries kept; the oldest are dropped beyond that
+    """
+
+    def __init__(self, ttl: float = EMAIL_CACHE_TTL, maxsize: int = 100_000):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries: Dict[str, Tuple[float, Optional[str]]] = {}  # domain -> (expiry, reason)
+        self._lock = threading.Lock()
+
+    def get(self, domain: str, default=None):
+        """The cached reason for `domain` (None = deliverable), or `default` if unknown or expired."""
+        entry = self._entries.get(domain)
+        if entry is None or entry[0] < time.monotonic():
+            return default
+        return entry[1]
+
+    def set(self, domain: str, reason: Optional[str]):
+        with self._lock:
+            entries = self._entries
+            entries.pop(domain, None)
+            if len(entries) >= self.maxsize:
+                del entries[next(iter(entries))]
+            entries[domain] = (time.monotonic() + self.ttl, reason)
+
+    def resolve(self, domain: str, resolver: Resolver) -> Optional[str]:
+        """The reason `domain` can't receive mail (None if it can), asking `resolver` on a miss."""
+        reason = self.get(domain, _MISSING)
+        if reason is _MISSING:
+            reason = resolver(domain)
+            self.set(domain, reason)
+        return reason
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+domain_cache = DomainCache()
+
+
+def check_syntax(address: str) -> Tuple[str, str]:
+    """Return (normalized address, ASCII domain), or raise ValidationError('invalid_email'). No network access."""
+    try:
+        validated = validate_email(address, check_deliverability=False)
+    except EmailNotValidError as e:
+        raise ValidationError("invalid_email", "EmailNotValidError: {value}. {reason}",
+                              value=address, reason=str(e)) from e
+    return validated.normalized, validated.ascii_domain
+
+
+def _undeliverable(address: str, reason: str) -> ValidationError:
+    return ValidationError("undeliverable_email", "EmailUndeliverableError: {value}. {reason}",
+                           value=address, reason=reason)
+
+
+def validate_email_address(address: str, check_deliverability: bool = True, resolver: Resolver = None,
+                           cache: DomainCache = domain_cache) -> str:
+    """
+    Return the normalized address, or raise ValidationError ('invalid_email' / 'undeliverable_email').
+
+    :param check_deliverability: Also check that the domain can receive mail (cached per domain)
+    :param resolver: Deliverability resolver (default: dns_resolver)
+    :param cache: Where deliverability answers are kept (default: the shared domain_cache)
+    """
+    normalized, domain = check_syntax(address)
+    if check_deliverability:
+        reason = cache.resolve(domain, resolver or dns_resolver)
+        if reason is not None:
+            raise _undeliverable(address, reason)
+    return normalized
+
+
+def validate_emails(addresses: Iterable[str], check_deliverability: bool = True, resolver: Resolver = None,
+                    cache: DomainCache = domain_cache, max_workers: int = EMAIL_WORKERS) -> Iterator:
+    """
+    Validate many addresses, yielding a ValidationResult(index, input, value, error) per address,
+    in input order. Distinct domains missing from `cache` are resolved concurrently, `max_workers`
+    at a time, EMAIL_CHUNK_SIZE addresses at a time.
+    """
+    from .core import ValidationResult
+    resolver = resolver or dns_resolver
+    addresses = iter(addresses)
+    index = 0
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        while True:
+            chunk = list(islice(addresses, EMAIL_CHUNK_SIZE))
+            if not chunk:
+                return
+            checked = []  # (address, normalized, domain) or (address, None, error)
+            for address in chunk:
+                try:
+                    checked.append((address, *check_syntax(address)))
+                except ValidationError as e:
+                    checked.append((address, None, e))
+
+            answers = {}  # domain -> reason it can't receive mail (None: it can)
+            if check_deliverability:
+                unknown = []
+                for domain in {domain for _, normalized, domain in checked if normalized is not None}:
+                    reason = cache.get(domain, _MISSING)
+                    if reason is _MISSING:
+                        unknown.append(domain)
+                    else:
+                        answers[domain] = reason
+                for domain, reason in zip(unknown, pool.map(resolver, unknown)):
+                    cache.set(domain, reason)
+                    answers[domain] = reason
+
+            for address, normalized, domain in checked:
+                if normalized is None:
+                    yield ValidationResult(index, address, error=domain)
+                elif answers.get(domain) is None:
+                    yield ValidationResult(index, address, normalized)
+                else:
+                    yield ValidationResult(index, address, error=_undeliverable(address, answers[domain]))
+                index += 1
+
+
+__all__ = [
+    "EMAIL_CACHE_TTL",
+    "DomainCache",
+    "domain_cache",
+    "dns_resolver",
+    "check_syntax",
+    "validate_email_address",
+    "validate_emails",
+]
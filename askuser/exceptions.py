@@ -0,0 +1,96 @@
+"""
+askuser.exceptions
+
+Exceptions raised by AskUser validators (and by scripted answers, see askuser.answers).
+
+Validators don't print anything: they raise ValidationError and the interactive layer
+(validate_input and friends) decides whether to show the message. The message is only
+formatted when it is actually read, so bulk / background callers that just check
+`error.code` never pay for string formatting (e.g. of a long expected_inputs list).
+"""
+
+
+class ValidationError(ValueError):
+    """
+    Invalid user input.
+
+    Attributes:
+        code: Short machine-readable reason, e.g. 'not_int', 'too_large', 'not_expected'.
+        template: str.format template of the human-readable message.
+        params: Values referenced by the template (`value` is the rejected input).
+
+    It is a ValueError, so existing `except ValueError` handlers keep working.
+
+    Example:
+        try:
+            is_valid_int("abc")
+        except ValidationError as e:
+            e.code     # 'not_int'
+            str(e)     # 'Error: Integer values only.'
+    """
+
+    def __init__(self, code: str, template: str, **params):
+        super().__init__(code, template)
+        self.code = code
+        self.template = template
+        self.params = params
+
+    @property
+    def message(self) -> str:
+        return self.template.format(**self.params)
+
+    def __str__(self):
+        return self.message
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.code!r})"
+
+    def __reduce__(self):
+        return type(self), (self.code, self.template), {"params": self.params}
+
+
+class MaxAttemptsExceeded(ValidationError):
+    """
+    Raised by validate_input(..., max_attempts=n) after n invalid entries in a row.
+
+    Attributes:
+        attempts: Number of invalid entries.
+        last_error: The exception raised for the last one (also chained as __cause__).
+    """
+
+    def __init__(self, attempts: int, last_error: Exception):
+        super().__init__("max_attempts", "Gave up after {attempts} invalid attempts. Last error: {last_error}",
+                         attempts=attempts, last_error=last_error)
+        self.attempts = attempts
+        self.last_error = last_error
+
+    def __reduce__(self):
+        return type(self), (self.attempts, self.last_error)
+
+
+class AnswerError(Exception):
+    """
+    A scripted answer (see askuser.answers) is missing or was rejected by its prompt.
+
+    Attributes:
+        prompt: The prompt being answered.
+        answer: The rejected answer, or None when there was no answer for the prompt.
+        error: The exception the answer was rejected with (also chained as __cause__), or None.
+    """
+
+    def __init__(self, prompt: str, answer: str = None, error: Exception = None, detail: str = None):
+        if error is not None:
+            message = f"Scripted answer {answer!r} to {prompt!r} was rejected: {error}"
+        else:
+            message = f"No scripted answer for {prompt!r}" + (f": {detail}" if detail else "")
+        super().__init__(message)
+        self.prompt = prompt
+        self.answer = answer
+        self.error = error
+
+
+__all__ = [
+    "ValidationError",
+    "MaxAttemptsExceeded",
+    "AnswerError",
+]
@@ -0,0 +1,103 @@
+"""
+askuser.languages
+
+Compact ISO 639-1 language index used by the `language` validator.
+
+The index is a small tab-separated file shipped with the package (`data/iso639_1.tsv`),
+one row per language that has an ISO 639-1 code:
+
+    alpha_2 <TAB> alpha_3 <TAB> English name <TAB> aliases separated by "|"
+
+It is read once, on first lookup, into a single casefolded `{key: row}` dict, so validating
+a language is an O(1) dict hit and never imports pycountry (or loads its JSON database).
+
+pycountry is only needed to regenerate the file after a pycountry upgrade:
+
+    python -m askuser.languages > askuser/data/iso639_1.tsv
+"""
+
+from __future__ import annotations
+
+import pkgutil
+from functools import lru_cache
+from typing import NamedTuple, Optional
+
+DATA_FILE = "data/iso639_1.tsv"
+
+# Optional pycountry fields that are also accepted as spellings of a language
+ALIAS_FIELDS = ("bibliographic", "common_name", "inverted_name")
+
+
+class Language(NamedTuple):
+    alpha_2: str
+    alpha_3: str
+    name: str
+
+
+@lru_cache(maxsize=None)
+def language_index() -> dict[str, Language]:
+    """
+    Load the packed table and return the casefolded lookup index.
+
+    Keys are alpha_2 codes, alpha_3 codes, English names and aliases. When two spellings
+    collide, the more specific one wins: alpha_2, then name, then alpha_3, then aliases.
+    """
+    rows = pkgutil.get_data(__package__, DATA_FILE).decode("utf-8").splitlines()
+    by_alpha_2, by_name, by_alpha_3, by_alias = {}, {}, {}, {}
+    for row in rows:
+        if not row or row.startswith("#"):
+            continue
+        alpha_2, alpha_3, name, aliases = row.split("\t")
+        lang = Language(alpha_2, alpha_3, name)
+        by_alpha_2[alpha_2.casefold()] = lang
+        by_name[name.casefold()] = lang
+        by_alpha_3[alpha_3.casefold()] = lang
+        for alias in filter(None, aliases.split("|")):
+            by_alias[alias.casefold()] = lang
+    return {**by_alias, **by_alpha_3, **by_name, **by_alpha_2}
+
+
+def lookup_language(language: str) -> Optional[Language]:
+    """
+    Return the Language for an ISO 639-1/639-2 code, English name or alias, or None.
+    Matching is case-insensitive and ignores surrounding whitespace.
+
+    Example:
+        >>> lookup_language("EN")
+        Language(alpha_2='en', alpha_3='eng', name='English')
+        >>> lookup_language("german").alpha_2
+        'de'
+    """
+    return language_index().get(language.strip().casefold())
+
+
+def build_language_table() -> str:
+    """Render the packed table from pycountry (maintainers only; see module docstring)."""
+    import pycountry
+
+    lines = [f"# ISO 639-1 languages, generated from pycountry {_pycountry_version()}."
+             f" Regenerate with: python -m askuser.languages"]
+    for lang in sorted(pycountry.languages, key=lambda lg: getattr(lg, "alpha_2", "")):
+        if not hasattr(lang, "alpha_2"):
+            continue
+        aliases = "|".join(getattr(lang, f) for f in ALIAS_FIELDS if hasattr(lang, f))
+        lines.append("\t".join((lang.alpha_2, lang.alpha_3, lang.name, aliases)))
+    return "\n".join(lines) + "\n"
+
+
+def _pycountry_version() -> str:
+    from importlib.metadata import version
+
+    return version("pycountry")
+
+
+__all__ = [
+    "Language",
+    "language_index",
+    "lookup_language",
+    "build_language_table",
+]
+
+
+if __name__ == "__main__":
+    print(build_language_table(), end="")
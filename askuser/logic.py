@@ -1,32 +1,85 @@
 import re
+from contextlib import contextmanager
+from contextvars import ContextVar
 from decimal import Decimal, InvalidOperation
-from typing import List
+from functools import lru_cache
+from itertools import islice
+from typing import List, Pattern, Union
 
-from colorfulPyPrint.py_color import print_error, print_exception, print_magenta, print_info
-from datetimeops.datetime_utils import validate_date, hhmmss_check
+from colorfulPyPrint.py_color import print_error, print_magenta, print_info
 from string_list import list_from_string, string_from_list, str_enumerate
 
+from .dates import check_date, check_time
+from .exceptions import ValidationError
+from .languages import lookup_language
+from .membership import BloomFilter, ChoiceSet, as_casefold_set
+from .urls import normalize_url
+
+# Distinct 'regex' / 'custom_chars' patterns kept compiled (re's own cache holds far fewer)
+REGEX_CACHE_SIZE = 256
+# Longer expected_inputs are summarized in error messages (count and the first few values)
+ERROR_SAMPLE_SIZE = 10
+
+# Validators never print errors (they raise ValidationError), but a few echo what they
+# normalized the input to, e.g. "Slug: hello-world". Those notices can be turned off.
+_notices_enabled = ContextVar("askuser_notices_enabled", default=True)
+
+
+@contextmanager
+def quiet():
+    """
+    Suppress the informational notices of validators (slug / language echo, email clean-up)
+    inside the block. validate_many runs every validator this way.
+
+    Example:
+        with quiet():
+            slug = is_valid_slug(title)
+    """
+    token = _notices_enabled.set(False)
+    try:
+        yield
+    finally:
+        _notices_enabled.reset(token)
+
+
+def _not_expected(user_input, expected_inputs) -> ValidationError:
+    """The 'not_expected' error; only the first ERROR_SAMPLE_SIZE values are listed for long collections."""
+    count = len(expected_inputs) if hasattr(expected_inputs, '__len__') else 0
+    if count > ERROR_SAMPLE_SIZE:
+        return ValidationError("not_expected", "Error: expected one of {count} values, e.g. {sample}",
+                               value=user_input, expected_inputs=expected_inputs, count=count,
+                               sample=list(islice(expected_inputs, ERROR_SAMPLE_SIZE)))
+    return ValidationError("not_expected", "Error: expected {expected_inputs}",
+                           value=user_input, expected_inputs=expected_inputs)
+
 
 def is_valid_custom(user_input: str, expected_inputs: list) -> str:
+    # Any container works; pass a set / ChoiceSet (see askuser.membership) for O(1) checks.
     if user_input in expected_inputs:
         return user_input
     else:
-        print_error(f"Error: expected {expected_inputs}")
-        raise ValueError(f"{user_input} is not in {expected_inputs}")
+        raise _not_expected(user_input, expected_inputs)
 
 
 def is_not_in(user_input: str, not_in: list) -> str:
-    not_in = [n.lower() for n in not_in]
-    if user_input.lower() not in not_in:
+    # Case-insensitive. A CasefoldSet / BloomFilter is used as-is; a list is casefolded per call.
+    not_in = as_casefold_set(not_in)
+    if user_input not in not_in:
         return user_input
+    elif isinstance(not_in, BloomFilter) or len(not_in) > ERROR_SAMPLE_SIZE:
+        # Long collections aren't listed: the message would cost more than the lookup saved.
+        raise ValidationError("already_exists", "Error: Value already exists.", value=user_input, not_in=not_in)
     else:
-        print_error(f"Error: Value already exists in {not_in}")
-        raise ValueError(f"{user_input} can not be in {not_in}")
+        raise ValidationError("already_exists", "Error: Value already exists in {not_in}",
+                              value=user_input, not_in=not_in)
+
+
+_YES_NO = ChoiceSet(['y', 'n'])
 
 
 def is_yes_no(user_input: str) -> str:
     user_input = user_input.strip().lower()
-    return is_valid_custom(user_input, ['y', 'n'])
+    return is_valid_custom(user_input, _YES_NO)
 
 
 def none_if_blank(user_input: str):
@@ -38,55 +91,45 @@ optional = none_if_blank
 
 def is_not_blank(user_input: str, expected_inputs: List[str] = None) -> str:
     if len(user_input) == 0:
-        print_error("Error: Can not be blank.")
-        raise ValueError(f"Can not be blank")
+        raise ValidationError("blank", "Error: Can not be blank.", value=user_input)
     if expected_inputs is not None:
         if str(user_input) not in expected_inputs:
-            print_error(f"Error: expected {expected_inputs}")
-            raise ValueError(f"{user_input} is not in {expected_inputs}")
+            raise _not_expected(user_input, expected_inputs)
     try:
         return str(user_input)
     except Exception:
-        print_error("Error: String values only.")
-        raise ValueError(f"{user_input} is not valid string")
+        raise ValidationError("not_string", "Error: String values only.", value=user_input)
+
+
+def _check_number(user_input, value, expected_inputs, maximum, minimum):
+    """Shared expected_inputs / maximum / minimum checks of the numeric validators."""
+    if expected_inputs is not None and value not in expected_inputs:
+        raise _not_expected(user_input, expected_inputs)
+    if maximum is not None and value > maximum:
+        raise ValidationError("too_large", "Error: {value} is greater than {maximum}",
+                              value=user_input, maximum=maximum)
+    if minimum is not None and value < minimum:
+        raise ValidationError("too_small", "Error: {value} is less than {minimum}",
+                              value=user_input, minimum=minimum)
+    return value
 
 
 def is_valid_int(user_input: str, expected_inputs: List[int] = None,
                  maximum: int = None, minimum: int = None) -> int:
-    if expected_inputs is not None:
-        if int(user_input) not in expected_inputs:
-            print_error(f"Error: expected {expected_inputs}")
-            raise ValueError(f"{user_input} is not in {expected_inputs}")
-    if maximum is not None and int(user_input) > maximum:
-        print_error(f"Error: {user_input} is greater than {maximum}")
-        raise ValueError(f"{user_input} has to be less than {maximum}")
-    if minimum is not None and int(user_input) < minimum:
-        print_error(f"Error: {user_input} is less than {minimum}")
-        raise ValueError(f"{user_input} has to be more than {minimum}")
     try:
-        return int(user_input)
-    except Exception:
-        print_error("Error: Integer values only.")
-        raise ValueError(f"{user_input} is not valid integer")
+        value = int(user_input)
+    except (TypeError, ValueError):
+        raise ValidationError("not_int", "Error: Integer values only.", value=user_input) from None
+    return _check_number(user_input, value, expected_inputs, maximum, minimum)
 
 
 def is_valid_float(user_input: str, expected_inputs: List[float] = None,
                    maximum: float = None, minimum: float = None) -> float:
-    if expected_inputs is not None:
-        if float(user_input) not in expected_inputs:
-            print_error(f"Error: expected {expected_inputs}")
-            raise ValueError(f"{user_input} is not in {expected_inputs}")
-    if maximum is not None and float(user_input) > maximum:
-        print_error(f"Error: {user_input} is greater than {maximum}")
-        raise ValueError(f"{user_input} has to be less than {maximum}")
-    if minimum is not None and float(user_input) < minimum:
-        print_error(f"Error: {user_input} is less than {minimum}")
-        raise ValueError(f"{user_input} has to be more than {minimum}")
     try:
-        return float(user_input)
-    except Exception:
-        print_error("Error: Float values only.")
-        raise ValueError(f"{user_input} is not valid float")
+        value = float(user_input)
+    except (TypeError, ValueError):
+        raise ValidationError("not_float", "Error: Float values only.", value=user_input) from None
+    return _check_number(user_input, value, expected_inputs, maximum, minimum)
 
 
 def is_valid_decimal(
@@ -97,109 +140,120 @@ def is_valid_decimal(
 ) -> Decimal:
     try:
         value = Decimal(user_input)
-    except (InvalidOperation, ValueError):
-        print_error("Error: Decimal values only.")
-        raise ValueError(f"{user_input} is not valid decimal")
-
-    if expected_inputs is not None:
-        if value not in expected_inputs:
-            print_error(f"Error: expected {expected_inputs}")
-            raise ValueError(f"{user_input} is not in {expected_inputs}")
-
-    if maximum is not None and value > maximum:
-        print_error(f"Error: {user_input} is greater than {maximum}")
-        raise ValueError(f"{user_input} has to be less than {maximum}")
-
-    if minimum is not None and value < minimum:
-        print_error(f"Error: {user_input} is less than {minimum}")
-        raise ValueError(f"{user_input} has to be more than {minimum}")
-
-    return value
+    except (InvalidOperation, TypeError, ValueError):
+        raise ValidationError("not_decimal", "Error: Decimal values only.", value=user_input) from None
+    return _check_number(user_input, value, expected_inputs, maximum, minimum)
 
 
 def is_valid_alpha(user_input: str) -> str:
     if user_input.isalpha():
         return user_input
     else:
-        print_error("Error: Alphabets only [A-Z]")
-        raise ValueError(f"{user_input} is not valid alpha value")
+        raise ValidationError("not_alpha", "Error: Alphabets only [A-Z]", value=user_input)
 
 
 def is_valid_alphanum(user_input: str) -> str:
     if user_input.isalnum():
         return user_input
     else:
-        print_error("Error: Alphanumeric values only [A-Z0-9]")
-        raise ValueError(f"{user_input} is not valid alphanumeric value")
+        raise ValidationError("not_alphanum", "Error: Alphanumeric values only [A-Z0-9]", value=user_input)
 
 
-def is_valid_regex(user_input: str, allowed_regex: str) -> str:
-    if re.match(rf'{allowed_regex}', user_input):
-        return user_input
-    else:
-        print_error(f"Error: Allowed regex: {allowed_regex}")
-        raise ValueError(f"{user_input} has invalid format (allowed regex: {allowed_regex})")
+@lru_cache(maxsize=REGEX_CACHE_SIZE)
+def compile_pattern(pattern: Union[str, Pattern]) -> Pattern:
+    """
+    re.compile with a bounded LRU cache for 'regex' / 'custom_chars' validation.
+
+    Unlike re's small internal cache, this one is sized for dozens of patterns used in loops
+    and reports its hit/miss stats: `compile_pattern.cache_info()`.
+    """
+    return re.compile(pattern)
+
+
+class RegexValidator:
+    """
+    Reusable 'regex' validator: the pattern is compiled once (via compile_pattern) and each
+    call is a single `match`. Behaves like is_valid_regex(user_input, allowed_regex).
+
+    Example:
+        is_sku = RegexValidator(r'^SKU-[0-9]{7}$')
+        is_sku('SKU-0001234')  # 'SKU-0001234'
+    """
+    __slots__ = ('pattern', '_match')
+
+    def __init__(self, allowed_regex: Union[str, Pattern]):
+        compiled = compile_pattern(allowed_regex)
+        self.pattern = compiled.pattern
+        self._match = compiled.match
+
+    def __call__(self, user_input: str) -> str:
+        if self._match(user_input):
+            return user_input
+        raise ValidationError("regex_mismatch", "Error: Allowed regex: {allowed_regex}",
+                              value=user_input, allowed_regex=self.pattern)
+
+
+class CharsValidator:
+    """
+    Reusable 'custom_chars' validator: the character class is built and compiled once.
+    Behaves like is_valid_char(user_input, allowed_chars).
+    """
+    __slots__ = ('char_class', '_match')
+
+    def __init__(self, allowed_chars: str):
+        self.char_class = f'[{allowed_chars}]'.replace('[[', '[').replace(']]', ']')
+        self._match = compile_pattern(f'^{self.char_class}+$').match
+
+    def __call__(self, user_input: str) -> str:
+        if self._match(user_input):
+            return user_input
+        raise ValidationError("invalid_chars", "Error: Allowed chars: {allowed_chars}",
+                              value=user_input, allowed_chars=self.char_class)
+
+
+def is_valid_regex(user_input: str, allowed_regex: Union[str, Pattern]) -> str:
+    return RegexValidator(allowed_regex)(user_input)
 
 
 def is_valid_char(user_input: str, allowed_char_regex: str) -> str:
-    allowed_char_regex = f'[{allowed_char_regex}]'.replace('[[', '[').replace(']]', ']')
-    if re.match(rf'^{allowed_char_regex}+$', user_input):
-        return user_input
-    else:
-        print_error(f"Error: Allowed chars: {allowed_char_regex}")
-        raise ValueError(f"{user_input} has invalid characters (allowed chars: {allowed_char_regex})")
+    return CharsValidator(allowed_char_regex)(user_input)
 
 
 # noinspection PyPep8Naming
 def get_language_ISO_639_1(language):
-    import pycountry
-    if len(language) == 2:
-        k = pycountry.languages.get(alpha_2=language)
-    else:
-        k = pycountry.languages.get(name=language)
+    k = lookup_language(language)
     if k is None:
-        raise ValueError(f"Incorrect Language '{language}' - see https://en.wikipedia.org/wiki/List_of_ISO_639-1_codes")
+        raise ValidationError("unknown_language", "Incorrect Language '{value}' - "
+                              "see https://en.wikipedia.org/wiki/List_of_ISO_639-1_codes", value=language)
     else:
-        print_magenta(f'{k.alpha_2}: {k.name}')
+        if _notices_enabled.get():
+            print_magenta(f'{k.alpha_2}: {k.name}')
         return k.alpha_2
 
 
 def is_valid_language(user_input: str) -> str:
     res = []
-    try:
-        for lang in list_from_string(user_input):
-            if get_language_ISO_639_1(lang):
-                res.append(lang)
-        return string_from_list(res)
-    except ValueError as e:
-        print_exception(e)
-        raise e
-
-
-def is_valid_date(user_input: str) -> str:
-    if validate_date(user_input) is False and validate_date(user_input, fmt="%Y-%m-%d") is False:
-        print_error("Invalid date: (formats allowed: yyyy-mm-dd or yyyy-mm-dd hh:mm:ss)")
-        raise ValueError(f"Invalid date: {user_input}")
-    else:
-        return user_input
+    for lang in list_from_string(user_input):
+        if get_language_ISO_639_1(lang):
+            res.append(lang)
+    return string_from_list(res)
 
 
-def is_valid_date_future(user_input: str) -> str:
-    if validate_date(user_input, chk_future_date=True) is False and \
-            validate_date(user_input, fmt="%Y-%m-%d", chk_future_date=True) is False:
-        print_error("Invalid Future Date: Date must be today or in the future. "
-                    "(formats allowed: yyyy-mm-dd or yyyy-mm-dd hh:mm:ss)")
-        raise ValueError(f"Invalid future date: {user_input}")
-    else:
-        return user_input
+def is_valid_date(user_input: str, as_object=False):
+    """yyyy-mm-dd or yyyy-mm-dd hh:mm:ss; with as_object, the parsed date / datetime is returned."""
+    value = check_date(user_input)
+    return value if as_object else user_input
 
 
-def is_valid_time(user_input: str) -> str:
-    try:
-        return hhmmss_check(user_input)
-    except Exception as e:
-        print_error(f"Invalid time: {user_input} (format allowed: hh:mm:ss)")
-        raise e
+def is_valid_date_future(user_input: str, as_object=False):
+    """Like is_valid_date, for a date (taken as UTC) that is now or later."""
+    value = check_date(user_input, future=True)
+    return value if as_object else user_input
+
+
+def is_valid_time(user_input: str, as_object=False):
+    """hh:mm:ss (or mm:ss / ss), normalized to 'hh:mm:ss'; with as_object, a datetime.time."""
+    return check_time(user_input, as_object)
 
 
 def is_url(user_input: str, ignore_subdomain_check=True, http_protocol_required=False) -> str:
@@ -230,66 +284,44 @@ def is_url(user_input: str, ignore_subdomain_check=True, http_protocol_required=
         >> is_url('subdomain.example.com/path?query=1')
         'subdomain.example.com/path?query=1'
 
+        >> is_url('HTTPS://api.eu.Example.co.uk:8443/v1#top')
+        'https://api.eu.example.co.uk:8443/v1#top'
+
         >> is_valid_ms_domain('subdomain.watchmyfilm.com')
         raises ValueError if the domain is not in the allowed list.
 
         >>> is_url('example.com', http_protocol_required=True)
-        Please specify the protocol ('http://' or 'https://'): https://
+        URL requires a protocol. Choose (0: https / 1: http) 0
         'https://example.com'
-    """
 
-    # Check and remove the protocol (http:// or https://) if it exists
-    protocols = ('https://', 'http://')
-    protocol = ''
-
-    # Check and remove the protocol if it exists
-    for proto in protocols:
-        if user_input.startswith(proto):
-            user_input = user_input[len(proto):]
-            protocol = proto
-            break
+    For batch use (no prompt, a protocol policy instead) see askuser.urls.normalize_urls.
+    """
 
     try:
-        # Splitting user_input into subdomain, domain and TLD
-        try:
-            subdomain, domain, tld = user_input.split('.')
-        except ValueError as e:
-            if ignore_subdomain_check:
-                subdomain = ''
-                domain, tld = user_input.split('.')
-            else:
-                raise e
-
-        # Further splitting TLD into path and query parameters
-        if '/' in tld:
-            tld, path = tld.split('/', 1)
-            path = '/' + path
-        else:
-            path = ''
-
-        if '?' in path:
-            path, queries = path.split('?', 1)
-            queries = '?' + queries
-        else:
-            queries = ''
-    except Exception as e:
-        print_error(f"Incorrect URL format: {user_input}. "
-                    f"Expected format like: 'www.watchmyfilm.com' / 'yiff.festivalsaints.com' / etc.")
-        raise e
-
-    # If no protocol was found and protocol_required is True, prompt user for a protocol
-    if http_protocol_required and not protocol:
-        enum_protocols = str_enumerate(list(protocols))
-        while (pr := input("URL requires a protocol. Choose (0: https / 1: http) ")) not in enum_protocols.keys():
-            print_error(f"Expected {list(enum_protocols.keys())}")
-        protocol = enum_protocols[pr]
-
-    # Return the formatted URL with the chosen or existing protocol
-    return f"{protocol}{subdomain.lower()}.{domain.lower()}.{tld.lower()}{path}{queries}"
-
-
-def is_valid_email(user_input: str, clean_up_email=False) -> str:
-    from email_validator import validate_email, EmailNotValidError, EmailUndeliverableError
+        return normalize_url(user_input, protocol="require" if http_protocol_required else "keep",
+                             require_subdomain=not ignore_subdomain_check)
+    except ValidationError as e:
+        if e.code != "missing_protocol":
+            raise
+
+    # No protocol given but one is required: ask for it (normalize_urls applies a policy instead)
+    from . import core  # read through core._read_input, like every other prompt
+    from .answers import reject_answer
+    enum_protocols = str_enumerate(['https', 'http'])
+    protocol_msg = "URL requires a protocol. Choose (0: https / 1: http) "
+    while (pr := core._read_input(protocol_msg)) not in enum_protocols:
+        error = ValidationError("not_expected", "Expected {expected}", value=pr, expected=list(enum_protocols.keys()))
+        reject_answer(protocol_msg, pr, error)
+        print_error(error.message)
+    return normalize_url(user_input, protocol=enum_protocols[pr], require_subdomain=not ignore_subdomain_check)
+
+
+def is_valid_email(user_input: str, clean_up_email=False, check_deliverability=True) -> str:
+    """
+    Return the normalized email address. With check_deliverability=False only the syntax is
+    checked (no DNS); otherwise the domain's answer is cached (see askuser.emails).
+    """
+    from .emails import validate_email_address  # email_validator is only imported when needed
     common_tlds = ['com', 'org', 'net', 'edu', 'de', 'fr']
 
     def clean_domain(email: str) -> str:
@@ -301,22 +333,19 @@ def is_valid_email(user_input: str, clean_up_email=False) -> str:
         return f"{email_part}@{clean_domain_name}"
 
     try:
-        return validate_email(user_input)['email']
-    except EmailUndeliverableError as e:
-        if clean_up_email and 'The domain name' in e.args[0]:
-            cleaned_email = clean_domain(user_input)
+        return validate_email_address(user_input, check_deliverability)
+    except ValidationError as e:
+        if not (clean_up_email and e.code == "undeliverable_email" and 'The domain name' in e.params["reason"]):
+            raise
+        cleaned_email = clean_domain(user_input)
+        if _notices_enabled.get():
             print_info(f"Trying with cleaned domain: {cleaned_email}")
-            try:
-                return validate_email(cleaned_email)['email']
-            except EmailUndeliverableError as e:
-                print_error(f"EmailUndeliverableError: {cleaned_email}. {str(e)}")
-                raise EmailUndeliverableError(f"EmailUndeliverableError: {user_input}. {str(e)}")
-        else:
-            print_error(f"EmailUndeliverableError: {user_input}. {str(e)}")
-            raise EmailUndeliverableError(f"EmailUndeliverableError: {user_input}. {str(e)}")
-    except EmailNotValidError as e:
-        print_error(f"EmailNotValidError: {user_input}. {str(e)}")
-        raise EmailNotValidError(f"EmailNotValidError: {user_input}. {str(e)}")
+        try:
+            return validate_email_address(cleaned_email, check_deliverability)
+        except ValidationError as cleaned_error:
+            raise ValidationError("undeliverable_email", "EmailUndeliverableError: {email}. {reason}",
+                                  value=user_input, email=cleaned_email,
+                                  reason=cleaned_error.params["reason"]) from cleaned_error
 
 
 def is_valid_phone(user_input: str) -> str:
@@ -324,8 +353,8 @@ def is_valid_phone(user_input: str) -> str:
     if re.match(r'^\+?\d+$', user_input):
         return user_input
     else:
-        print_error(f"Invalid Phone: Should be in the format +91 0123456789")
-        raise ValueError(f"Invalid Phone {user_input}: Should be in the format +910123456789)")
+        raise ValidationError("invalid_phone", "Invalid Phone: Should be in the format +91 0123456789",
+                              value=user_input)
 
 
 def is_valid_slug(user_input: str, delimiter='-') -> str:
@@ -349,11 +378,13 @@ def is_valid_slug(user_input: str, delimiter='-') -> str:
     # Ensure only alphanumeric characters and the delimiter remain
     slug = re.sub(rf'[^{delimiter}a-zA-Z0-9]', '', slug).lower()
 
-    print_magenta(f"Slug: {slug}")
+    if _notices_enabled.get():
+        print_magenta(f"Slug: {slug}")
     return slug
 
 
 __all__ = [
+    "quiet",
     "is_valid_custom",
     "is_not_in",
     "is_yes_no",
@@ -366,6 +397,9 @@ __all__ = [
     "is_valid_alphanum",
     "is_valid_regex",
     "is_valid_char",
+    "compile_pattern",
+    "RegexValidator",
+    "CharsValidator",
     "get_language_ISO_639_1",
     "is_valid_language",
     "is_valid_date",
@@ -0,0 +1,173 @@
+"""
+askuser.membership
+
+Constant-time membership tests for the 'custom' and 'not_in' validators.
+
+`expected_inputs` and `not_in` are usually plain lists, so checking a value against them is a
+linear scan, and `not_in` is compared case-insensitively, which meant re-lowercasing the whole
+list on every check. validate_input now converts them once per prompt. To avoid even that
+conversion when the same large collection is used for many prompts, build it once yourself:
+
+    taken = CasefoldSet(existing_slugs)          # exact, case-insensitive
+    taken = BloomFilter(existing_slugs)          # ~1.5 bytes per value, rare false "exists"
+    slug = validate_input("Slug:", "not_in", not_in=taken)
+
+A frozenset passed as `not_in` is converted once and the result cached for later prompts.
+"""
+from functools import lru_cache
+from math import ceil, log
+
+# How many distinct frozensets as_casefold_set keeps a converted CasefoldSet for.
+CASEFOLD_CACHE_SIZE = 8
+
+_LN2 = log(2)
+
+
+class ChoiceSet:
+    """
+    Insertion-ordered set of allowed values with O(1) `in`.
+
+    Shown as a list, so error messages read the same as when a list was given
+    ("Error: expected ['usd', 'eur']"). Values must be hashable.
+    """
+
+    __slots__ = ("_index",)
+
+    def __init__(self, values=()):
+        self._index = {value: position for position, value in enumerate(values)}
+
+    def position(self, value) -> int:
+        """Position of `value` in the values given (the last one, for repeated values); KeyError if absent."""
+        return self._index[value]
+
+    def __contains__(self, value):
+        try:
+            return value in self._index
+        except TypeError:  # unhashable probe can't be a member
+            return False
+
+    def __iter__(self):
+        return iter(self._index)
+
+    def __len__(self):
+        return len(self._index)
+
+    def __repr__(self):
+        return repr(list(self._index))
+
+
+class CasefoldSet(ChoiceSet):
+    """
+    ChoiceSet compared case-insensitively: values are casefolded once when the set is built,
+    and each probe is casefolded before the lookup.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, values=()):
+        super().__init__(str(value).casefold() for value in values)
+
+    def __contains__(self, value):
+        return str(value).casefold() in self._index
+
+
+class BloomFilter:
+    """
+    Compact, case-insensitive probabilistic set for very large `not_in` collections.
+
+    `value in bloom` is never False for an added value, and is wrongly True for at most about
+    `error_rate` of the other values, i.e. a new value is occasionally reported as already
+    existing. It uses about 1.44 * log2(1 / error_rate) bits per value (1.8 bytes at 0.1%),
+    against tens of bytes per value for a set of strings.
+
+    Positions are derived from the built-in `hash()` (double hashing), which is salted per
+    process: a filter is only meaningful in the process that built it.
+
+    :param values: Values to add
+    :param capacity: Expected number of values (default: len(values)); more can be added at a
+                     higher error rate
+    :param error_rate: Target false positive rate
+    """
+
+    __slots__ = ("_bits", "_size", "_hashes", "count")
+
+    def __init__(self, values=(), capacity: int = None, error_rate: float = 0.001):
+        if not 0 < error_rate < 1:
+            raise ValueError("error_rate must be between 0 and 1")
+        if capacity is None:
+            if not hasattr(values, "__len__"):
+                values = list(values)
+            capacity = len(values)
+        capacity = max(1, capacity)
+        size = ceil(-capacity * log(error_rate) / (_LN2 * _LN2))
+        self._hashes = max(1, round(size / capacity * _LN2))
+        self._size = max(64, size)  # tiny filters would mostly collide on the same few bits
+        self._bits = bytearray((self._size + 7) // 8)
+        self.count = 0
+        for value in values:
+            self.add(value)
+
+    def _positions(self, value):
+        h = hash(str(value).casefold())
+        h1, h2 = h & 0xFFFFFFFF, (h >> 32) & 0xFFFFFFFF | 1
+        return range(h1, h1 + self._hashes * h2, h2)  # taken modulo _size by the caller
+
+    def add(self, value):
+        bits, size = self._bits, self._size
+        for pos in self._positions(value):
+            pos %= size
+            bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def __contains__(self, value):
+        bits, size = self._bits, self._size
+        for pos in self._positions(value):
+            pos %= size
+            if not bits[pos >> 3] & (1 << (pos & 7)):
+                return False
+        return True
+
+    def __len__(self):
+        return self.count
+
+    def __repr__(self):
+        return f"<BloomFilter of {self.count} values>"
+
+
+@lru_cache(maxsize=CASEFOLD_CACHE_SIZE)
+def _cached_casefold_set(values: frozenset) -> CasefoldSet:
+    return CasefoldSet(values)
+
+
+def as_casefold_set(values):
+    """
+    Return `values` in a form with O(1), case-insensitive `in`: CasefoldSet and BloomFilter are
+    used as they are, frozensets are converted once (cached), anything else is converted.
+    """
+    if isinstance(values, (CasefoldSet, BloomFilter)):
+        return values
+    if isinstance(values, frozenset):
+        return _cached_casefold_set(values)
+    return CasefoldSet(values)
+
+
+def as_choice_set(values):
+    """
+    Return `values` in a form with O(1) `in` for 'custom' validation: sets, dicts and ChoiceSets
+    are used as they are, other iterables are converted (or kept when a value isn't hashable).
+    """
+    if isinstance(values, (ChoiceSet, set, frozenset, dict)):
+        return values
+    try:
+        return ChoiceSet(values)
+    except TypeError:
+        return values
+
+
+__all__ = [
+    "ChoiceSet",
+    "CasefoldSet",
+    "BloomFilter",
+    "as_casefold_set",
+    "as_choice_set",
+]
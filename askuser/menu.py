@@ -0,0 +1,463 @@
+"""
+askuser.menu
+
+Menu: an option menu built once and shown / asked any number of times.
+
+validate_user_option and friends build a Menu per call. A CLI that shows the same menu over
+and over can build it once instead: the option keys and values are stored in tuples, the menu
+key -> option index is a dict (O(1) resolution), labels are formatted when first displayed, and
+the layout is computed on the first display and reused.
+
+Menus are drawn by a MenuRenderer, which builds the whole frame in one string and writes it
+with a single write() to its stream (stdout by default). Keys are colored only when the stream
+is a terminal, and long menus are laid out to the terminal width. set_menu_renderer() replaces
+the renderer used by every menu.
+
+    main_menu = Menu({'a': 'Add', 'l': 'List', 'q': 'quit'})
+    while (key := main_menu.choose("Option:")) != 'q':
+        ...
+"""
+import os
+import shutil
+import sys
+from bisect import bisect_left, bisect_right
+from typing import Any, Hashable, List, Mapping, Sequence, TextIO, Tuple
+
+from .answers import reject_answer, rendering
+from .exceptions import ValidationError
+from .membership import ChoiceSet
+from .steps import READ, run_steps
+from .table import page_count
+
+# Width (in characters) long menus are laid out in when it can't be read from the terminal.
+MENU_WIDTH = 120
+# Menus with up to this many options are shown one option per line.
+SHORT_MENU = 5
+# Menus with more options than this are asked a page at a time, with a filter (see Menu.ask).
+LARGE_MENU = 200
+# Selection mark in front of each option of Menu.select()
+_MARKS = ("[ ] ", "[x] ")
+
+
+class Menu:
+    """
+    Options shown as `key: label`, chosen by typing the key.
+
+    :param options: {key: value}, in display order. The menu key typed by the user is str(key);
+                    choose() returns the original key, choose_value() the value
+    :param labels: What to show for each option (default: str(value), formatted when first displayed)
+    :param per_row: Options per row for long menus (default: as many as fit in the width)
+    """
+
+    __slots__ = ("_keys", "_values", "_labels", "_choices", "per_row", "_rows", "_frame", "_numbered",
+                 "_sorted", "_completer")
+
+    def __init__(self, options: Mapping[Hashable, Any], labels: Sequence[str] = None, per_row: int = None):
+        self._keys = tuple(options)
+        self._values = tuple(options.values())
+        # Labels are formatted on first display: paged menus only format the options shown.
+        self._labels = [None] * len(self._keys) if labels is None else list(labels)
+        self._choices = ChoiceSet(str(key) for key in self._keys)
+        self.per_row = per_row
+        self._rows = None   # (width, mark_width, layout)
+        self._frame = None  # (width, color, text)
+        self._numbered = None  # (sorted integer keys, their positions) for ranges in select()
+        self._sorted = None  # (sorted menu keys, their positions) for prefix resolution
+        self._completer = None  # SubstringCompleter over "key: label", for the large-menu filter
+
+    def __len__(self):
+        return len(self._keys)
+
+    def __contains__(self, menu_key):
+        return menu_key in self._choices
+
+    def __repr__(self):
+        return f"Menu({dict(zip(self._keys, self.labels()))!r})"
+
+    def key(self, menu_key: str) -> Hashable:
+        """Original key of the option typed as `menu_key`."""
+        return self._keys[self._choices.position(menu_key)]
+
+    def value(self, menu_key: str) -> Any:
+        """Value of the option typed as `menu_key`."""
+        return self._values[self._choices.position(menu_key)]
+
+    def label(self, position: int) -> str:
+        """What is shown for the option at `position`."""
+        label = self._labels[position]
+        if label is None:
+            label = self._labels[position] = str(self._values[position])
+        return label
+
+    def labels(self) -> List[str]:
+        """The labels of all options, in display order."""
+        return [self.label(position) for position in range(len(self._keys))]
+
+    def layout(self, width: int = MENU_WIDTH, mark_width: int = 0) -> List[List[Tuple[str, str]]]:
+        """
+        The menu as rows of (key, description) cells, padded as displayed. Short menus have one
+        option per row; longer ones are laid out in aligned columns fitting in `width`, leaving
+        `mark_width` characters in front of each cell.
+        """
+        if self._rows is None or self._rows[:2] != (width, mark_width):
+            keys = [str(key) for key in self._keys]
+            labels = self.labels()
+            if len(keys) <= SHORT_MENU:
+                rows = [[(key, f": {label}")] for key, label in zip(keys, labels)]
+            else:
+                rows = self._cells(keys, labels, max(len(key) for key in keys), width, mark_width)
+            self._rows = (width, mark_width, rows)
+        return self._rows[2]
+
+    def _cells(self, keys: Sequence[str], labels: Sequence[str], key_width: int, width: int,
+               mark_width: int = 0) -> List[List[Tuple[str, str]]]:
+        """`keys` and their `labels` as rows of aligned (key, description) cells fitting in `width`."""
+        longest_desc = max(map(len, labels), default=0)
+        cell_width = mark_width + key_width + len(': ') + longest_desc + 5
+        per_row = self.per_row or max(1, width // cell_width)
+        cells = [(key.rjust(key_width), f": {label}".ljust(longest_desc + 5)) for key, label in zip(keys, labels)]
+        return [cells[i:i + per_row] for i in range(0, len(cells), per_row)]
+
+    def frame(self, width: int = MENU_WIDTH, color: bool = False) -> str:
+        """The whole menu as printed (preceded by a blank line), keys in blue when `color`."""
+        if self._frame is None or self._frame[:2] != (width, color):
+            key_format = _key_format(color)
+            lines = ["".join(key_format.format(key) + description for key, description in row)
+                     for row in self.layout(width)]
+            self._frame = (width, color, "\n" + "".join(line + "\n" for line in lines))
+        return self._frame[2]
+
+    def show(self, renderer: "MenuRenderer" = None):
+        """
+        Draw the menu with `renderer` (default: the one set with set_menu_renderer). Nothing is
+        drawn while answers are scripted (see askuser.answers).
+        """
+        if rendering():
+            (renderer or _renderer).write(self)
+
+    def ask(self, input_msg: str = 'Option:') -> str:
+        """
+        Show the menu and return the menu key the user typed (re-prompting until it is one).
+
+        Menus with more than LARGE_MENU options are shown a page at a time. The user can then
+        also type:
+            > / <       next / previous page
+            g <page>    go to page
+            /<text>     only show options whose key or label contains text; '/' alone clears it
+            <prefix>    the start of a key: chooses the only key starting with it, or lists them
+        A menu key always wins: a key such as 'g1' is chosen, not read as a command.
+        """
+        if len(self) > LARGE_MENU:
+            return self._ask_large(input_msg)
+        from . import core  # core builds its menus with this class
+        self.show()
+        validator, steps = core._menu_input(self, input_msg)
+        return run_steps(steps,
+                         lambda request: core._read_input(*request[1:]) if request[0] == READ else validator(request[1]))
+
+    def search(self, text: str) -> List[int]:
+        """Positions of the options whose key or label contains `text`, ignoring case."""
+        if self._completer is None:
+            from .autocomplete import SubstringCompleter
+            entries = [f"{key}: {label}" for key, label in zip(self._choices, self.labels())]
+            self._completer = SubstringCompleter(entries, min_chars=1)
+        return list(self._completer.search(text))
+
+    def with_prefix(self, prefix: str) -> List[int]:
+        """Positions of the options whose menu key starts with `prefix`, in key order."""
+        if self._sorted is None:
+            ordered = sorted((key, position) for position, key in enumerate(self._choices))
+            self._sorted = ([key for key, _ in ordered], [position for _, position in ordered])
+        keys, positions = self._sorted
+        start = end = bisect_left(keys, prefix)
+        while end < len(keys) and keys[end].startswith(prefix):
+            end += 1
+        return positions[start:end]
+
+    def _ask_large(self, input_msg: str) -> str:
+        from . import core  # read through core._read_input, like every other prompt
+        return run_steps(self._large_steps(input_msg), lambda request: core._read_input(request[1]))
+
+    def _large_steps(self, input_msg: str):
+        """The paged prompt loop of ask() (and ask_async), as a step generator (see askuser.steps)."""
+        from . import core
+        renderer = _renderer
+        stream = renderer.stream or sys.stdout
+        key_format = _key_format(renderer.use_color(stream))
+        width = renderer.line_width()
+        menu_keys = list(self._choices)
+        key_width = max(map(len, menu_keys))
+        lines_per_page = max(SHORT_MENU, shutil.get_terminal_size().lines - 4)
+
+        def page_rows(positions):
+            # Each page is laid out on its own, so only the labels of the options shown are formatted.
+            return self._cells([menu_keys[p] for p in positions], [self.label(p) for p in positions], key_width, width)
+
+        # As many options per page as fit in the lines of the first page (wider labels further on
+        # only make their page taller).
+        first_window = range(min(len(self), lines_per_page * max(1, width // (key_width + len(': ') + 6))))
+        page_size = lines_per_page * len(page_rows(first_window)[0])
+        draw = rendering()
+
+        view = None  # positions being paged through (narrowed by a filter / prefix), None for all
+        note = ''
+        page = 0
+        while True:
+            total = len(self) if view is None else len(view)
+            pages = page_count(total, page_size)
+            page = min(max(page, 0), pages - 1)
+            start = page * page_size
+            if draw:
+                shown = range(start, min(start + page_size, total)) if view is None else view[start:start + page_size]
+                lines = ["".join(key_format.format(key) + description for key, description in row)
+                         for row in page_rows(shown)]
+                stream.write("\n" + "".join(line + "\n" for line in lines)
+                             + f"Page {page + 1}/{pages} ({total} options{note})"
+                               f"  >: next  <: prev  g <page>: go to  /<text>: filter  /: clear filter\n")
+                stream.flush()
+
+            typed = yield READ, input_msg
+            answer = typed.strip()
+            # A key is chosen before anything else, even one that reads like a command ('g1', '>')
+            for key in (answer, typed):
+                if key in self._choices:
+                    return key
+            if answer == '>':
+                page += 1
+            elif answer == '<':
+                page -= 1
+            elif answer[:1] == 'g' and answer[1:].strip().isdigit():
+                page = int(answer[1:]) - 1
+            elif answer[:1] == '/':
+                term = answer[1:].strip()
+                view = self.search(term) if term else None
+                note = f" matching '{term}'" if term else ''
+                page = 0
+            else:
+                matches = self.with_prefix(answer) if answer else []
+                if len(matches) == 1:
+                    return menu_keys[matches[0]]
+                if matches:
+                    view, note, page = matches, f" starting with '{answer}'", 0
+                    continue
+                try:
+                    core.is_valid_custom(answer, self._choices)
+                except ValidationError as e:
+                    reject_answer(input_msg, answer, e)
+                    renderer.error(e.message)
+
+    def choose(self, input_msg: str = 'Option:') -> Hashable:
+        """Show the menu and return the original key of the chosen option."""
+        return self.key(self.ask(input_msg))
+
+    def choose_value(self, input_msg: str = 'Option:') -> Any:
+        """Show the menu and return the value of the chosen option."""
+        return self.value(self.ask(input_msg))
+
+    def parse_selection(self, text: str, selected: int = 0) -> int:
+        """
+        Apply a selection line to `selected`, a bitset of option positions (bit i = i-th option),
+        and return the new bitset. The line is a comma separated list of:
+            key       select the option typed as key
+            a-b       select the options with an integer key from a to b (inclusive)
+            !key !a-b deselect them
+        Raises ValidationError ('invalid_selection') for a part that matches no option.
+        """
+        for token in text.split(','):
+            token = token.strip()
+            if not token:
+                continue
+            deselect = token.startswith('!')
+            bits = self._selection_bits(token[1:].strip() if deselect else token)
+            if bits is None:
+                raise ValidationError("invalid_selection", "Error: {token!r} is not an option or a range of options.",
+                                      value=text, token=token)
+            selected = selected & ~bits if deselect else selected | bits
+        return selected
+
+    def _selection_bits(self, token: str):
+        if token in self._choices:
+            return 1 << self._choices.position(token)
+        low, sep, high = token.partition('-')
+        if not sep or not _is_int(low) or not _is_int(high):
+            return None
+        if self._numbered is None:
+            numbered = sorted((int(key), position) for position, key in enumerate(self._choices) if _is_int(key))
+            self._numbered = ([number for number, _ in numbered], [position for _, position in numbered])
+        numbers, positions = self._numbered
+        bits = 0
+        for position in positions[bisect_left(numbers, int(low)):bisect_right(numbers, int(high))]:
+            bits |= 1 << position
+        return bits or None
+
+    def select(self, input_msg: str = 'Select (e.g. 1,3,5-40,!7; blank line when done):',
+               renderer: "MenuRenderer" = None) -> list:
+        """
+        Show the menu with a selection mark per option and read selection lines (see
+        parse_selection) until a blank line; return the original keys selected, in menu order.
+
+        On a terminal, only the rows whose marks changed are redrawn after each line (in place,
+        with ANSI cursor movement); the whole menu is drawn again after an error, or when it is
+        taller than the terminal.
+        """
+        from . import core  # read through core._read_input, like every other prompt
+        return run_steps(self._select_steps(input_msg, renderer), lambda request: core._read_input(request[1]))
+
+    def _select_steps(self, input_msg: str, renderer: "MenuRenderer" = None):
+        """The prompt loop of select() (and select_async), as a step generator (see askuser.steps)."""
+        from . import core
+        renderer = renderer or _renderer
+        stream = renderer.stream or sys.stdout
+        color = renderer.use_color(stream)
+        rows = self.layout(renderer.line_width(), len(_MARKS[0]))
+        per_row = len(rows[0]) if rows else 1
+        key_format = _key_format(color)
+
+        def line(row_index):
+            first = row_index * per_row
+            return "".join(_MARKS[selected >> (first + i) & 1] + key_format.format(key) + description
+                           for i, (key, description) in enumerate(rows[row_index]))
+
+        draw = rendering()
+        interactive = draw and bool(getattr(stream, "isatty", None) and stream.isatty())
+        in_place = interactive and len(rows) + 1 < shutil.get_terminal_size().lines
+        selected = 0
+        redraw = draw
+        while True:
+            if redraw:
+                stream.write("\n" + "".join(line(r) + "\n" for r in range(len(rows))))
+                stream.flush()
+                redraw = False
+            answer = (yield READ, input_msg).strip()
+            if not answer:
+                break
+            try:
+                updated = self.parse_selection(answer, selected)
+            except ValidationError as e:
+                reject_answer(input_msg, answer, e)
+                renderer.error(e.message)
+                redraw = interactive
+                continue
+            changed, selected = selected ^ updated, updated
+            if not interactive:
+                continue
+            if not in_place:
+                redraw = True
+                continue
+            changed_rows = set()
+            while changed:
+                low = changed & -changed
+                changed_rows.add((low.bit_length() - 1) // per_row)
+                changed ^= low
+            # The cursor is below the answered prompt: go back to that line, rewrite the changed
+            # rows above it and clear it for the next prompt.
+            buffer = ["\033[F"]
+            for r in sorted(changed_rows):
+                up = len(rows) - r
+                buffer.append(f"\033[{up}F\033[2K{line(r)}\033[{up}E")
+            buffer.append("\033[2K")
+            stream.write("".join(buffer))
+            stream.flush()
+
+        keys = self._keys
+        return [keys[position] for position in range(len(keys)) if selected >> position & 1]
+
+
+_BLUE = "\033[34m"
+_RED = "\033[31m"
+_RESET = "\033[0m"
+
+
+def _key_format(color: bool) -> str:
+    return f"{_BLUE}{{}}{_RESET}" if color else "{}"
+
+
+def _is_int(text: str) -> bool:
+    return text.lstrip('-').isdigit()
+
+
+class MenuRenderer:
+    """
+    Draws menus with a single write() (and flush) of the whole frame, and the errors shown when
+    an answer to a menu is invalid (error()), to the same stream.
+
+    :param stream: Where to write (default: sys.stdout at the time of writing)
+    :param color: Color the keys. Default: only when the stream is a terminal and NO_COLOR isn't set
+    :param width: Line width long menus are laid out in. Default: the terminal width (MENU_WIDTH
+                  when it can't be determined)
+    """
+
+    def __init__(self, stream: TextIO = None, color: bool = None, width: int = None):
+        self.stream = stream
+        self.color = color
+        self.width = width
+
+    def use_color(self, stream: TextIO) -> bool:
+        if self.color is not None:
+            return self.color
+        if os.environ.get("NO_COLOR"):
+            return False
+        isatty = getattr(stream, "isatty", None)
+        return bool(isatty and isatty())
+
+    def line_width(self) -> int:
+        return self.width or shutil.get_terminal_size((MENU_WIDTH, 24)).columns
+
+    def render(self, menu: Menu, stream: TextIO = None) -> str:
+        """The frame of `menu` as it would be written to `stream`."""
+        return menu.frame(self.line_width(), self.use_color(stream or self.stream or sys.stdout))
+
+    def write(self, menu: Menu):
+        stream = self.stream or sys.stdout
+        stream.write(self.render(menu, stream))
+        stream.flush()
+
+    def error(self, message: str):
+        """Write the error shown for an invalid answer to a menu (followed by a blank line)."""
+        stream = self.stream or sys.stdout
+        text = f"\u274C  {message}"
+        stream.write((f"{_RED}{text}{_RESET}" if self.use_color(stream) else text) + "\n\n")
+        stream.flush()
+
+
+_renderer = MenuRenderer()
+
+
+def get_menu_renderer() -> MenuRenderer:
+    """The renderer menus are drawn with."""
+    return _renderer
+
+
+def set_menu_renderer(renderer: MenuRenderer) -> MenuRenderer:
+    """
+    Draw every menu with `renderer`; returns the previous one. It must be a MenuRenderer (or a
+    subclass overriding write / render): paged menus and select() also use its stream,
+    use_color() and line_width().
+
+    Example:
+        set_menu_renderer(MenuRenderer(stream=sys.stderr, color=False))
+    """
+    if not isinstance(renderer, MenuRenderer):
+        raise TypeError(f"renderer must be a MenuRenderer, not {type(renderer).__name__}")
+    global _renderer
+    previous, _renderer = _renderer, renderer
+    return previous
+
+
+def menu_options(args: Sequence, kwargs: Mapping) -> dict:
+    """{key: value} of a *args / **kwargs menu: args get the keys "0", "1", ... followed by kwargs."""
+    options = {str(i): op for i, op in enumerate(args)}
+    options.update(kwargs)
+    return options
+
+
+__all__ = [
+    "MENU_WIDTH",
+    "SHORT_MENU",
+    "LARGE_MENU",
+    "Menu",
+    "MenuRenderer",
+    "get_menu_renderer",
+    "set_menu_renderer",
+    "menu_options",
+]
@@ -0,0 +1,181 @@
+"""
+askuser.metrics
+
+Where the time of a prompt goes. With a collector set, every validate_input call reports one
+PromptMetrics: the time spent rendering (preparing the prompt, printing errors), waiting on the
+user, and inside the validator, plus how many entries it took and how it ended.
+
+A collector is any callable taking a PromptMetrics. MetricsAggregator is an in-memory one that
+keeps running totals per field (prompt + validation_type) and prints a summary table:
+
+    with collect_metrics() as stats:
+        run_onboarding()
+    print(stats.table())
+
+No collector is set by default, and validate_input then skips the timing altogether.
+"""
+import threading
+from contextlib import contextmanager
+from time import perf_counter
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+
+
+class PromptMetrics(NamedTuple):
+    """One validate_input call. Times are in ms; `invalid` entries were rejected by the validator."""
+    prompt: str
+    validation_type: str
+    validator: str
+    entries: int
+    invalid: int
+    outcome: str  # 'valid', 'default', 'max_attempts' or 'error' (an exception, e.g. Ctrl-C)
+    render_ms: float
+    wait_ms: float
+    validate_ms: float
+    total_ms: float
+
+
+Collector = Callable[[PromptMetrics], None]
+
+_collector: Optional[Collector] = None
+
+
+def get_metrics_collector() -> Optional[Collector]:
+    """The collector prompts report to, or None."""
+    return _collector
+
+
+def set_metrics_collector(collector: Optional[Collector]) -> Optional[Collector]:
+    """Report every prompt to `collector` (None: stop timing); returns the previous one."""
+    global _collector
+    previous, _collector = _collector, collector
+    return previous
+
+
+class PromptTimer:
+    """Accumulates the timings of one validate_input call (only created when a collector is set)."""
+
+    __slots__ = ("collector", "prompt", "validation_type", "validator", "started", "entries", "invalid",
+                 "wait", "validate", "_mark")
+
+    def __init__(self, collector: Collector, prompt: str, validation_type: str, validator, started: float):
+        self.collector = collector
+        self.prompt = prompt
+        self.validation_type = validation_type
+        self.validator = getattr(validator, "__name__", type(validator).__name__)
+        self.started = started
+        self.entries = self.invalid = 0
+        self.wait = self.validate = 0.0
+        self._mark = started
+
+    def reading(self):
+        self._mark = perf_counter()
+
+    def read(self):
+        now = perf_counter()
+        self.wait += now - self._mark
+        self.entries += 1
+        self._mark = now
+
+    def validated(self, valid: bool = True):
+        now = perf_counter()
+        self.validate += now - self._mark
+        self.invalid += not valid
+        self._mark = now
+
+    def finish(self, outcome: str):
+        total = perf_counter() - self.started
+        self.collector(PromptMetrics(
+            self.prompt, self.validation_type, self.validator, self.entries, self.invalid, outcome,
+            (total - self.wait - self.validate) * 1000, self.wait * 1000, self.validate * 1000, total * 1000,
+        ))
+
+
+class _FieldStats:
+    __slots__ = ("validator", "calls", "entries", "invalid", "retried", "outcomes",
+                 "render_ms", "wait_ms", "validate_ms", "max_validate_ms")
+
+    def __init__(self, validator: str):
+        self.validator = validator
+        self.calls = self.entries = self.invalid = self.retried = 0
+        self.outcomes: Dict[str, int] = {}
+        self.render_ms = self.wait_ms = self.validate_ms = self.max_validate_ms = 0.0
+
+
+class MetricsAggregator:
+    """
+    Collector keeping running totals per (prompt, validation_type), so memory doesn't grow with
+    the number of calls. Thread-safe.
+    """
+
+    def __init__(self):
+        self._fields: Dict[Tuple[str, str], _FieldStats] = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, m: PromptMetrics):
+        with self._lock:
+            stats = self._fields.get((m.prompt, m.validation_type))
+            if stats is None:
+                stats = self._fields[m.prompt, m.validation_type] = _FieldStats(m.validator)
+            stats.calls += 1
+            stats.entries += m.entries
+            stats.invalid += m.invalid
+            stats.retried += m.invalid > 0
+            stats.outcomes[m.outcome] = stats.outcomes.get(m.outcome, 0) + 1
+            stats.render_ms += m.render_ms
+            stats.wait_ms += m.wait_ms
+            stats.validate_ms += m.validate_ms
+            stats.max_validate_ms = max(stats.max_validate_ms, m.validate_ms / max(1, m.entries))
+
+    def summary(self, sort_by: str = "validate_ms") -> List[dict]:
+        """One dict per field, largest `sort_by` first (any key of the dicts)."""
+        with self._lock:
+            rows = [{
+                "prompt": prompt,
+                "validation_type": validation_type,
+                "validator": s.validator,
+                "calls": s.calls,
+                "entries": s.entries,
+                "retry_rate": s.retried / s.calls,
+                "invalid_per_call": s.invalid / s.calls,
+                "render_ms": s.render_ms / s.calls,
+                "wait_ms": s.wait_ms / s.calls,
+                "validate_ms": s.validate_ms / max(1, s.entries),
+                "max_validate_ms": s.max_validate_ms,
+                "outcomes": ", ".join(f"{outcome}: {n}" for outcome, n in s.outcomes.items()),
+            } for (prompt, validation_type), s in self._fields.items()]
+        return sorted(rows, key=lambda row: row[sort_by], reverse=True)
+
+    def table(self, sort_by: str = "validate_ms") -> str:
+        """summary() as a table. Times are means in ms (validate_ms per entry, the others per call)."""
+        from tabulate import tabulate
+        return tabulate(self.summary(sort_by), headers="keys", floatfmt=".3f")
+
+    def reset(self):
+        with self._lock:
+            self._fields.clear()
+
+    def __len__(self):
+        return len(self._fields)
+
+
+@contextmanager
+def collect_metrics(collector: Collector = None):
+    """
+    Report the prompts of the block to `collector` (default: a new MetricsAggregator), which is
+    yielded; the previous collector is restored afterwards.
+    """
+    collector = MetricsAggregator() if collector is None else collector
+    previous = set_metrics_collector(collector)
+    try:
+        yield collector
+    finally:
+        set_metrics_collector(previous)
+
+
+__all__ = [
+    "PromptMetrics",
+    "MetricsAggregator",
+    "get_metrics_collector",
+    "set_metrics_collector",
+    "collect_metrics",
+]
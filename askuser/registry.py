@@ -0,0 +1,128 @@
+"""
+askuser.registry
+
+The validator registry (validation_type name -> validator) behind validate_input, with lazy
+entries: a validator can be registered by import path and is only imported the first time it
+is used, so apps with large validator catalogs don't import them all at startup.
+
+Lazy entries come from:
+- register_validator(name, "pkg.module:function") (see askuser.custom_validators)
+- installed packages declaring an `askuser.validators` entry point, e.g. in pyproject.toml:
+
+      [project.entry-points."askuser.validators"]
+      movie_id = "myapp.validators:is_valid_movie_id"
+
+  Entry points are only looked up when a name isn't registered otherwise (or the whole
+  registry is listed with get_validators()); they never replace an existing name.
+"""
+from importlib import import_module
+
+ENTRY_POINT_GROUP = "askuser.validators"
+
+
+def _split_path(path: str):
+    """("pkg.module", "function") from "pkg.module:function" or "pkg.module.function"."""
+    module, sep, attr = path.partition(":")
+    if not sep:
+        module, _, attr = path.rpartition(".")
+    if not module or not attr:
+        raise ValueError(f"Validator path must look like 'package.module:function', not {path!r}")
+    return module, attr
+
+
+class LazyValidator:
+    """
+    Registry entry for a validator imported on first use.
+
+    :param target: "pkg.module:function" (or "pkg.module.function"), or an entry point
+    """
+
+    __slots__ = ("target", "_func")
+
+    def __init__(self, target):
+        if isinstance(target, str):
+            _split_path(target)  # fail at registration, not on first use
+        self.target = target
+        self._func = None
+
+    def load(self):
+        """Import and return the validator (once)."""
+        if self._func is None:
+            target = self.target
+            try:
+                if isinstance(target, str):
+                    module, attr = _split_path(target)
+                    func = import_module(module)
+                    for name in attr.split("."):
+                        func = getattr(func, name)
+                else:
+                    func = target.load()
+            except (ImportError, AttributeError) as e:
+                raise ImportError(f"Validator {self} could not be loaded: {e}") from e
+            if not callable(func):
+                raise TypeError(f"Validator {self} is not callable")
+            self._func = func
+        return self._func
+
+    def __call__(self, *args, **kwargs):
+        return self.load()(*args, **kwargs)
+
+    def __repr__(self):
+        target = self.target if isinstance(self.target, str) else self.target.value
+        return f"<LazyValidator {target!r}>"
+
+
+def _entry_points(group: str):
+    from importlib.metadata import entry_points  # only imported when a lookup misses
+    eps = entry_points()
+    if hasattr(eps, "select"):  # Python 3.10+
+        return eps.select(group=group)
+    return eps.get(group, ())
+
+
+class ValidatorRegistry(dict):
+    """
+    dict of {name: validator} resolving LazyValidator entries when they are looked up
+    (`registry[name]` / `registry.get(name)` return the imported function and keep it in place
+    of the lazy entry). `name in registry` discovers entry points on its first miss.
+    """
+
+    def __init__(self, *args, entry_point_group: str = ENTRY_POINT_GROUP, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.entry_point_group = entry_point_group
+        self._discovered = False
+
+    def __getitem__(self, name):
+        func = super().__getitem__(name)
+        if isinstance(func, LazyValidator):
+            func = func.load()
+            super().__setitem__(name, func)
+        return func
+
+    def get(self, name, default=None):
+        return self[name] if name in self else default
+
+    def __contains__(self, name):
+        if super().__contains__(name):
+            return True
+        if not self._discovered:
+            self.discover()
+            return super().__contains__(name)
+        return False
+
+    def is_registered(self, name) -> bool:
+        """`name in registry`, without discovering entry points."""
+        return super().__contains__(name)
+
+    def discover(self):
+        """Add (lazily) the validators of the entry point group not registered already."""
+        self._discovered = True
+        for ep in _entry_points(self.entry_point_group):
+            self.setdefault(ep.name.strip().lower(), LazyValidator(ep))
+
+
+__all__ = [
+    "ENTRY_POINT_GROUP",
+    "LazyValidator",
+    "ValidatorRegistry",
+]
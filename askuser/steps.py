@@ -0,0 +1,62 @@
+"""
+askuser.steps
+
+Prompt loops written once for both the blocking API and askuser.aio.
+
+A loop that needs the user (or a validator) is a generator that yields requests instead of doing
+the I/O itself, and is sent back the answers:
+
+    READ, prompt[, id]  -> what the user typed (id: the key of keyed scripted answers, see
+                           askuser.answers; default: the prompt)
+    VALIDATE, text      -> the validator's result, or its exception thrown back in
+    CHOOSE, options     -> the key picked from a menu of `options`
+
+run_steps answers them with blocking calls, run_steps_async by awaiting.
+"""
+from typing import Any, Awaitable, Callable, Generator, Tuple
+
+READ = "read"
+VALIDATE = "validate"
+CHOOSE = "choose"
+
+Request = Tuple[str, Any]
+Steps = Generator[Request, Any, Any]
+
+
+def run_steps(steps: Steps, handle: Callable[[Request], Any]):
+    """Run `steps`, answering each request with handle(request); return what the loop returns."""
+    try:
+        request = next(steps)
+        while True:
+            try:
+                answer = handle(request)
+            except BaseException as e:  # the loop decides: retry on invalid input, clean up on Ctrl-C
+                request = steps.throw(e)
+            else:
+                request = steps.send(answer)
+    except StopIteration as stop:
+        return stop.value
+
+
+async def run_steps_async(steps: Steps, handle: Callable[[Request], Awaitable]):
+    """run_steps, awaiting handle(request)."""
+    try:
+        request = next(steps)
+        while True:
+            try:
+                answer = await handle(request)
+            except BaseException as e:
+                request = steps.throw(e)
+            else:
+                request = steps.send(answer)
+    except StopIteration as stop:
+        return stop.value
+
+
+__all__ = [
+    "READ",
+    "VALIDATE",
+    "CHOOSE",
+    "run_steps",
+    "run_steps_async",
+]
@@ -0,0 +1,270 @@
+"""
+askuser.table
+
+Row storage behind choose_from_db's paged picker and choose_dict_from_list_of_dicts.
+
+Large query results are shown one page at a time: only the rows on screen are formatted
+(tabulate is never given the whole result), the primary-key index maps the typed id to a row
+offset, and a filter is a list of row offsets rather than a copy of the matching rows.
+
+Accepted row sources (see row_table):
+    - a list of dicts, used as-is (RowTable)
+    - column names plus a list of tuple rows (TupleTable)
+    - a dict of column arrays, or a NumPy structured array (ColumnTable)
+    - a DB-API cursor or any other iterator, read lazily in `fetchmany` batches as the user
+      pages (LazyRowTable)
+Tuple and columnar rows don't repeat the column names per row; a row dict is only built for
+the rows displayed or chosen.
+"""
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Dict, List, Mapping, Optional, Sequence
+
+# Rows per page of choose_from_db; results up to this size are shown in one table, unpaged.
+PAGE_SIZE = 50
+
+
+class RowTable:
+    """
+    Read-only view over query rows (dicts) with id lookup, filtering and per-page rendering.
+
+    :param rows: The rows (a sequence of dicts, used as-is)
+    :param primary_key: Column whose value the user types to choose a row
+    """
+
+    def __init__(self, rows: Sequence[dict], primary_key: str = 'id'):
+        self.rows = rows
+        self.primary_key = primary_key
+        self._index: Optional[Dict[str, int]] = None
+
+    @property
+    def columns(self) -> List[str]:
+        return list(self.rows[0]) if len(self.rows) else []
+
+    @property
+    def exhausted(self) -> bool:
+        """True once every row of the source has been read (always, for in-memory rows)."""
+        return True
+
+    def __len__(self):
+        """Number of rows read so far."""
+        return len(self.rows)
+
+    def ensure(self, count: int) -> int:
+        """Read rows until `count` are available or the source ends; return how many are."""
+        return min(count, len(self))
+
+    def row(self, offset: int) -> dict:
+        return self.rows[offset]
+
+    def column(self, name: str):
+        """Iterate the values of one column."""
+        return (row[name] for row in self.rows)
+
+    def _records(self):
+        """Iterate the values of each row."""
+        return (row.values() for row in self.rows)
+
+    def find(self, key: str) -> Optional[int]:
+        """Offset of the row whose primary key reads as `key`, or None."""
+        if self._index is None:
+            self._index = {str(value): offset for offset, value in enumerate(self.column(self.primary_key))}
+        return self._index.get(key)
+
+    def search(self, term: str) -> List[int]:
+        """Offsets of the rows with a value containing `term`, ignoring case."""
+        term = term.casefold()
+        return [offset for offset, values in enumerate(self._records())
+                if any(term in str(value).casefold() for value in values)]
+
+    def render(self, offsets) -> str:
+        """The rows at `offsets` as a table."""
+        from tabulate import tabulate
+        return tabulate([self.row(offset) for offset in offsets], headers="keys")
+
+    def close(self):
+        """Release the resources held for reading the source."""
+
+
+class TupleTable(RowTable):
+    """
+    RowTable over tuple rows, with the column names given once.
+
+    :param columns: Column names, in row order
+    :param rows: The rows (a sequence of tuples, used as-is)
+    :param primary_key: Column whose value the user types to choose a row
+    """
+
+    def __init__(self, columns: Sequence[str], rows: Sequence[tuple], primary_key: str = 'id'):
+        super().__init__(rows, primary_key)
+        self._columns = list(columns) if columns is not None else None
+
+    @property
+    def columns(self) -> List[str]:
+        return self._columns
+
+    def row(self, offset: int) -> dict:
+        return dict(zip(self._columns, self.rows[offset]))
+
+    def column(self, name: str):
+        position = self._columns.index(name)
+        return (row[position] for row in self.rows)
+
+    def _records(self):
+        return iter(self.rows)
+
+    def render(self, offsets) -> str:
+        from tabulate import tabulate
+        rows = self.rows
+        return tabulate([rows[offset] for offset in offsets], headers=self._columns)
+
+
+class ColumnTable(RowTable):
+    """
+    RowTable over column arrays: {column name: sequence of values}, all of the same length
+    (lists, array.array, NumPy arrays, ...).
+
+    :param data: The columns, used as-is
+    :param primary_key: Column whose value the user types to choose a row
+    """
+
+    def __init__(self, data: Mapping[str, Sequence], primary_key: str = 'id'):
+        super().__init__((), primary_key)
+        self.data = data
+
+    @property
+    def columns(self) -> List[str]:
+        return list(self.data)
+
+    def __len__(self):
+        return len(next(iter(self.data.values()))) if self.data else 0
+
+    def row(self, offset: int) -> dict:
+        return {name: values[offset] for name, values in self.data.items()}
+
+    def column(self, name: str):
+        return iter(self.data[name])
+
+    def _records(self):
+        return zip(*self.data.values())
+
+    def render(self, offsets) -> str:
+        from tabulate import tabulate
+        columns = list(self.data.values())
+        return tabulate([[values[offset] for values in columns] for offset in offsets], headers=list(self.data))
+
+
+class LazyRowTable(TupleTable):
+    """
+    TupleTable over a DB-API cursor or an iterator (of dicts, or of tuples when `columns` is
+    given), read `batch_size` rows at a time.
+
+    Rows are stored as tuples (column names come from `columns`, `cursor.description` or the
+    keys of the first dict) and the primary-key index is filled as batches arrive. Looking up
+    an id that has not been read yet, or filtering, reads on until it is found / to the end of
+    the source.
+
+    With `prefetch=True` the next batch is fetched in a background thread while the current page
+    is shown. Only use it with connections that may be used from another thread (sqlite3 needs
+    `check_same_thread=False`).
+    """
+
+    def __init__(self, source, primary_key: str = 'id', batch_size: int = PAGE_SIZE, prefetch: bool = False,
+                 columns: Sequence[str] = None):
+        super().__init__(columns, [], primary_key)
+        self._index = {}
+        self.batch_size = batch_size
+        if hasattr(source, 'fetchmany'):
+            if self._columns is None:
+                self._columns = [column[0] for column in source.description]
+            self._read = lambda: source.fetchmany(batch_size)
+        else:
+            source = iter(source)
+            self._read = lambda: list(islice(source, batch_size))
+        self._exhausted = False
+        self._executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+        self._pending = None
+
+    @property
+    def exhausted(self) -> bool:
+        return self._exhausted
+
+    def _next_batch(self):
+        if self._executor is None:
+            return self._read()
+        batch = (self._pending or self._executor.submit(self._read)).result()
+        self._pending = self._executor.submit(self._read) if batch else None
+        return batch
+
+    def _fetch(self) -> bool:
+        """Read one more batch; False once the source is exhausted."""
+        if self._exhausted:
+            return False
+        batch = self._next_batch()
+        if not batch:
+            self._exhausted = True
+            self.close()
+            return False
+        if self._columns is None:
+            self._columns = list(batch[0])
+        columns, rows, index = self._columns, self.rows, self._index
+        pk = columns.index(self.primary_key)
+        for values in batch:
+            values = tuple(values[column] for column in columns) if isinstance(values, dict) else tuple(values)
+            index[str(values[pk])] = len(rows)
+            rows.append(values)
+        return True
+
+    def ensure(self, count: int) -> int:
+        while len(self.rows) < count and self._fetch():
+            pass
+        return min(count, len(self.rows))
+
+    def find(self, key: str) -> Optional[int]:
+        offset = self._index.get(key)
+        while offset is None and self._fetch():
+            offset = self._index.get(key)
+        return offset
+
+    def search(self, term: str) -> List[int]:
+        while self._fetch():
+            pass
+        return super().search(term)
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = self._pending = None
+
+
+def row_table(source, primary_key: str = 'id', columns: Sequence[str] = None,
+              batch_size: int = PAGE_SIZE, prefetch: bool = False) -> RowTable:
+    """
+    The RowTable for any of the accepted row sources (see the module docstring): `columns` names
+    the fields of tuple rows; a NumPy structured array is recognised by its `dtype.names`.
+    """
+    names = getattr(getattr(source, 'dtype', None), 'names', None)
+    if names:
+        return ColumnTable({name: source[name] for name in names}, primary_key)
+    if isinstance(source, Mapping):
+        return ColumnTable(source, primary_key)
+    if isinstance(source, Sequence):
+        if columns is not None:
+            return TupleTable(columns, source, primary_key)
+        return RowTable(source, primary_key)
+    return LazyRowTable(source, primary_key, batch_size=batch_size, prefetch=prefetch, columns=columns)
+
+
+def page_count(total: int, page_size: int) -> int:
+    return max(1, -(-total // page_size))
+
+
+__all__ = [
+    "PAGE_SIZE",
+    "RowTable",
+    "TupleTable",
+    "ColumnTable",
+    "LazyRowTable",
+    "row_table",
+    "page_count",
+]
@@ -0,0 +1,104 @@
+"""
+askuser.urls
+
+URL parsing behind the 'url' validator, and non-interactive bulk normalization.
+
+A URL is matched in one pass by a precompiled pattern: an optional http(s) scheme, a host of
+any number of labels, an optional port, then the path / query / fragment, kept as given. The
+scheme and host are lowercased.
+
+What to do about the scheme is a policy rather than a prompt:
+    'keep'      keep it if present (default)
+    'strip'     remove it
+    'require'   reject URLs without one ('missing_protocol')
+    'https' / 'http'    add it when missing
+
+    for result in normalize_urls(open('links.txt'), protocol='https'):
+        ...
+"""
+import re
+from typing import Iterable, Iterator
+
+from .exceptions import ValidationError
+
+URL_PROTOCOL_POLICIES = ("keep", "strip", "require", "https", "http")
+
+_URL = re.compile(r"""
+    (?:(?P<scheme>https?)://)?
+    (?P<host>(?:[a-z0-9](?:[a-z0-9-]{0,61}[a-z0-9])?\.)+(?:[a-z]{2,63}|xn--[a-z0-9-]{1,59}))
+    (?::(?P<port>\d{1,5}))?
+    (?P<rest>[/?\#]\S*)?
+""", re.VERBOSE | re.IGNORECASE)
+
+
+def _invalid(text: str) -> ValidationError:
+    return ValidationError("invalid_url", "Incorrect URL format: {value}. "
+                           "Expected format like: 'www.watchmyfilm.com' / 'yiff.festivalsaints.com' / etc.",
+                           value=text)
+
+
+def normalize_url(text: str, protocol: str = "keep", require_subdomain: bool = False) -> str:
+    """
+    Return `text` with its scheme and host lowercased and the scheme handled per `protocol`
+    (see the module docstring), or raise ValidationError ('invalid_url' / 'missing_protocol').
+
+    :param require_subdomain: Reject hosts of only two labels, e.g. 'example.com'
+    """
+    match = _URL.fullmatch(text)
+    if match is None:
+        raise _invalid(text)
+    scheme, host, port, rest = match.group("scheme", "host", "port", "rest")
+    if require_subdomain and host.count(".") < 2:
+        raise _invalid(text)
+    if port is not None and not 0 < int(port) < 65536:
+        raise _invalid(text)
+
+    if protocol == "keep":
+        prefix = f"{scheme.lower()}://" if scheme else ""
+    elif protocol == "strip":
+        prefix = ""
+    elif protocol == "https" or protocol == "http":
+        prefix = f"{scheme.lower() if scheme else protocol}://"
+    elif protocol == "require":
+        if not scheme:
+            raise ValidationError("missing_protocol", "URL requires a protocol ('http://' or 'https://'): {value}",
+                                  value=text)
+        prefix = f"{scheme.lower()}://"
+    else:
+        raise ValueError(f"protocol must be one of {URL_PROTOCOL_POLICIES}, not {protocol!r}")
+
+    url = prefix + host.lower()
+    if port is not None:
+        url += ":" + port
+    return url + rest if rest else url
+
+
+def normalize_urls(urls: Iterable[str], protocol: str = "keep", require_subdomain: bool = False) -> Iterator:
+    """
+    Normalize a stream of URLs without prompting, yielding a ValidationResult(index, input,
+    value, error) per URL, in order. Values are stripped (file lines can be passed as they are).
+
+    :param protocol: Scheme policy: 'keep', 'strip', 'require', 'https' or 'http'
+    :param require_subdomain: Reject hosts of only two labels, e.g. 'example.com'
+    """
+    from .core import ValidationResult
+    if protocol not in URL_PROTOCOL_POLICIES:
+        raise ValueError(f"protocol must be one of {URL_PROTOCOL_POLICIES}, not {protocol!r}")
+    return _normalize_stream(urls, protocol, require_subdomain, ValidationResult)
+
+
+def _normalize_stream(urls, protocol, require_subdomain, result_type):
+    for index, url in enumerate(urls):
+        try:
+            value = normalize_url(url.strip(), protocol, require_subdomain)
+        except ValidationError as e:
+            yield result_type(index, url, error=e)
+        else:
+            yield result_type(index, url, value)
+
+
+__all__ = [
+    "URL_PROTOCOL_POLICIES",
+    "normalize_url",
+    "normalize_urls",
+]
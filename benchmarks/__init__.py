@@ -0,0 +1,13 @@
+"""
+Performance benchmarks for AskUser (not collected by pytest).
+
+Run from the repository root, e.g.:
+
+    python -m benchmarks                          # every suite
+    python -m benchmarks.bench_autocomplete       # SubstringCompleter
+    python -m benchmarks.bench_validators         # validate_input dispatch, each validator
+    python -m benchmarks.bench_menus              # menus, choose_from_db and friends
+
+Terminal and network I/O are stubbed (see harness.py). Save a run with `--json base.json` and
+check a change against it with `--compare base.json` (exit status 1 on a regression).
+"""
@@ -0,0 +1,31 @@
+"""
+Run every benchmark suite and report them together.
+
+    python -m benchmarks [--sizes 1000 10000] [--json results.json] [--compare baseline.json]
+
+Without --sizes each suite uses its own default sizes.
+"""
+
+from . import bench_autocomplete, bench_menus, bench_validators
+from .harness import parser, report
+
+SUITES = {
+    "validators": lambda sizes, repeat: bench_validators.run(sizes or (1_000, 10_000, 100_000), repeat),
+    "menus": lambda sizes, repeat: bench_menus.run(sizes or (1_000, 10_000, 100_000), repeat),
+    "autocomplete": lambda sizes, repeat: bench_autocomplete.run(sizes or bench_autocomplete.DEFAULT_SIZES,
+                                                                            repeat),
+}
+
+
+def main(argv=None):
+    p = parser(__doc__.strip().splitlines()[0], sizes=())
+    p.add_argument("--suites", nargs="+", choices=list(SUITES), default=list(SUITES))
+    args = p.parse_args(argv)
+    rows = []
+    for name in args.suites:
+        rows += SUITES[name](args.sizes, args.repeat)
+    return report(rows, args)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,77 @@
+"""
+Benchmark SubstringCompleter construction and per-keystroke search cost.
+
+    python -m benchmarks.bench_autocomplete [--sizes 10000 100000 1000000] [--json out.json]
+
+For every size it reports the index build time, then the latency of a typing sequence
+('sk', 'sku', 'sku-00', ...) on a fresh completer (cold), again on the same completer (warm),
+the ranked top-10 selection used with `max_results=10` (top10), and the full
+get_completions() call prompt_toolkit makes per keystroke, Completion objects included (complete).
+
+Every case is the best of --repeat runs, each in the state the typing sequence leaves it in: a
+cold query runs on a completer built for that run (and fed the queries typed before it), outside
+the timed region; the other cases first re-type the previous query, untimed.
+"""
+
+import random
+import string
+
+from prompt_toolkit.completion import CompleteEvent
+from prompt_toolkit.document import Document
+
+from askuser.autocomplete import SubstringCompleter
+
+from .harness import REPEAT, best_ms, parser, report, result
+
+DEFAULT_SIZES = (10_000, 100_000, 1_000_000)
+TYPED = ("sk", "sku", "sku-0", "sku-00012", "bl", "blu", "blue", "zq", "zqx")
+
+
+def make_items(n, seed=0):
+    """Synthetic SKU + title strings, e.g. 'SKU-0001234 Blue Widget Large'."""
+    rnd = random.Random(seed)
+    words = ["".join(rnd.choices(string.ascii_lowercase, k=rnd.randint(3, 9))).title() for _ in range(5000)]
+    words += ["Blue", "Red", "Widget", "Large", "Small"]
+    return [f"SKU-{i:07d} " + " ".join(rnd.choices(words, k=3)) for i in range(n)]
+
+
+def cold_completer(items, typed_before):
+    """A new completer that has only seen the queries `typed_before` (setup of a cold case)."""
+    completer = SubstringCompleter(items, 2)
+    for query in typed_before:
+        completer.search(query)
+    return completer
+
+
+def run(sizes, repeat=REPEAT):
+    rows = []
+    for n in sizes:
+        items = make_items(n)
+        rows.append(result("autocomplete", "build", n, best_ms(lambda: SubstringCompleter(items, 2), repeat)))
+        for i, query in enumerate(TYPED):
+            ms = best_ms(lambda c: c.search(query), repeat, setup=lambda: cold_completer(items, TYPED[:i]))
+            rows.append(result("autocomplete", f"cold {query}", n, ms))
+
+        # Warm: every gram has been searched once; each case re-types the previous query first.
+        completer = cold_completer(items, TYPED)
+        event = CompleteEvent(text_inserted=True)
+        cases = {
+            "warm": lambda q: len(completer.search(q)),
+            "top10": lambda q: len(completer.top(q, 10)),
+            "complete": lambda q: sum(1 for _ in completer.get_completions(Document(q), event)),
+        }
+        for phase, case in cases.items():
+            for i, query in enumerate(TYPED):
+                previous = TYPED[i - 1]
+                ms = best_ms(lambda c: case(query), repeat, setup=lambda: completer.search(previous))
+                rows.append(result("autocomplete", f"{phase} {query}", n, ms, hits=case(query)))
+    return rows
+
+
+def main(argv=None):
+    args = parser(__doc__.strip().splitlines()[0], sizes=DEFAULT_SIZES).parse_args(argv)
+    return report(run(args.sizes, args.repeat), args)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,66 @@
+"""
+Benchmark menu building / rendering and the table pickers at realistic sizes.
+
+    python -m benchmarks.bench_menus [--sizes 1000 100000] [--json out.json]
+
+Cases (terminal I/O stubbed; each prompt is answered with a valid key or id):
+    menu_build            Menu(options) and its layout
+    menu_render           the full frame of a fresh Menu, as pretty_menu draws it
+    validate_user_option  one validate_user_option() call (paged above LARGE_MENU options)
+    choose_from_db        one choose_from_db() call over a list of row dicts (first page + id lookup)
+    choose_from_cursor    the same over a sqlite3 cursor, read lazily
+    choose_dict           one choose_dict_from_list_of_dicts() call
+"""
+
+import sqlite3
+
+from askuser.core import choose_dict_from_list_of_dicts, choose_from_db, validate_user_option
+from askuser.menu import Menu, MenuRenderer
+
+from .harness import NullStream, best_ms, parser, report, result, stub_io
+
+RENDERER = MenuRenderer(stream=NullStream(), color=False, width=120)
+
+
+def make_rows(n):
+    return [{"id": i, "title": f"Film {i:07d}", "year": 1950 + i % 75, "festival": f"Fest {i % 300}"}
+            for i in range(1, n + 1)]
+
+
+def make_cursor(rows):
+    db = sqlite3.connect(":memory:")
+    db.execute("create table films (id integer primary key, title text, year integer, festival text)")
+    db.executemany("insert into films values (:id, :title, :year, :festival)", rows)
+    return db
+
+
+def run(sizes, repeat):
+    results = []
+    for n in sizes:
+        options = {str(i): f"Option {i}" for i in range(n)}
+        rows = make_rows(n)
+        db = make_cursor(rows)
+        last_key, first_id = str(n - 1), "1"
+
+        results.append(result("menus", "menu_build", n, best_ms(lambda: Menu(options).layout(), repeat)))
+        results.append(result("menus", "menu_render", n, best_ms(lambda: RENDERER.render(Menu(options)), repeat)))
+        with stub_io(lambda prompt: last_key):
+            results.append(result("menus", "validate_user_option", n,
+                                  best_ms(lambda: validate_user_option("Option:", **options), repeat)))
+        with stub_io(lambda prompt: first_id):
+            results.append(result("menus", "choose_from_db", n, best_ms(lambda: choose_from_db(rows), repeat)))
+            results.append(result("menus", "choose_from_cursor", n,
+                                  best_ms(lambda: choose_from_db(db.execute("select * from films")), repeat)))
+            results.append(result("menus", "choose_dict", n,
+                                  best_ms(lambda: choose_dict_from_list_of_dicts(rows, "id"), repeat)))
+        db.close()
+    return results
+
+
+def main(argv=None):
+    args = parser(__doc__.strip().splitlines()[0], sizes=(1_000, 10_000, 100_000)).parse_args(argv)
+    return report(run(args.sizes, args.repeat), args)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
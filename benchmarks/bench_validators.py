@@ -0,0 +1,120 @@
+"""
+Benchmark validate_input dispatch and every built-in validator over synthetic columns.
+
+    python -m benchmarks.bench_validators [--sizes 1000 100000] [--cases int email] [--json out.json]
+
+Cases:
+    dispatch      validate_input() per value, input stubbed (prompt + validator lookup + call)
+    <type>        validate_many(values, <type>) over a column of mostly valid values
+    bulk_<type>   the column APIs: validate_dates, normalize_urls, validate_emails
+Email deliverability is answered by a local stub, never DNS.
+"""
+
+import random
+import string
+
+from askuser.core import validate_input, validate_many
+from askuser.dates import validate_dates
+from askuser.emails import DomainCache, validate_emails
+from askuser.urls import normalize_urls
+
+from .harness import best_ms, offline_resolver, parser, report, result, stub_io
+
+# One value in INVALID_EVERY is invalid, so error paths are part of the cost.
+INVALID_EVERY = 10
+
+
+def _word(rnd, k=8):
+    return "".join(rnd.choices(string.ascii_lowercase, k=k))
+
+
+def _column(n, valid, invalid, seed=0):
+    rnd = random.Random(seed)
+    return [invalid(rnd, i) if i % INVALID_EVERY == 0 else valid(rnd, i) for i in range(n)]
+
+
+# validation type -> (column factory(n), extra validate_many parameters)
+CASES = {
+    "int": (lambda n: _column(n, lambda r, i: str(r.randint(-10**6, 10**6)), lambda r, i: "12a"),
+            {"minimum": -10**6, "maximum": 10**6}),
+    "float": (lambda n: _column(n, lambda r, i: f"{r.uniform(0, 1000):.3f}", lambda r, i: "1.2.3"), {}),
+    "decimal": (lambda n: _column(n, lambda r, i: f"{r.uniform(0, 1000):.2f}", lambda r, i: "x"), {}),
+    "alpha": (lambda n: _column(n, lambda r, i: _word(r), lambda r, i: "abc1"), {}),
+    "alphanum": (lambda n: _column(n, lambda r, i: _word(r) + str(i), lambda r, i: "a-b"), {}),
+    "yes_no": (lambda n: _column(n, lambda r, i: r.choice("yYnN"), lambda r, i: "maybe"), {}),
+    "custom": (lambda n: _column(n, lambda r, i: f"c{r.randrange(1000)}", lambda r, i: "zz"),
+               {"expected_inputs": [f"c{i}" for i in range(1000)]}),
+    "not_in": (lambda n: _column(n, lambda r, i: f"new-{i}", lambda r, i: f"Taken-{i}"),
+               {"not_in": [f"taken-{i}" for i in range(10_000)]}),
+    "regex": (lambda n: _column(n, lambda r, i: f"SKU-{i:07d}", lambda r, i: "sku"),
+              {"allowed_regex": r"^SKU-\d{7}$"}),
+    "custom_chars": (lambda n: _column(n, lambda r, i: f"{i:x}", lambda r, i: "xyz"),
+                     {"allowed_chars": "0123456789abcdef"}),
+    "date": (lambda n: _column(n, lambda r, i: f"20{r.randint(10, 29)}-{r.randint(1, 12):02}-{r.randint(1, 28):02}",
+                               lambda r, i: "2024-02-30"), {}),
+    "future_date": (lambda n: _column(n, lambda r, i: f"2{r.randint(100, 999)}-01-01 10:00:00",
+                                      lambda r, i: "2000-01-01"), {}),
+    "time": (lambda n: _column(n, lambda r, i: f"{r.randint(0, 23)}:{r.randint(0, 59):02}:{r.randint(0, 59):02}",
+                               lambda r, i: "10:xx"), {}),
+    "url": (lambda n: _column(n, lambda r, i: f"https://{_word(r, 5)}.example.com/p/{i}?q=1",
+                              lambda r, i: "not a url"), {}),
+    "email": (lambda n: _column(n, lambda r, i: f"{_word(r)}.{i}@{_word(r, 4)}{i % 500}.com",
+                                lambda r, i: "no-at-sign"), {}),
+    "phone": (lambda n: _column(n, lambda r, i: f"+1 {r.randint(200, 999)}-555-{r.randint(0, 9999):04}",
+                                lambda r, i: "phone"), {}),
+    "slug": (lambda n: _column(n, lambda r, i: f"{_word(r)} {_word(r)} {i}", lambda r, i: "!!!"), {}),
+    "language": (lambda n: _column(n, lambda r, i: r.choice(["en", "fra", "German", "es", "Japanese"]),
+                                   lambda r, i: "klingon"), {}),
+}
+
+BULK = {
+    "bulk_date": lambda column: validate_dates(column, "date"),
+    "bulk_url": lambda column: normalize_urls(column, protocol="https"),
+    "bulk_email": lambda column: validate_emails(column, resolver=offline_resolver, cache=DomainCache()),
+}
+
+
+def _drain(results):
+    for _ in results:
+        pass
+
+
+def run(sizes, repeat, cases=None):
+    rows = []
+    for n in sizes:
+        answers = [str(i) for i in range(n)]
+        position = iter(())
+
+        def dispatch():
+            nonlocal position
+            position = iter(answers)
+            for _ in range(n):
+                validate_input("Number:", "int")
+
+        with stub_io(lambda prompt: next(position)):
+            if cases is None or "dispatch" in cases:
+                rows.append(result("validators", "dispatch", n, best_ms(dispatch, repeat)))
+            for vt, (make_column, params) in CASES.items():
+                bulk = BULK.get(f"bulk_{vt}")
+                run_many = cases is None or vt in cases
+                run_bulk = bulk is not None and (cases is None or f"bulk_{vt}" in cases)
+                if not (run_many or run_bulk):
+                    continue
+                column = make_column(n)
+                if run_many:
+                    rows.append(result("validators", vt, n,
+                                       best_ms(lambda: _drain(validate_many(column, vt, **params)), repeat)))
+                if run_bulk:
+                    rows.append(result("validators", f"bulk_{vt}", n, best_ms(lambda: _drain(bulk(column)), repeat)))
+    return rows
+
+
+def main(argv=None):
+    p = parser(__doc__.strip().splitlines()[0], sizes=(1_000, 10_000, 100_000))
+    p.add_argument("--cases", nargs="+", help="only these cases (e.g. dispatch int bulk_email)")
+    args = p.parse_args(argv)
+    return report(run(args.sizes, args.repeat, args.cases), args)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
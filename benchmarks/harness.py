@@ -0,0 +1,153 @@
+"""
+Shared pieces of the benchmark suites: timing, stubbed terminal / network I/O, and
+machine-readable results with a comparison against a saved baseline.
+
+Every suite yields result rows {"bench", "case", "size", "ms", ...}: the best of `--repeat` runs
+of one case at one dataset size. Common options:
+
+    --sizes 1000 100000       dataset sizes (items)
+    --json results.json       save the results
+    --compare baseline.json   print the ratio to a saved run; exit status 1 when a case got
+                              slower than --threshold (default 1.25x)
+"""
+
+import argparse
+import contextlib
+import json
+import platform
+import sys
+import time
+from typing import Callable, Iterable, List, Optional
+
+DEFAULT_SIZES = (1_000, 10_000, 100_000, 1_000_000)
+REPEAT = 3
+# A case slower than this ratio to the baseline is reported as a regression.
+THRESHOLD = 1.25
+# Cases faster than this (ms) in the baseline are too noisy to flag.
+NOISE_FLOOR_MS = 0.5
+# Runs slower than this (ms) are not repeated.
+SLOW_RUN_MS = 2_000
+
+
+def best_ms(func: Callable, repeat: int = REPEAT, setup: Callable = None) -> float:
+    """
+    Best wall time of `repeat` calls of func(), in ms (one call if it takes over SLOW_RUN_MS).
+    With `setup`, each call is func(setup()), and setup() is not timed.
+    """
+    best = None
+    for _ in range(repeat):
+        if setup is None:
+            start = time.perf_counter()
+            func()
+        else:
+            state = setup()
+            start = time.perf_counter()
+            func(state)
+        ms = (time.perf_counter() - start) * 1000
+        best = ms if best is None else min(best, ms)
+        if ms > SLOW_RUN_MS:
+            break
+    return best
+
+
+def result(bench: str, case: str, size: int, ms: float, **extra) -> dict:
+    return {"bench": bench, "case": case, "size": size, "ms": round(ms, 4), **extra}
+
+
+class NullStream:
+    """Write-only text stream that drops its input (not a terminal)."""
+
+    def write(self, text):
+        return len(text)
+
+    def flush(self):
+        pass
+
+    def isatty(self):
+        return False
+
+
+@contextlib.contextmanager
+def stub_io(answers: Callable[[str], str]):
+    """
+    Run prompts without a terminal: `askuser.core.input_custom` returns answers(prompt),
+    stdout and menus go to a NullStream, and email deliverability never touches DNS.
+    """
+    import askuser.core as core
+    import askuser.emails as emails
+    from askuser.menu import MenuRenderer, set_menu_renderer
+
+    saved_input, saved_resolver = core.input_custom, emails.dns_resolver
+    sink = NullStream()
+    previous_renderer = set_menu_renderer(MenuRenderer(stream=sink, color=False))
+    core.input_custom = answers
+    emails.dns_resolver = offline_resolver
+    try:
+        with contextlib.redirect_stdout(sink):
+            yield
+    finally:
+        core.input_custom, emails.dns_resolver = saved_input, saved_resolver
+        set_menu_renderer(previous_renderer)
+
+
+def offline_resolver(domain: str) -> Optional[str]:
+    """Deliverability stub: every domain but *.invalid accepts mail."""
+    return "The domain name does not exist." if domain.endswith(".invalid") else None
+
+
+def parser(description: str, sizes: Iterable[int] = DEFAULT_SIZES) -> argparse.ArgumentParser:
+    p = argparse.ArgumentParser(description=description)
+    p.add_argument("--sizes", type=int, nargs="+", default=list(sizes))
+    p.add_argument("--repeat", type=int, default=REPEAT)
+    p.add_argument("--json", metavar="PATH", help="write the results to PATH")
+    p.add_argument("--compare", metavar="PATH", help="compare with the results saved in PATH")
+    p.add_argument("--threshold", type=float, default=THRESHOLD)
+    return p
+
+
+def print_rows(rows: List[dict]):
+    print(f"{'bench':>12} {'case':>24} {'size':>9} {'ms':>10}")
+    for row in rows:
+        print(f"{row['bench']:>12} {row['case']:>24} {row['size']:>9} {row['ms']:>10.3f}")
+
+
+def save(rows: List[dict], path: str):
+    payload = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": rows,
+    }
+    with open(path, "w") as f:
+        json.dump(payload, f, indent=1)
+
+
+def compare(rows: List[dict], path: str, threshold: float = THRESHOLD) -> List[dict]:
+    """Print each case's ratio to the baseline in `path`; return the rows slower than `threshold`."""
+    with open(path) as f:
+        baseline = {(r["bench"], r["case"], r["size"]): r["ms"] for r in json.load(f)["results"]}
+    regressions = []
+    print(f"\n{'bench':>12} {'case':>24} {'size':>9} {'base ms':>10} {'ms':>10} {'ratio':>7}")
+    for row in rows:
+        base = baseline.get((row["bench"], row["case"], row["size"]))
+        if base is None:
+            continue
+        ratio = row["ms"] / base if base else float("inf")
+        slower = ratio > threshold and base >= NOISE_FLOOR_MS
+        if slower:
+            regressions.append(row)
+        print(f"{row['bench']:>12} {row['case']:>24} {row['size']:>9} {base:>10.3f} {row['ms']:>10.3f} "
+              f"{ratio:>6.2f}x{'  REGRESSION' if slower else ''}")
+    return regressions
+
+
+def report(rows: List[dict], args) -> int:
+    """Print / save / compare the results as asked on the command line; return the exit status."""
+    print_rows(rows)
+    if args.json:
+        save(rows, args.json)
+    if args.compare:
+        regressions = compare(rows, args.compare, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} case(s) slower than {args.threshold}x the baseline", file=sys.stderr)
+            return 1
+    return 0
@@ -0,0 +1,121 @@
+import asyncio
+import threading
+
+import pytest
+
+from askuser import MaxAttemptsExceeded
+from askuser.aio import (
+    user_prompt_async,
+    validate_input_async,
+    validate_user_option_async,
+    validate_user_option_enumerated_async,
+    validate_user_option_multi_async,
+    validate_user_option_ranges_async,
+    validate_user_option_value_async,
+    validate_user_option_value_multi_async,
+    yes_async,
+)
+from askuser.autocomplete import SubstringCompleter
+from askuser.custom_validators import register_validator, unregister_validator
+
+
+def setup_input(monkeypatch, inputs, delay=0.0):
+    gen = iter(inputs)
+
+    async def fake_input(prompt):
+        await asyncio.sleep(delay)
+        return next(gen)
+
+    monkeypatch.setattr('askuser.aio.input_async', fake_input)
+    monkeypatch.setattr('askuser.core.input_custom', lambda prompt: pytest.fail('blocking input used'))
+
+
+def test_validate_input_async_does_not_block_the_loop(monkeypatch, capsys):
+    setup_input(monkeypatch, ['x', '5'], delay=0.02)
+    ticks = []
+
+    async def ticker():
+        while True:
+            ticks.append(1)
+            await asyncio.sleep(0.001)
+
+    async def main():
+        task = asyncio.ensure_future(ticker())
+        try:
+            return await validate_input_async('Number', 'int', maximum=10)
+        finally:
+            task.cancel()
+
+    assert asyncio.run(main()) == 5
+    assert len(ticks) > 5
+    assert 'Error: Integer values only.' in capsys.readouterr().out
+
+
+def test_validate_input_async_default_and_max_attempts(monkeypatch):
+    setup_input(monkeypatch, ['', 'a', 'b'])
+    assert asyncio.run(validate_input_async('N', 'int', default=7)) == 7
+    with pytest.raises(MaxAttemptsExceeded):
+        asyncio.run(validate_input_async('N', 'int', max_attempts=2))
+
+
+def test_registered_validators_run_in_an_executor(monkeypatch):
+    threads = []
+
+    def is_known(user_input):
+        threads.append(threading.get_ident())
+        if user_input != 'ok':
+            raise ValueError('unknown')
+        return user_input
+
+    async def is_known_async(user_input):
+        return user_input.upper()
+
+    register_validator('known', is_known, overwrite=True)
+    register_validator('known_async', is_known_async, overwrite=True)
+    try:
+        setup_input(monkeypatch, ['no', 'ok', 'ok', 'fine'])
+        assert asyncio.run(validate_input_async('Name', 'known')) == 'ok'
+        assert threads and threading.get_ident() not in threads
+        threads.clear()
+        assert asyncio.run(validate_input_async('Name', 'known', offload=False)) == 'ok'
+        assert threads == [threading.get_ident()]
+        assert asyncio.run(validate_input_async('Name', 'known_async')) == 'FINE'
+    finally:
+        unregister_validator('known')
+        unregister_validator('known_async')
+
+
+def test_menus_async(monkeypatch, capsys):
+    setup_input(monkeypatch, ['x', '1', 'b', '2', 'a', 'd', '0-2,!1', ''])
+    assert asyncio.run(validate_user_option_async('Pick', 'A', 'B')) == '1'
+    assert asyncio.run(validate_user_option_value_async('Pick', a='Apple', b='Banana')) == 'Banana'
+    assert asyncio.run(validate_user_option_enumerated_async({10: 'X', 20: 'Y'}, start=1)) == (20, 'Y')
+    assert asyncio.run(validate_user_option_value_multi_async('Pick', a='Apple', b='Banana')) == ['Apple']
+    assert asyncio.run(validate_user_option_ranges_async('Select', 'A', 'B', 'C')) == ['0', '2']
+    assert "expected ['0', '1', 'q']" in capsys.readouterr().out
+
+
+def test_multi_and_large_menu_async(monkeypatch):
+    options = {f'k{i:03d}': f'Option {i}' for i in range(300)}
+    setup_input(monkeypatch, ['>', '/Option 29', 'k299', 'k010', 'k005', 'd'])
+    assert asyncio.run(validate_user_option_async('Pick', **options)) == 'k299'
+    assert asyncio.run(validate_user_option_multi_async('Pick', **options)) == ['k010', 'k005']
+
+
+def test_yes_async(monkeypatch):
+    setup_input(monkeypatch, ['Y', ''])
+    assert asyncio.run(yes_async('Deploy?')) is True
+    assert asyncio.run(yes_async('Deploy?', default='n')) is False
+
+
+def test_user_prompt_async(monkeypatch):
+    seen = {}
+
+    class Session:
+        async def prompt_async(self, msg, completer=None, **kwargs):
+            seen.update(kwargs, completer=completer)
+            return 'key2'
+
+    monkeypatch.setattr('askuser.aio.PromptSession', Session)
+    assert asyncio.run(user_prompt_async('Key', {'key1': 1, 'key2': 2}, return_value=True)) == 2
+    assert isinstance(seen['completer'], SubstringCompleter) and 'complete_in_thread' not in seen
@@ -0,0 +1,117 @@
+import asyncio
+import json
+
+import pytest
+
+import askuser.answers as answers
+from askuser.aio import validate_input_async, validate_user_option_ranges_async
+from askuser.answers import AnswerSource, answers_from, load_answers, set_answer_source
+from askuser.autocomplete import user_prompt
+from askuser.core import (
+    choose_from_db, validate_input, validate_user_option, validate_user_option_multi,
+    validate_user_option_ranges, validate_user_option_value, yes,
+)
+from askuser.exceptions import AnswerError
+from askuser.logic import is_url
+
+
+@pytest.fixture(autouse=True)
+def no_terminal(monkeypatch):
+    """Scripted prompts must never read the terminal."""
+    def input_custom(prompt):
+        raise AssertionError(f"read the terminal for {prompt!r}")
+    monkeypatch.setattr('askuser.core.input_custom', input_custom)
+
+
+ROWS = [{"id": i, "title": f"Film {i}"} for i in range(1, 121)]
+
+
+def test_sequence_answers_every_prompt_in_order(capsys):
+    with answers_from(["42", "", "b", "3", "0", "d", "1,3", ""]) as source:
+        assert validate_input("Count", "int") == 42
+        assert yes("Deploy?", default="y") is True
+        assert validate_user_option_value("Pick:", a="Action", b="Comedy") == "Comedy"
+        assert choose_from_db(ROWS[:10])[0] == 3
+        assert validate_user_option_multi("Option:", "x", "y") == ["0"]
+        assert validate_user_option_ranges("Select:", "a", "b", "c", "d") == ["1", "3"]
+    assert source.unused() == [] and source.asked == 8
+    assert capsys.readouterr().out == ""  # nothing rendered
+
+
+def test_keyed_answers_match_the_prompt_message():
+    script = {"environment": "staging", "DEPLOY": True, "Replicas:": 3, "Option": ["1", "d"]}
+    with answers_from(script) as source:
+        assert validate_user_option_value("Environment:", staging="Staging", prod="Production") == "Staging"
+        assert validate_input("Replicas", "int", maximum=10) == 3
+        assert validate_input("Replicas", "int", maximum=10) == 3  # a single value answers every time
+        assert yes("Deploy?") is True
+        assert validate_user_option_multi("Option:", "x", "y") == ["1"]
+        with pytest.raises(AnswerError, match="all its answers were used"):
+            validate_user_option("Option:", "x")
+    assert source.unused() == []
+
+
+def test_missing_answer_fails_fast():
+    with answers_from({"name": "ok"}) as source:
+        with pytest.raises(AnswerError) as exc_info:
+            validate_input("Age", "int")
+        assert exc_info.value.answer is None and exc_info.value.prompt == "Age"
+    assert source.unused() == ["name"]
+    with answers_from([]):
+        with pytest.raises(AnswerError, match="all 0 answers were used"):
+            yes("Continue?")
+
+
+@pytest.mark.parametrize("call", [
+    lambda: validate_input("Count", "int", maximum=10),
+    lambda: validate_user_option("Option:", "a", "b"),
+    lambda: validate_user_option("Option:", *[f"option {i}" for i in range(300)]),  # paged menu
+    lambda: validate_user_option_ranges("Select:", "a", "b"),
+    lambda: choose_from_db(ROWS, page_size=50),  # paged table
+    lambda: is_url("example.com", http_protocol_required=True),
+])
+def test_invalid_answer_fails_fast(call, capsys):
+    with answers_from(["x9"]):
+        with pytest.raises(AnswerError) as exc_info:
+            call()
+    err = exc_info.value
+    assert err.answer == "x9" and err.error is not None and err.__cause__ is err.error
+    assert capsys.readouterr().out == ""
+
+
+def test_render_keeps_the_menus():
+    with answers_from(["1"], render=True):
+        assert validate_user_option("Option:", "a", "b") == "1"
+
+
+def test_user_prompt_and_async_prompts():
+    with answers_from(["us", "nope", "7", "0-2", ""]):
+        assert user_prompt("Country:", {"us": "United States"}, return_value=True) == "United States"
+        with pytest.raises(AnswerError):
+            user_prompt("Country:", {"us": "United States"}, return_value=True)
+        assert asyncio.run(validate_input_async("Count", "int")) == 7
+        assert asyncio.run(validate_user_option_ranges_async("Select:", "a", "b", "c", "d")) == ["0", "1", "2"]
+
+
+def test_load_answers_from_files(tmp_path):
+    (tmp_path / "a.json").write_text(json.dumps({"Name": "Ada", "Tags": ["x", "y"]}))
+    (tmp_path / "a.yaml").write_text("Name: Ada\nDeploy: yes\nReplicas: 3\n")
+    (tmp_path / "a.txt").write_text("Ada\n\n3\n")
+    with answers_from(tmp_path / "a.json"):
+        assert validate_input("Name:", "alpha") == "Ada"
+    source = load_answers(tmp_path / "a.txt")
+    assert [source.answer("any") for _ in range(3)] == ["Ada", "", "3"]
+    pytest.importorskip("yaml")
+    source = load_answers(tmp_path / "a.yaml")
+    assert source.answer("Deploy?") == "y" and source.answer("replicas") == "3"
+
+
+def test_environment_variable_sets_the_source(tmp_path, monkeypatch):
+    (tmp_path / "answers.txt").write_text("5\n")
+    monkeypatch.setenv(answers.ANSWERS_ENV, str(tmp_path / "answers.txt"))
+    monkeypatch.setattr(answers, "_source", answers._UNSET)
+    try:
+        assert validate_input("Count", "int") == 5
+        assert isinstance(answers.get_answer_source(), AnswerSource)
+    finally:
+        set_answer_source(None)
@@ -1,6 +1,10 @@
+import asyncio
+from functools import partial
+from types import SimpleNamespace
+
 import pytest
 
-from askuser.autocomplete import user_prompt
+from askuser.autocomplete import user_prompt, SubstringCompleter, SourceCompleter, clear_completer_cache
 
 
 class DummySession:
@@ -27,3 +31,168 @@ def test_user_prompt_dict(monkeypatch):
 def test_user_prompt_invalid_items():
     with pytest.raises(ValueError):
         user_prompt('Enter', 'not a list')
+
+
+class DummyDoc:
+    def __init__(self, text):
+        self.text_before_cursor = text
+
+
+def completions(completer, text):
+    return [c.text for c in completer.get_completions(DummyDoc(text), None)]
+
+
+def test_substring_completer_case_insensitive_in_order():
+    items = ['Red Apple', 'banana', 'PINEAPPLE', 'Grape', 'apple pie']
+    c = SubstringCompleter(items, min_chars=2)
+    assert completions(c, 'ap') == ['Red Apple', 'PINEAPPLE', 'Grape', 'apple pie']
+    assert completions(c, 'I want APPL') == ['Red Apple', 'PINEAPPLE', 'apple pie']
+    assert completions(c, 'pineapple') == ['PINEAPPLE']
+    assert completions(c, 'kiwi') == []
+    assert completions(c, 'a') == []  # below min_chars
+
+
+def test_substring_completer_start_position_uses_typed_word():
+    c = SubstringCompleter(['Straße'], min_chars=2)
+    [completion] = c.get_completions(DummyDoc('STRASS'), None)  # casefold('ß') == 'ss'
+    assert completion.start_position == -len('STRASS')
+
+
+def test_substring_completer_reuses_gram_postings():
+    c = SubstringCompleter(['alpha', 'alphabet', 'beta'], min_chars=2)
+    assert list(c.search('al')) == [0, 1]
+    assert list(c.search('be')) == [1, 2]
+    assert list(c.search('alpha')) == [0, 1]
+    assert {'al', 'be', 'alp'} <= set(c._postings)
+
+
+def test_substring_completer_narrows_from_last_query(monkeypatch):
+    c = SubstringCompleter(['alpha', 'alphabet', 'beta'], min_chars=2)
+    assert list(c.search('ph')) == [0, 1]
+    monkeypatch.setattr(c, '_scan', None)  # any new scan would now fail
+    assert list(c.search('pha')) == [0, 1]
+    assert list(c.search('alphab')) == [1]
+
+
+def test_substring_completer_top_k_ranking():
+    items = ['Cheddar Cheese', 'Grated cheese', 'Macheesmo', 'Cheese Board', 'Blue Cheese Dip']
+    c = SubstringCompleter(items, min_chars=2, max_results=3)
+    # prefix matches first, then word-boundary matches, original order within a rank
+    assert completions(c, 'chees') == ['Cheese Board', 'Cheddar Cheese', 'Grated cheese']
+    assert [items[i] for i in c.top('chees', 10)][-1] == 'Macheesmo'
+
+
+def test_user_prompt_reuses_completer(monkeypatch):
+    seen = []
+
+    class RecordingSession(DummySession):
+        def prompt(self, msg, completer=None):
+            seen.append(completer)
+            return self.response
+
+    monkeypatch.setattr('askuser.autocomplete.PromptSession', lambda: RecordingSession('apple'))
+    fruits = ('apple', 'banana')
+    user_prompt('Enter', fruits)
+    user_prompt('Enter', fruits)
+    assert seen[0] is seen[1]
+    clear_completer_cache()
+    user_prompt('Enter', fruits)
+    assert seen[2] is not seen[1]
+    prebuilt = SubstringCompleter(list(fruits), min_chars=1)
+    user_prompt('Enter', prebuilt)
+    assert seen[3] is prebuilt
+
+
+def test_user_prompt_indexes_lists_and_dicts_afresh(monkeypatch):
+    seen = []
+
+    class RecordingSession(DummySession):
+        def prompt(self, msg, completer=None):
+            seen.append(list(completer.search('an')))
+            return self.response
+
+    monkeypatch.setattr('askuser.autocomplete.PromptSession', lambda: RecordingSession('x'))
+    fruits = ['apple', 'banana']
+    user_prompt('Enter', fruits)
+    fruits[0] = 'mango'   # same length, edited in place
+    user_prompt('Enter', fruits)
+    codes = {'us': 'United States', 'uk': 'United Kingdom'}
+    user_prompt('Enter', codes)
+    codes['an'] = codes.pop('uk')
+    user_prompt('Enter', codes)
+    assert seen == [[1], [0, 1], [], [1]]
+
+
+def collect_async(completer, text):
+    async def run():
+        return [c.text async for c in completer.get_completions_async(DummyDoc(text), None)]
+    return asyncio.run(run())
+
+
+def test_source_completer_sync_and_async_sources():
+    fruits = ['apple', 'apricot', 'banana']
+
+    def lookup(word):
+        return [f for f in fruits if f.startswith(word)]
+
+    async def lookup_async(word):
+        await asyncio.sleep(0)
+        return lookup(word)
+
+    class AsyncLookup:
+        async def __call__(self, word):
+            return lookup(word)
+
+    def decorated(func):
+        def wrapper(word):  # not itself a coroutine function
+            return func(word)
+        return wrapper
+
+    for source in (lookup, lookup_async, partial(lookup_async), AsyncLookup(), decorated(lookup_async)):
+        c = SourceCompleter(source, min_chars=2, max_results=1)
+        assert completions(c, 'ap') == ['apple']
+        assert collect_async(c, 'ap') == ['apple']
+        assert collect_async(c, 'a') == []  # below min_chars
+
+
+def test_source_completer_cancels_stale_query(monkeypatch):
+    from prompt_toolkit.buffer import Buffer
+
+    buffer = Buffer()
+    monkeypatch.setattr('askuser.autocomplete.get_app_or_none', lambda: SimpleNamespace(current_buffer=buffer))
+    cancelled = []
+
+    async def slow_source(word):
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(word)
+            raise
+        return [word]
+
+    async def run():
+        c = SourceCompleter(slow_source)
+        consumer = asyncio.ensure_future(collect(c.get_completions_async(DummyDoc('ab'), None)))
+        await asyncio.sleep(0.01)
+        buffer.text = 'abc'  # user keeps typing
+        return await asyncio.wait_for(consumer, 1)
+
+    async def collect(agen):
+        return [c async for c in agen]
+
+    assert asyncio.run(run()) == []
+    assert cancelled == ['ab']
+
+
+def test_user_prompt_callable_source_in_thread(monkeypatch):
+    seen = {}
+
+    class RecordingSession(DummySession):
+        def prompt(self, msg, completer=None, **kwargs):
+            seen.update(kwargs, completer=completer)
+            return self.response
+
+    monkeypatch.setattr('askuser.autocomplete.PromptSession', lambda: RecordingSession('apple'))
+    assert user_prompt('Fruit', lambda word: ['apple'], complete_in_thread=True) == 'apple'
+    assert isinstance(seen['completer'], SourceCompleter)
+    assert seen['complete_in_thread'] is True
@@ -1,9 +1,16 @@
+import sqlite3
+
+import pytest
+
+import askuser.core as core
 from askuser.core import (
     validate_input, validate_user_option,
     validate_user_option_value, validate_user_option_enumerated,
     choose_from_db, choose_dict_from_list_of_dicts, yes,
     validate_user_option_multi, validate_user_option_value_multi,
+    validate_many,
 )
+from askuser.exceptions import MaxAttemptsExceeded, ValidationError
 
 
 # ---------- Helpers ----------
@@ -31,6 +38,31 @@ def test_validate_input_int(monkeypatch):
     assert validate_input('Enter number', 'int') == 42
 
 
+def test_validate_input_prints_error_and_reprompts(monkeypatch, capsys):
+    setup_input(monkeypatch, ['abc', '50', '5'])
+    assert validate_input('Enter number', 'int', maximum=10) == 5
+    out = capsys.readouterr().out
+    assert 'Integer values only.' in out and '50 is greater than 10' in out
+
+
+def test_validate_input_retries_without_recursion(monkeypatch, capsys):
+    setup_input(monkeypatch, ['abc'] * 5000 + ['5'])
+    assert validate_input('Enter number', 'int') == 5
+    assert capsys.readouterr().out.count('Integer values only.') == 5000
+
+
+def test_validate_input_max_attempts(monkeypatch):
+    setup_input(monkeypatch, ['abc', '50', '5'])
+    seen = []
+    with pytest.raises(MaxAttemptsExceeded) as exc_info:
+        validate_input('Enter number', 'int', maximum=10, max_attempts=2,
+                       on_invalid=lambda user_input, error, attempt: seen.append((user_input, error.code, attempt)))
+    assert seen == [('abc', 'not_int', 1), ('50', 'too_large', 2)]
+    err = exc_info.value
+    assert err.code == 'max_attempts' and err.attempts == 2
+    assert isinstance(err.__cause__, ValidationError) and err.last_error.code == 'too_large'
+
+
 def test_validate_input_default(monkeypatch):
     setup_input(monkeypatch, [''])
     assert validate_input('Enter number', 'int', default=7) == 7
@@ -46,6 +78,37 @@ def test_validate_input_not_in(monkeypatch):
     assert validate_input('Value?', 'not_in', not_in=['old', 'existing']) == 'new'
 
 
+def test_validate_many_streams_results(capsys):
+    results = validate_many(iter(['1', 'x', '', '30']), 'int', maximum=20, default=0)
+    assert next(results) == (0, '1', 1, None)   # lazy: nothing is read ahead
+    rest = list(results)
+    assert [r.ok for r in rest] == [False, True, False]
+    assert rest[1].value == 0                   # blank -> default
+    assert isinstance(rest[0].error, ValueError)
+    assert capsys.readouterr() == ('', '')      # no prompts, no colored errors
+
+
+def test_validate_many_uses_extra_params_and_registry():
+    res = list(validate_many(['usd', 'gbp'], 'CUSTOM', expected_inputs=['usd', 'eur']))
+    assert [r.value for r in res] == ['usd', None]
+    assert not res[1].ok
+
+
+def test_validate_many_compiles_pattern_once():
+    from askuser.logic import compile_pattern
+    compile_pattern.cache_clear()
+    res = validate_many(['a1', 'b2', 'c', '33'], 'regex', allowed_regex=r'^[a-z]\d$')
+    assert [r.ok for r in res] == [True, True, False, False]
+    assert compile_pattern.cache_info().misses == 1
+
+
+def test_validate_many_rejects_unknown_type_up_front():
+    with pytest.raises(ValueError):
+        validate_many(['1'], 'nope')
+    with pytest.raises(ValueError):
+        validate_many(['1'], 'regex')  # missing allowed_regex
+
+
 def test_yes_function(monkeypatch):
     setup_input(monkeypatch, ['y'])
     assert yes('Continue?') is True
@@ -99,12 +162,96 @@ def test_choose_from_db_xq(monkeypatch):
     assert idx == 'xq' and val == 'quit'
 
 
+def test_choose_from_db_pages_large_results(monkeypatch, capsys):
+    data = [{'id': i, 'name': f'row-{i}'} for i in range(1, 121)]
+    setup_input(monkeypatch, ['n', 'g 3', 'p', '/ROW-11', 'bogus', '/', '77'])
+    idx, row = choose_from_db(data, page_size=50)
+    assert idx == 77 and row == {'id': 77, 'name': 'row-77'}
+    out = capsys.readouterr().out
+    for header in ('Page 1/3 (120 rows)', 'Page 2/3', 'Page 3/3', "Page 1/1 (11 rows matching 'ROW-11')"):
+        assert header in out
+    assert "'bogus' is not an id" in out
+    assert out.count('row-120') == 1  # only shown on the last page
+
+
+def test_choose_from_db_page_only_formats_displayed_rows(monkeypatch):
+    rendered = []
+    monkeypatch.setattr('askuser.table.RowTable.render', lambda self, offsets: rendered.append(len(offsets)) or '')
+    setup_input(monkeypatch, ['xq'])
+    assert choose_from_db([{'id': i} for i in range(1000)], xq=True) == ('xq', 'quit')
+    assert rendered == [50]
+
+
+def test_choose_from_db_pages_report_metrics_and_page_size_zero_disables_paging(monkeypatch, capsys):
+    from askuser.metrics import collect_metrics
+    data = [{'id': i} for i in range(1, 121)]
+    setup_input(monkeypatch, ['n', 'bogus', '77', '120'])
+    seen = []
+    with collect_metrics(seen.append):
+        assert choose_from_db(data)[0] == 77
+    assert [(m.validation_type, m.entries, m.invalid, m.outcome) for m in seen] == [
+        ('choose_from_db', 1, 0, 'valid'), ('choose_from_db', 2, 1, 'valid')]
+    capsys.readouterr()
+    assert choose_from_db(data, page_size=0)[0] == 120
+    out = capsys.readouterr().out
+    assert 'Page ' not in out and '120' in out
+
+
+def test_choose_from_db_sqlite_cursor(monkeypatch, capsys):
+    conn = sqlite3.connect(':memory:')
+    conn.execute('CREATE TABLE movies (id INTEGER PRIMARY KEY, title TEXT)')
+    conn.executemany('INSERT INTO movies VALUES (?, ?)', ((i, f'Movie {i}') for i in range(1, 10_001)))
+    cursor = conn.execute('SELECT id, title FROM movies ORDER BY id')
+    setup_input(monkeypatch, ['n', '73'])
+    assert choose_from_db(cursor, page_size=20) == (73, {'id': 73, 'title': 'Movie 73'})
+    assert 'Page 2/3+ (60+ rows)' in capsys.readouterr().out
+
+
+@pytest.mark.parametrize('rows, columns', [
+    ([(1, 'One'), (2, 'Two')], ['id', 'name']),
+    ({'id': [1, 2], 'name': ['One', 'Two']}, None),
+    (iter([(1, 'One'), (2, 'Two')]), ['id', 'name']),
+])
+def test_choose_from_db_columnar_rows(monkeypatch, capsys, rows, columns):
+    setup_input(monkeypatch, ['2'])
+    assert choose_from_db(rows, columns=columns) == (2, {'id': 2, 'name': 'Two'})
+    assert 'One' in capsys.readouterr().out
+
+
+def test_choose_from_db_numpy_structured_array(monkeypatch):
+    np = pytest.importorskip('numpy')
+    rows = np.array([(1, 'One'), (2, 'Two')], dtype=[('id', 'i8'), ('name', 'U10')])
+    setup_input(monkeypatch, ['2'])
+    idx, row = choose_from_db(rows)
+    assert idx == 2 and row['name'] == 'Two'
+
+
 def test_choose_dict_from_list_of_dicts(monkeypatch):
     # Monkeypatch validate_user_option to return key directly
     monkeypatch.setattr('askuser.core.validate_user_option', lambda msg, **kwargs: 'Banana')
     fruits = [{'name': 'Apple', 'color': 'red'}, {'name': 'Banana', 'color': 'yellow'}]
     chosen = choose_dict_from_list_of_dicts(fruits, 'name')
     assert chosen['color'] == 'yellow'
+    assert chosen is fruits[1]
+
+
+def test_choose_dict_from_tuple_rows(monkeypatch, capsys):
+    setup_input(monkeypatch, ['Banana'])
+    fruits = [('Apple', 'red', 1), ('Banana', 'yellow', 2)]
+    chosen = choose_dict_from_list_of_dicts(fruits, 'name', columns=['name', 'color', 'rank'])
+    assert chosen == {'name': 'Banana', 'color': 'yellow', 'rank': 2}
+    assert ": ['rank: 1', 'color: red']" in capsys.readouterr().out
+
+
+def test_choose_dict_formats_only_the_rows_shown(monkeypatch, capsys):
+    monkeypatch.setenv('LINES', '30')
+    formatted = []
+    row_label_str = core._RowLabel.__str__
+    monkeypatch.setattr(core._RowLabel, '__str__', lambda self: formatted.append(self.offset) or row_label_str(self))
+    setup_input(monkeypatch, ['999'])
+    rows = [{'id': i, 'title': f'Film {i}'} for i in range(1000)]
+    assert choose_dict_from_list_of_dicts(rows, 'id') is rows[999]
+    assert 0 < len(formatted) < 500 and 'Film 999' not in capsys.readouterr().out
 
 
 # ---------- multi-select tests ----------
@@ -191,3 +338,12 @@ def test_substring_completer_basic():
     c = SubstringCompleter(["Alpha", "Beta", "Gamma"], min_chars=2)
     out = list(c.get_completions(DummyDoc("al"), None))
     assert any(x.text == "Alpha" for x in out)
+
+
+def test_validate_input_not_in_converts_once(monkeypatch):
+    calls = []
+    real = core.as_casefold_set
+    monkeypatch.setattr(core, 'as_casefold_set', lambda values: calls.append(values) or real(values))
+    setup_input(monkeypatch, ['Old', 'EXISTING', 'new'])
+    assert validate_input('Value?', 'not_in', not_in=['old', 'existing']) == 'new'
+    assert len(calls) == 1
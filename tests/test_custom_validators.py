@@ -1,3 +1,7 @@
+import sys
+import types
+from importlib.metadata import EntryPoint
+
 import pytest
 
 from askuser import validate_input
@@ -7,6 +11,7 @@ from askuser.custom_validators import (
     register_validators,
     unregister_validator,
 )
+from askuser.registry import ENTRY_POINT_GROUP, ValidatorRegistry
 
 def test_register_validator_and_validate_input(monkeypatch):
     # Patch input_custom inside askuser.core (same style as your other tests)
@@ -49,3 +54,56 @@ def test_register_validators_bulk_and_get_validators():
 
 def test_unregister_missing_is_false():
     assert unregister_validator("does_not_exist") is False
+
+
+@pytest.fixture
+def plugin_module(tmp_path, monkeypatch):
+    """An importable module `askuser_test_plugin` with an `is_upper` validator."""
+    (tmp_path / "askuser_test_plugin.py").write_text(
+        "def is_upper(user_input):\n"
+        "    if not user_input.isupper():\n"
+        "        raise ValueError('Must be upper case')\n"
+        "    return user_input\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.delitem(sys.modules, "askuser_test_plugin", raising=False)
+    return "askuser_test_plugin"
+
+
+def test_register_validator_by_path_imports_on_first_use(monkeypatch, plugin_module):
+    monkeypatch.setattr("askuser.core.input_custom", lambda prompt: "ABC")
+    register_validator("upper", f"{plugin_module}:is_upper", overwrite=True)
+    try:
+        assert plugin_module not in sys.modules
+        assert validate_input("Enter:", "upper") == "ABC"
+        assert plugin_module in sys.modules
+        assert get_validators()["upper"] is sys.modules[plugin_module].is_upper
+    finally:
+        unregister_validator("upper")
+
+
+def test_register_validator_rejects_bad_paths():
+    with pytest.raises(ValueError):
+        register_validator("bad_path", "no_module_part", overwrite=True)
+    register_validator("missing", "askuser_no_such_module:func", overwrite=True)
+    try:
+        with pytest.raises(ImportError):
+            get_validators()["missing"]
+    finally:
+        unregister_validator("missing")
+
+
+def test_entry_points_are_discovered_on_first_miss(monkeypatch, plugin_module):
+    eps = [EntryPoint(name="Upper", value=f"{plugin_module}:is_upper", group=ENTRY_POINT_GROUP),
+           EntryPoint(name="int", value=f"{plugin_module}:is_upper", group=ENTRY_POINT_GROUP)]
+    lookups = []
+    monkeypatch.setattr("askuser.registry._entry_points", lambda group: lookups.append(group) or eps)
+    registry = ValidatorRegistry({"int": int})
+
+    assert "int" in registry and lookups == []
+    assert "upper" in registry and lookups == [ENTRY_POINT_GROUP]
+    assert "other" not in registry and lookups == [ENTRY_POINT_GROUP]
+    assert registry["int"] is int  # entry points never replace a registered name
+    assert plugin_module not in sys.modules
+    assert registry.get("upper")("ABC") == "ABC"
+    assert isinstance(registry.get("upper"), types.FunctionType)
@@ -0,0 +1,83 @@
+import datetime
+
+import pytest
+
+from askuser.dates import DateParser, check_date, validate_dates
+from askuser.exceptions import ValidationError
+from askuser.logic import is_valid_date, is_valid_date_future, is_valid_time
+
+
+def test_date_validators_keep_returning_strings():
+    assert is_valid_date('2024-01-05') == '2024-01-05'
+    assert is_valid_date('2024-1-5 10:00:00') == '2024-1-5 10:00:00'
+    assert is_valid_time('1:2:3') == '01:02:03'
+    assert is_valid_time('90') == '00:01:30'
+
+
+def test_date_validators_return_objects_on_request():
+    assert is_valid_date('2024-01-05', as_object=True) == datetime.date(2024, 1, 5)
+    assert is_valid_date('2024-01-05 10:30:00', as_object=True) == datetime.datetime(2024, 1, 5, 10, 30)
+    assert is_valid_date_future('2999-12-31', as_object=True) == datetime.date(2999, 12, 31)
+    assert is_valid_time('10:30:05', as_object=True) == datetime.time(10, 30, 5)
+
+
+@pytest.mark.parametrize('validator, value, code', [
+    (is_valid_date, '2024-02-30', 'invalid_date'),
+    (is_valid_date, '05/01/2024', 'invalid_date'),
+    (is_valid_date, '2024-01-05 25:00:00', 'invalid_date'),
+    (is_valid_date_future, '2000-01-01', 'not_future_date'),
+    (is_valid_date_future, 'soon', 'not_future_date'),
+    (is_valid_time, '10:xx', 'invalid_time'),
+])
+def test_date_validators_raise_codes(validator, value, code):
+    with pytest.raises(ValidationError) as exc_info:
+        validator(value)
+    assert exc_info.value.code == code
+
+
+def test_time_object_must_be_within_a_day():
+    assert is_valid_time('25:00:00') == '25:00:00'
+    with pytest.raises(ValidationError):
+        is_valid_time('25:00:00', as_object=True)
+
+
+def test_future_date_compares_against_now():
+    now = datetime.datetime(2024, 6, 1, 12, 0)
+    assert check_date('2024-06-01 12:00:00', future=True, now=now)
+    with pytest.raises(ValidationError):
+        check_date('2024-06-01', future=True, now=now)  # midnight, before noon
+
+
+def test_parser_remembers_the_last_format():
+    parser = DateParser(['%d.%m.%Y', '%Y-%m-%d', '%H:%M:%S'])
+    assert parser.parse('2024-01-05') == datetime.date(2024, 1, 5)
+    assert parser._last == 1
+    assert parser.parse('2024-01-06') == datetime.date(2024, 1, 6)
+    assert parser.parse('07.01.2024') == datetime.date(2024, 1, 7) and parser._last == 0
+    assert parser.parse('10:00:00') == datetime.time(10)
+    assert parser.parse('nope') is None
+
+
+def test_parser_rejects_unsupported_formats():
+    with pytest.raises(ValueError):
+        DateParser(['%b %d %Y'])
+    with pytest.raises(ValueError):
+        DateParser(['%Y-%m'])
+
+
+def test_validate_dates_parses_each_distinct_value_once(monkeypatch):
+    parsed = []
+    original = DateParser.parse
+    monkeypatch.setattr(DateParser, 'parse', lambda self, text: parsed.append(text) or original(self, text))
+    column = ['2024-01-05', ' 2024-01-05', 'bad', '2024-01-06'] * 100
+    results = list(validate_dates(column, 'date', as_object=True))
+    assert sorted(parsed) == ['2024-01-05', '2024-01-06', 'bad']
+    assert [r.index for r in results] == list(range(400))
+    assert results[1].value == datetime.date(2024, 1, 5) and results[1].input == ' 2024-01-05'
+    assert results[2].error.code == 'invalid_date'
+
+
+def test_validate_dates_times_and_unknown_type():
+    assert [r.value for r in validate_dates(['1:00', '10:00:00'], 'time')] == ['00:01:00', '10:00:00']
+    with pytest.raises(ValueError):
+        validate_dates(['x'], 'int')
@@ -0,0 +1,106 @@
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from askuser.emails import DomainCache, domain_cache, validate_email_address, validate_emails
+from askuser.exceptions import ValidationError
+from askuser.logic import is_valid_email
+
+
+class StubResolver:
+    """Deliverability resolver for a fixed set of domains, recording each lookup."""
+
+    def __init__(self, deliverable):
+        self.deliverable = set(deliverable)
+        self.calls = []
+        self.threads = set()
+        self._lock = threading.Lock()
+
+    def __call__(self, domain):
+        with self._lock:
+            self.calls.append(domain)
+            self.threads.add(threading.get_ident())
+        return None if domain in self.deliverable else f"The domain name {domain} does not exist."
+
+
+def test_syntax_only_path_needs_no_resolver():
+    with patch("askuser.emails.dns_resolver", side_effect=AssertionError("no DNS expected")):
+        assert validate_email_address("Ann@Example.com", check_deliverability=False) == "Ann@example.com"
+        assert is_valid_email("ann@example.com", check_deliverability=False) == "ann@example.com"
+    with pytest.raises(ValidationError) as exc_info:
+        validate_email_address("not-an-email", check_deliverability=False)
+    assert exc_info.value.code == "invalid_email"
+
+
+def test_deliverability_is_cached_per_domain():
+    resolver, cache = StubResolver(["good.org"]), DomainCache()
+    assert validate_email_address("a@good.org", resolver=resolver, cache=cache) == "a@good.org"
+    assert validate_email_address("b@good.org", resolver=resolver, cache=cache) == "b@good.org"
+    for _ in range(2):
+        with pytest.raises(ValidationError) as exc_info:
+            validate_email_address("c@bad.org", resolver=resolver, cache=cache)
+        assert exc_info.value.code == "undeliverable_email"
+    assert resolver.calls == ["good.org", "bad.org"]
+
+
+def test_cache_entries_expire():
+    resolver, cache = StubResolver(["good.org"]), DomainCache(ttl=60)
+    with patch("askuser.emails.time.monotonic", return_value=1000.0):
+        validate_email_address("a@good.org", resolver=resolver, cache=cache)
+        validate_email_address("a@good.org", resolver=resolver, cache=cache)
+    with patch("askuser.emails.time.monotonic", return_value=1061.0):
+        validate_email_address("a@good.org", resolver=resolver, cache=cache)
+    assert resolver.calls == ["good.org", "good.org"]
+
+
+def test_cache_drops_oldest_entry_beyond_maxsize():
+    cache = DomainCache(maxsize=2)
+    for domain in ("a.org", "b.org", "c.org"):
+        cache.set(domain, None)
+    assert len(cache) == 2 and cache.get("a.org", "missing") == "missing"
+
+
+def test_bulk_resolves_each_domain_once_concurrently_in_order():
+    domains = [f"d{i}.org" for i in range(20)]
+    resolver = StubResolver(domains[:10])
+    barrier = threading.Barrier(4, timeout=5)
+
+    def slow_resolver(domain):
+        if domain in domains[:4]:
+            barrier.wait()  # only passes if 4 lookups run at the same time
+        return resolver(domain)
+
+    addresses = [f"user{i}@{domains[i % 20]}" for i in range(1000)] + ["broken"]
+    results = list(validate_emails(addresses, resolver=slow_resolver, cache=DomainCache(), max_workers=8))
+
+    assert sorted(resolver.calls) == sorted(domains)
+    assert [r.index for r in results] == list(range(1001))
+    assert [r.input for r in results] == addresses
+    assert results[0].value == "user0@d0.org" and results[0].error is None
+    assert results[10].error.code == "undeliverable_email"
+    assert results[-1].error.code == "invalid_email"
+
+
+def test_bulk_uses_cached_answers():
+    resolver, cache = StubResolver(["good.org"]), DomainCache()
+    cache.set("bad.org", "The domain name bad.org does not exist.")
+    results = list(validate_emails(["a@good.org", "b@bad.org"], resolver=resolver, cache=cache))
+    assert resolver.calls == ["good.org"]
+    assert results[0].value == "a@good.org" and results[1].error.code == "undeliverable_email"
+
+
+@pytest.fixture
+def shared_cache():
+    domain_cache.clear()
+    yield domain_cache
+    domain_cache.clear()
+
+
+def test_clean_up_email_retries_with_cleaned_domain(shared_cache):
+    resolver = StubResolver(["gmail.com"])
+    with patch("askuser.emails.dns_resolver", resolver):
+        assert is_valid_email("ann@gmail.comFooter", clean_up_email=True) == "ann@gmail.com"
+        with pytest.raises(ValidationError) as exc_info:
+            is_valid_email("ann@nowhere.orgFooter")
+    assert exc_info.value.code == "undeliverable_email"
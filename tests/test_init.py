@@ -0,0 +1,62 @@
+import subprocess
+import sys
+
+import pytest
+
+import askuser
+
+# Cold `import askuser` budget in microseconds, as reported by `python -X importtime`.
+# The lazy package init costs ~1-5ms; eagerly importing the submodules costs well over 100ms.
+IMPORT_BUDGET_US = 30_000
+
+HEAVY_MODULES = ("prompt_toolkit", "tabulate", "pycountry", "email_validator", "datetimeops")
+
+
+def run_python(code, *flags):
+    return subprocess.run([sys.executable, *flags, "-c", code], capture_output=True, text=True, check=True)
+
+
+def cumulative_import_us(importtime_stderr, module):
+    """Return the cumulative time (us) of `module` from `-X importtime` output."""
+    for line in importtime_stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        parts = line.split("|")
+        if len(parts) == 3 and parts[2].strip() == module:
+            return int(parts[1])
+    raise AssertionError(f"{module} not found in importtime output")
+
+
+def test_all_exports_resolve():
+    for name in askuser.__all__:
+        assert getattr(askuser, name) is not None
+    assert set(askuser.__all__) <= set(dir(askuser))
+
+
+def test_submodules_are_attributes():
+    code = ("import sys, askuser; askuser.logic.compile_pattern; askuser.core.input_custom; "
+            "print('prompt_toolkit' in sys.modules, 'core' in dir(askuser))")
+    assert run_python(code).stdout.split() == ["False", "True"]
+    code = "import sys, askuser; askuser.autocomplete; print('prompt_toolkit' in sys.modules)"
+    assert run_python(code).stdout.strip() == "True"
+
+
+def test_unknown_attribute_raises():
+    with pytest.raises(AttributeError):
+        askuser.does_not_exist
+
+
+def test_import_does_not_load_submodules():
+    out = run_python("import sys, askuser; print(sorted(m for m in sys.modules if m.startswith('askuser')))")
+    assert out.stdout.strip() == "['askuser']"
+
+
+def test_yes_does_not_load_heavy_dependencies():
+    code = f"import sys; from askuser import yes; print([m for m in {HEAVY_MODULES!r} if m in sys.modules])"
+    assert run_python(code).stdout.strip() == "[]"
+
+
+def test_cold_import_time_budget():
+    # best of 3 to smooth out a noisy CI box
+    timings = [cumulative_import_us(run_python("import askuser", "-X", "importtime").stderr, "askuser")
+               for _ in range(3)]
+    assert min(timings) < IMPORT_BUDGET_US, f"import askuser took {min(timings)}us (budget {IMPORT_BUDGET_US}us)"
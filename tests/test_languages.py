@@ -0,0 +1,40 @@
+import subprocess
+import sys
+
+import pytest
+
+from askuser.languages import Language, build_language_table, language_index, lookup_language
+
+
+def test_lookup_by_code_name_and_alias():
+    english = Language('en', 'eng', 'English')
+    assert lookup_language('en') == english
+    assert lookup_language('EN') == english
+    assert lookup_language('eng') == english
+    assert lookup_language(' english ') == english
+    assert lookup_language('ger').alpha_2 == 'de'       # ISO 639-2/B bibliographic code
+    assert lookup_language('Bangla').alpha_2 == 'bn'    # common name
+    assert lookup_language('Greek, Modern (1453-)').alpha_2 == 'el'  # inverted name
+
+
+def test_lookup_unknown_is_none():
+    assert lookup_language('xx') is None
+    assert lookup_language('Klingon') is None
+
+
+def test_index_is_built_once():
+    assert language_index() is language_index()
+
+
+def test_lookup_does_not_import_pycountry():
+    code = "import sys; from askuser.logic import is_valid_language; is_valid_language('en, German');" \
+           "print('pycountry' in sys.modules)"
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert out.stdout.strip().endswith("False")
+
+
+def test_packed_table_matches_pycountry():
+    pytest.importorskip("pycountry")
+    import pkgutil
+    shipped = pkgutil.get_data("askuser", "data/iso639_1.tsv").decode("utf-8").splitlines()[1:]
+    assert build_language_table().splitlines()[1:] == shipped
@@ -1,14 +1,21 @@
+import pickle
+import re
 from decimal import Decimal
 
 import pytest
 
+from askuser.exceptions import ValidationError
 from askuser.logic import (
+    quiet,
+    compile_pattern, RegexValidator, CharsValidator,
     is_valid_int, is_valid_float, is_valid_alpha, is_valid_alphanum,
     is_valid_regex, is_valid_char, is_valid_custom, is_not_in,
     is_yes_no, none_if_blank, is_not_blank,
     optional,
     is_valid_slug,
     is_valid_decimal,
+    get_language_ISO_639_1,
+    is_valid_language,
 )
 
 
@@ -75,6 +82,28 @@ def test_is_valid_char():
         is_valid_char('1234', '123')
 
 
+def test_compile_pattern_cache_stats():
+    compile_pattern.cache_clear()
+    for _ in range(3):
+        assert is_valid_regex('AB', r'^[A-Z]{2}$') == 'AB'
+        assert is_valid_char('abc', 'a-c') == 'abc'
+    info = compile_pattern.cache_info()
+    assert (info.misses, info.hits) == (2, 4)
+
+
+def test_reusable_pattern_validators():
+    is_code = RegexValidator(re.compile(r'^[A-Z]{3}$'))
+    assert is_code('USD') == 'USD'
+    with pytest.raises(ValueError, match=r'Allowed regex: \^\[A-Z\]\{3\}\$'):
+        is_code('usd')
+
+    digits = CharsValidator('[0-9]')
+    assert digits.char_class == '[0-9]'
+    assert digits('2024') == '2024'
+    with pytest.raises(ValueError):
+        digits('20x4')
+
+
 def test_is_valid_custom():
     assert is_valid_custom('yes', ['yes', 'no']) == 'yes'
     with pytest.raises(ValueError):
@@ -112,3 +141,60 @@ def test_is_not_blank():
 def test_is_valid_slug():
     assert is_valid_slug('Hello-World!!') == 'hello-world'
     assert is_valid_slug('--Test__Slug--') == 'testslug'
+
+
+def test_get_language_ISO_639_1():
+    assert get_language_ISO_639_1('en') == 'en'
+    assert get_language_ISO_639_1('French') == 'fr'
+    with pytest.raises(ValueError):
+        get_language_ISO_639_1('Elvish')
+
+
+def test_is_valid_language():
+    assert is_valid_language('en, German') == 'en,German'
+    with pytest.raises(ValueError):
+        is_valid_language('en, Elvish')
+
+
+@pytest.mark.parametrize("func, args, code", [
+    (is_valid_int, ('a',), 'not_int'),
+    (is_valid_int, ('50', None, 10), 'too_large'),
+    (is_valid_float, ('0.5', None, None, 1.0), 'too_small'),
+    (is_valid_decimal, ('3', [Decimal('1')]), 'not_expected'),
+    (is_valid_custom, ('maybe', ['yes', 'no']), 'not_expected'),
+    (is_not_in, ('Old', ['old']), 'already_exists'),
+    (is_not_blank, ('',), 'blank'),
+    (is_valid_regex, ('Abc', r'^[A-Z]+$'), 'regex_mismatch'),
+    (is_valid_char, ('1234', '123'), 'invalid_chars'),
+    (is_valid_language, ('Elvish, en',), 'unknown_language'),
+])
+def test_validators_raise_silent_validation_error(capsys, func, args, code):
+    with pytest.raises(ValidationError) as exc_info:
+        func(*args)
+    assert exc_info.value.code == code
+    assert capsys.readouterr() == ('', '')
+
+
+def test_validation_error_message_is_lazy_and_picklable():
+    class Expensive(list):
+        formatted = 0
+
+        def __repr__(self):
+            Expensive.formatted += 1
+            return 'expensive'
+
+    with pytest.raises(ValidationError) as exc_info:
+        is_valid_custom('x', Expensive(['a']))
+    assert Expensive.formatted == 0
+    assert str(exc_info.value) == 'Error: expected expensive'
+
+    err = pickle.loads(pickle.dumps(ValidationError('not_int', 'Error: {value} is bad', value='x')))
+    assert (err.code, err.message) == ('not_int', 'Error: x is bad')
+
+
+def test_quiet_suppresses_notices(capsys):
+    assert is_valid_slug('Hello World') == 'helloworld'
+    assert 'Slug: helloworld' in capsys.readouterr().out
+    with quiet():
+        assert is_valid_slug('Hello World') == 'helloworld'
+    assert capsys.readouterr().out == ''
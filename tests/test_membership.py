@@ -0,0 +1,70 @@
+import pytest
+
+from askuser.exceptions import ValidationError
+from askuser.logic import is_not_in, is_valid_custom
+from askuser.membership import BloomFilter, CasefoldSet, ChoiceSet, as_casefold_set, as_choice_set
+
+
+def test_choice_set_is_ordered_and_reads_like_a_list():
+    choices = ChoiceSet(['usd', 'eur', 'usd'])
+    assert 'eur' in choices and 'EUR' not in choices and ['x'] not in choices
+    assert list(choices) == ['usd', 'eur'] and len(choices) == 2
+    with pytest.raises(ValidationError) as exc_info:
+        is_valid_custom('gbp', choices)
+    assert str(exc_info.value) == "Error: expected ['usd', 'eur']"
+
+
+def test_casefold_set_ignores_case():
+    taken = CasefoldSet(['Hello-World', 'STRASSE'])
+    assert 'hello-world' in taken and 'Straße' in taken and 'new' not in taken
+    assert is_not_in('new', taken) == 'new'
+    with pytest.raises(ValidationError) as exc_info:
+        is_not_in('HELLO-world', taken)
+    assert str(exc_info.value) == "Error: Value already exists in ['hello-world', 'strasse']"
+
+
+def test_is_not_in_does_not_list_long_collections():
+    taken = CasefoldSet(f'slug-{i}' for i in range(100_000))
+    with pytest.raises(ValidationError) as exc_info:
+        is_not_in('SLUG-7', taken)
+    assert str(exc_info.value) == 'Error: Value already exists.' and exc_info.value.params['not_in'] is taken
+
+
+def test_as_casefold_set_converts_frozensets_once():
+    values = frozenset(['A', 'B'])
+    assert as_casefold_set(values) is as_casefold_set(values)
+    taken = CasefoldSet(['a'])
+    assert as_casefold_set(taken) is taken
+    assert 'b' in as_casefold_set(['A', 'B'])
+
+
+def test_as_choice_set_keeps_unhashable_values():
+    assert isinstance(as_choice_set(['a', 'b']), ChoiceSet)
+    unhashable = [['a'], ['b']]
+    assert as_choice_set(unhashable) is unhashable
+    keys = {'a': 1}
+    assert as_choice_set(keys) is keys
+
+
+def test_bloom_filter_has_no_false_negatives():
+    values = [f"sku-{i}" for i in range(20_000)]
+    bloom = BloomFilter(iter(values), capacity=len(values), error_rate=0.01)
+    assert len(bloom) == 20_000
+    assert all(v.upper() in bloom for v in values)
+    false_positives = sum(f"new-{i}" in bloom for i in range(20_000))
+    assert false_positives < 20_000 * 0.03
+    assert len(bloom._bits) < 20_000 * 2  # ~1.2 bytes per value at 1%
+
+
+def test_is_not_in_with_bloom_filter():
+    bloom = BloomFilter(['Existing'])
+    assert is_not_in('fresh', bloom) == 'fresh'
+    with pytest.raises(ValidationError) as exc_info:
+        is_not_in('existing', bloom)
+    assert exc_info.value.code == 'already_exists'
+    assert str(exc_info.value) == 'Error: Value already exists.'
+
+
+def test_bloom_filter_rejects_bad_error_rate():
+    with pytest.raises(ValueError):
+        BloomFilter(['a'], error_rate=0)
@@ -0,0 +1,208 @@
+from askuser.core import pretty_menu, validate_user_option_enumerated, validate_user_option_ranges
+import io
+
+import pytest
+
+from askuser.exceptions import ValidationError
+from askuser.menu import Menu, MenuRenderer, menu_options, set_menu_renderer
+
+
+def setup_input(monkeypatch, inputs):
+    gen = iter(inputs)
+    monkeypatch.setattr('askuser.core.input_custom', lambda prompt: next(gen))
+
+
+def test_menu_resolves_keys_and_values():
+    menu = Menu({1: 'One', 'b': 'Bee', 'q': 'quit'})
+    assert len(menu) == 3 and '1' in menu and 1 not in menu and 'x' not in menu
+    assert menu.key('1') == 1 and menu.value('b') == 'Bee'
+
+
+def test_menu_reused_across_prompts(monkeypatch, capsys):
+    setup_input(monkeypatch, ['a', 'x', 'l', 'q'])
+    menu = Menu({'a': 'Add', 'l': 'List', 'q': 'quit'})
+    assert menu.choose('Option:') == 'a'
+    rows = menu.layout()
+    assert menu.choose_value('Option:') == 'List'
+    assert menu.layout() is rows
+    assert menu.choose('Option:') == 'q'
+    out = capsys.readouterr().out
+    assert out.count('a: Add') == 3 and "expected ['a', 'l', 'q']" in out
+
+
+def test_long_menu_layout_is_aligned():
+    menu = Menu(menu_options([f'option {i}' for i in range(12)], {'xq': 'quit'}))
+    rows = menu.layout()
+    assert [len(row) for row in rows] == [6, 6, 1]   # 120 // (2 + len(': ') + 9 + 5)
+    widths = {len(key) + len(desc) for row in rows for key, desc in row}
+    assert len(widths) == 1
+
+
+def test_pretty_menu_three_per_row(monkeypatch, capsys):
+    setup_input(monkeypatch, [])
+    pretty_menu('a', 'b', 'c', 'd', 'e', 'f', 'g')
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[0] == '' and len(lines) == 4
+    assert lines[1] == '0: a   1: b   2: c   '
+
+
+def test_enumerated_returns_id_and_value(monkeypatch):
+    setup_input(monkeypatch, ['2', 'q'])
+    movies = {101: 'Inception', 202: 'Memento'}
+    assert validate_user_option_enumerated(movies, start=1) == (202, 'Memento')
+    assert validate_user_option_enumerated(movies, start=1) == ('q', None)
+
+
+class CountingStream(io.StringIO):
+    def __init__(self, tty=False):
+        super().__init__()
+        self.tty = tty
+        self.writes = 0
+
+    def isatty(self):
+        return self.tty
+
+    def write(self, text):
+        self.writes += 1
+        return super().write(text)
+
+
+def test_renderer_writes_frame_once_without_color_off_tty(monkeypatch):
+    monkeypatch.delenv('NO_COLOR', raising=False)
+    menu = Menu({str(i): f'option {i}' for i in range(500)})
+    stream = CountingStream()
+    menu.show(MenuRenderer(stream, width=80))
+    assert stream.writes == 1 and '\033' not in stream.getvalue()
+    assert max(len(line) for line in stream.getvalue().splitlines()) <= 80
+
+    tty = CountingStream(tty=True)
+    menu.show(MenuRenderer(tty, width=80))
+    assert tty.getvalue().count('\033[34m') == 500
+
+    monkeypatch.setenv('NO_COLOR', '1')
+    assert '\033' not in MenuRenderer(width=80).render(menu, CountingStream(tty=True))
+
+
+def test_renderer_width_follows_terminal(monkeypatch):
+    menu = Menu({str(i): 'x' * 10 for i in range(20)})
+    monkeypatch.setenv('COLUMNS', '40')
+    assert len(MenuRenderer().render(menu).splitlines()[1]) <= 40
+    assert len(menu.layout(200)[0]) == 10  # 200 // (2 + len(': ') + 10 + 5)
+
+
+def test_set_menu_renderer(monkeypatch):
+    stream = CountingStream()
+    previous = set_menu_renderer(MenuRenderer(stream))
+    try:
+        setup_input(monkeypatch, ['1'])
+        from askuser.core import validate_user_option
+        assert validate_user_option('Pick:', 'A', 'B') == '1'
+    finally:
+        set_menu_renderer(previous)
+    assert stream.writes == 1 and '1: B' in stream.getvalue()
+
+
+def test_menu_errors_go_to_the_renderer_stream(monkeypatch, capsys):
+    stream = io.StringIO()
+    previous = set_menu_renderer(MenuRenderer(stream, color=False))
+    try:
+        setup_input(monkeypatch, ['9', '1', 'x', '2', 'zz', '2', ''])
+        from askuser.core import validate_user_option
+        assert validate_user_option('Pick:', 'A', 'B') == '1'
+        assert validate_user_option('Pick:', *[f'option {i}' for i in range(300)]) == '2'
+        assert validate_user_option_ranges('Pick:', 'A', 'B', 'C') == ['2']
+    finally:
+        set_menu_renderer(previous)
+    assert stream.getvalue().count('\u274C  ') == 3
+    assert '\u274C' not in capsys.readouterr().out
+
+
+def test_set_menu_renderer_requires_a_menu_renderer():
+    class WriteOnly:
+        def write(self, menu):
+            pass
+
+    with pytest.raises(TypeError):
+        set_menu_renderer(WriteOnly())
+
+
+def test_parse_selection_ranges_and_exclusions():
+    menu = Menu(menu_options([f'file {i}' for i in range(1000)], {'all': 'everything'}))
+    bits = menu.parse_selection('1,3,5-40,!7')
+    assert [i for i in range(1001) if bits >> i & 1] == [1, 3] + [i for i in range(5, 41) if i != 7]
+    bits = menu.parse_selection('!5-9, all', bits)
+    assert bits >> 1000 & 1 and not bits >> 5 & 1 and bits >> 10 & 1
+    for bad in ('x', '2000-3000', '1-'):
+        with pytest.raises(ValidationError) as exc_info:
+            menu.parse_selection(bad)
+        assert exc_info.value.code == 'invalid_selection'
+
+
+def test_validate_user_option_ranges(monkeypatch, capsys):
+    setup_input(monkeypatch, ['0-3,!1', 'nope', 'b', ''])
+    assert validate_user_option_ranges('Pick:', 'A', 'B', 'C', 'D', 'E', b='Bee') == ['0', '2', '3', 'b']
+    assert "'nope' is not an option" in capsys.readouterr().out
+
+
+def test_select_redraws_only_changed_rows(monkeypatch):
+    monkeypatch.setenv('LINES', '100')
+    setup_input(monkeypatch, ['12', '13', ''])
+    stream = CountingStream(tty=True)
+    menu = Menu({str(i): f'option {i}' for i in range(40)})
+    assert menu.select('Pick:', MenuRenderer(stream, color=False, width=80)) == ['12', '13']
+    out = stream.getvalue()
+    first_frame, *updates = out.split('\033[F', 1)
+    assert first_frame.count('[ ]') == 40 and stream.writes == 3
+    # options 12-14 share a row (10 rows above the prompt): each answer rewrites only that row
+    assert updates[0].count('\033[10F\033[2K') == 2 and updates[0].count('\033[2K') == 4
+    assert ' 0: option 0' not in updates[0]
+
+
+def test_large_menu_pages_filters_and_resolves_prefixes(monkeypatch, capsys):
+    monkeypatch.setenv('LINES', '30')
+    options = {f'tenant-{i:04d}': f'Tenant {i}' for i in range(3000)}
+    options['acme'] = 'Acme Corp'
+    menu = Menu(options)
+    setup_input(monkeypatch, ['>', 'nope', '/corp', '/', 'tenant-29', 'g 2', 'ac'])
+    assert menu.choose('Tenant:') == 'acme'
+    out = capsys.readouterr().out
+    assert "Page 2/" in out and "(1 options matching 'corp')" in out
+    assert "(100 options starting with 'tenant-29')" in out
+    error = next(line for line in out.splitlines() if 'Error:' in line)
+    assert 'Error: expected one of 3001 values, e.g. [' in error and 'tenant-0010' not in error
+    assert len(out) < 50_000   # nowhere near the whole menu per prompt
+
+
+def test_not_expected_error_is_summarized_for_long_lists():
+    from askuser.logic import is_valid_custom
+    with pytest.raises(ValidationError) as exc_info:
+        is_valid_custom('x', [str(i) for i in range(1000)])
+    assert str(exc_info.value) == ("Error: expected one of 1000 values, "
+                                   "e.g. ['0', '1', '2', '3', '4', '5', '6', '7', '8', '9']")
+    assert len(exc_info.value.params['expected_inputs']) == 1000
+
+
+def test_large_menu_formats_only_the_labels_shown(monkeypatch):
+    monkeypatch.setenv('LINES', '30')
+    formatted = []
+
+    class Label:
+        def __init__(self, i):
+            self.i = i
+
+        def __str__(self):
+            formatted.append(self.i)
+            return f'Label {self.i}'
+
+    menu = Menu({f'k{i}': Label(i) for i in range(5000)})
+    setup_input(monkeypatch, ['>', 'k4999'])
+    assert menu.choose('Pick:') == 'k4999'
+    assert 0 < len(formatted) < 1000 and len(set(formatted)) == len(formatted)
+
+
+def test_large_menu_keys_win_over_commands_and_prefixes(monkeypatch):
+    options = {str(i): f'Option {i}' for i in range(300)}
+    options.update({'g1': 'Group 1', '>': 'Forward'})
+    menu = Menu(options)
+    setup_input(monkeypatch, [' 5', 'g1', ' > '])
+    assert [menu.choose('Pick:') for _ in range(3)] == ['5', 'g1', '>']
@@ -0,0 +1,75 @@
+import time
+
+import pytest
+
+import askuser.core as core
+from askuser import MaxAttemptsExceeded, validate_input
+from askuser.metrics import MetricsAggregator, collect_metrics, get_metrics_collector
+
+
+def setup_input(monkeypatch, answers, delay=0.0):
+    answers = iter(answers)
+
+    def fake_input(prompt):
+        time.sleep(delay)
+        answer = next(answers)
+        if isinstance(answer, BaseException):
+            raise answer
+        return answer
+
+    monkeypatch.setattr(core, 'input_custom', fake_input)
+
+
+def test_no_timing_without_a_collector(monkeypatch):
+    setup_input(monkeypatch, ['5'])
+    monkeypatch.setattr(core, 'PromptTimer', lambda *args: pytest.fail('timer created without a collector'))
+    assert get_metrics_collector() is None
+    assert validate_input('Number:', 'int') == 5
+
+
+def test_collector_gets_timings_and_retries(monkeypatch):
+    events = []
+    setup_input(monkeypatch, ['x', '50', '5'], delay=0.01)
+    with collect_metrics(events.append):
+        assert validate_input('Age:', 'int', maximum=10) == 5
+    assert get_metrics_collector() is None
+
+    (m,) = events
+    assert (m.prompt, m.validation_type, m.validator) == ('Age:', 'int', 'is_valid_int')
+    assert (m.entries, m.invalid, m.outcome) == (3, 2, 'valid')
+    assert m.wait_ms >= 30
+    assert m.render_ms >= 0 and m.validate_ms >= 0
+    assert m.total_ms == pytest.approx(m.render_ms + m.wait_ms + m.validate_ms)
+
+
+def test_outcomes(monkeypatch):
+    events = []
+    setup_input(monkeypatch, ['', 'x', 'y', KeyboardInterrupt()])
+    with collect_metrics(events.append):
+        assert validate_input('N:', 'int', default=3) == 3
+        with pytest.raises(MaxAttemptsExceeded):
+            validate_input('N:', 'int', max_attempts=2)
+        with pytest.raises(KeyboardInterrupt):
+            validate_input('N:', 'int')
+    assert [(m.outcome, m.entries, m.invalid) for m in events] == [
+        ('default', 1, 0), ('max_attempts', 2, 2), ('error', 0, 0)]
+
+
+def test_aggregator_summary(monkeypatch):
+    setup_input(monkeypatch, ['a', '1', '2', 'My Slug'])
+    with collect_metrics() as stats:
+        validate_input('Count:', 'int')
+        validate_input('Count:', 'int')
+        validate_input('Slug:', 'slug')
+    assert isinstance(stats, MetricsAggregator) and len(stats) == 2
+
+    rows = {row['prompt']: row for row in stats.summary()}
+    count = rows['Count:']
+    assert (count['calls'], count['entries'], count['retry_rate'], count['invalid_per_call']) == (2, 3, 0.5, 0.5)
+    assert count['outcomes'] == 'valid: 2'
+    assert rows['Slug:']['validator'] == 'is_valid_slug'
+
+    table = stats.table(sort_by='calls')
+    assert table.splitlines()[2].split()[0] == 'Count:'
+    stats.reset()
+    assert len(stats) == 0
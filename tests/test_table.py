@@ -0,0 +1,77 @@
+import sqlite3
+
+from askuser.table import ColumnTable, LazyRowTable, RowTable, TupleTable, page_count, row_table
+
+
+def test_row_table_find_and_search():
+    table = RowTable([{'id': 1, 'name': 'Alpha'}, {'id': 2, 'name': 'beta'}, {'id': 3, 'name': 'ALPHABET'}])
+    assert len(table) == 3
+    assert table.find('2') == 1 and table.find('9') is None
+    assert table.search('alpha') == [0, 2]
+    assert 'beta' in table.render([1]) and 'Alpha' not in table.render([1])
+
+
+def test_page_count():
+    assert page_count(0, 50) == 1
+    assert page_count(50, 50) == 1
+    assert page_count(51, 50) == 2
+
+
+class CountingCursor:
+    """DB-API cursor stand-in that counts fetchmany calls."""
+
+    def __init__(self, cursor):
+        self.cursor = cursor
+        self.description = cursor.description
+        self.fetches = 0
+
+    def fetchmany(self, size):
+        self.fetches += 1
+        return self.cursor.fetchmany(size)
+
+
+def sqlite_cursor(rows, **connect_kwargs):
+    conn = sqlite3.connect(':memory:', **connect_kwargs)
+    conn.execute('CREATE TABLE t (id INTEGER PRIMARY KEY, name TEXT)')
+    conn.executemany('INSERT INTO t VALUES (?, ?)', ((i, f'name-{i}') for i in range(1, rows + 1)))
+    return conn.execute('SELECT id, name FROM t ORDER BY id')
+
+
+def test_lazy_row_table_reads_cursor_in_batches():
+    cursor = CountingCursor(sqlite_cursor(10_000))
+    table = row_table(cursor, batch_size=100)
+    assert isinstance(table, LazyRowTable)
+    assert table.ensure(101) == 101 and len(table) == 200 and cursor.fetches == 2
+    assert table.row(0) == {'id': 1, 'name': 'name-1'}
+    assert table.rows[0] == (1, 'name-1')       # stored as tuples
+    assert table.find('150') == 149 and cursor.fetches == 2
+    assert table.find('950') == 949 and cursor.fetches == 10
+    assert not table.exhausted
+    assert table.find('nope') is None and table.exhausted and len(table) == 10_000
+
+
+def test_lazy_row_table_iterator_of_dicts_and_search():
+    table = LazyRowTable(({'id': i, 'name': 'even' if i % 2 == 0 else 'odd'} for i in range(10)), batch_size=3)
+    assert table.search('EVEN') == [0, 2, 4, 6, 8]
+    assert table.exhausted and table.columns == ['id', 'name']
+
+
+def test_lazy_row_table_prefetches_next_batch():
+    cursor = CountingCursor(sqlite_cursor(1000, check_same_thread=False))
+    table = LazyRowTable(cursor, batch_size=100, prefetch=True)
+    table.ensure(1)
+    table._pending.result()
+    assert cursor.fetches == 2 and len(table) == 100   # the second batch is ready, not yet stored
+    assert table.ensure(150) == 150
+    table.close()
+    assert table._executor is None
+
+
+def test_tuple_and_column_tables_build_row_dicts_on_demand():
+    tuples = TupleTable(['id', 'name'], [(1, 'a'), (2, 'B')])
+    columns = ColumnTable({'id': [1, 2], 'name': ['a', 'B']})
+    for table in (tuples, columns, row_table([(1, 'a'), (2, 'B')], columns=['id', 'name'])):
+        assert len(table) == 2 and table.columns == ['id', 'name']
+        assert table.find('2') == 1 and table.row(1) == {'id': 2, 'name': 'B'}
+        assert table.search('b') == [1]
+        assert 'B' in table.render([1]) and 'a' not in table.render([1]).split()
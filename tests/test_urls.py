@@ -0,0 +1,61 @@
+import pytest
+
+import askuser.core as core
+from askuser.exceptions import ValidationError
+from askuser.logic import is_url
+from askuser.urls import normalize_url, normalize_urls
+
+
+@pytest.mark.parametrize('url, expected', [
+    ('www.example.com', 'www.example.com'),
+    ('example.com', 'example.com'),
+    ('HTTPS://WWW.Example.com', 'https://www.example.com'),
+    ('api.eu.example.co.uk/v1/a.json?x=1', 'api.eu.example.co.uk/v1/a.json?x=1'),
+    ('http://localhost.test:8080#Top', 'http://localhost.test:8080#Top'),
+    ('shop.xn--p1ai', 'shop.xn--p1ai'),
+])
+def test_is_url_normalizes(url, expected):
+    assert is_url(url) == expected
+
+
+@pytest.mark.parametrize('url', ['example', 'exa mple.com', 'example.com:99999', 'ftp://example.com',
+                                 '-bad.example.com', 'example.c0m'])
+def test_is_url_rejects(url):
+    with pytest.raises(ValidationError) as exc_info:
+        is_url(url)
+    assert exc_info.value.code == 'invalid_url'
+
+
+def test_is_url_subdomain_check():
+    assert is_url('www.example.com', ignore_subdomain_check=False) == 'www.example.com'
+    with pytest.raises(ValidationError):
+        is_url('example.com', ignore_subdomain_check=False)
+
+
+def test_is_url_prompts_for_a_required_protocol(monkeypatch, capsys):
+    answers = iter(['x', '1'])
+    monkeypatch.setattr(core, 'input_custom', lambda prompt: next(answers))
+    assert is_url('example.com/a', http_protocol_required=True) == 'http://example.com/a'
+    assert "Expected ['0', '1']" in capsys.readouterr().out
+    assert is_url('https://example.com', http_protocol_required=True) == 'https://example.com'
+
+
+@pytest.mark.parametrize('protocol, expected', [
+    ('keep', ['example.com', 'http://example.com']),
+    ('strip', ['example.com', 'example.com']),
+    ('https', ['https://example.com', 'http://example.com']),
+])
+def test_normalize_url_protocol_policies(protocol, expected):
+    assert [normalize_url(url, protocol) for url in ['example.com', 'http://example.com']] == expected
+
+
+def test_normalize_urls_streams_without_prompting(monkeypatch):
+    monkeypatch.setattr(core, 'input_custom', lambda prompt: pytest.fail('normalize_urls must not prompt'))
+    lines = iter(['Example.com\n', 'https://a.b.example.org:443/x\n', 'not a url\n'])
+    results = list(normalize_urls(lines, protocol='require'))
+    assert [r.index for r in results] == [0, 1, 2]
+    assert results[0].error.code == 'missing_protocol'
+    assert results[1].value == 'https://a.b.example.org:443/x'
+    assert results[2].error.code == 'invalid_url' and results[2].input == 'not a url\n'
+    with pytest.raises(ValueError):
+        normalize_urls([], protocol='ftp')